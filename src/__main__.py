@@ -1,4 +1,6 @@
+import json
 import sys
+from src.utils.startup_timer import StartupTimer, FIRST_PAINT, INTERACTIVE, MAIN_UI_FIRST_PAINT, MAIN_UI_INTERACTIVE
 from PyQt6.QtCore import QSize, Qt, QTimer
 from PyQt6.QtGui import QAction, QIcon, QFont
 from PyQt6.QtWidgets import (
@@ -17,19 +19,49 @@ from PyQt6.QtWidgets import (
 )
 
 from src.utils.resource import resource_path
-from src.core.dashboard.pipeline_dashboard import PipelineDashboard
-from src.core.status_page.pipeline_status import PipelineStatus
-from src.core.settings_page.settings import SettingsPage
-from src.core.sample.sample_page import Sample
-from src.core.profile_page.profile import ProfilePage
+from src.utils.remote.scheduler import RemoteJobScheduler
+from src.utils.remote.session_manager import SSHSessionManager
+from src.utils.subcommands.runner import CommandRunner
 from src.core.profile_page.startup_page import AccessModePage
 from src.core.initiate import InitiateApp
 from src.core.plugin_manager.plugin_page import PluginsPage
 from src.core.plugin_manager.manager import PluginManager
-from src.core.plugin_manager.plugin_installer import PluginStore
-from src.core.about_page.about import AboutPage
 from src.assets.stylesheet import global_style_sheet
 
+# Page modules are imported by their factories below, the first time a page
+# is shown: between them they pull in requests, cryptography, QtSvgWidgets and
+# the plugin store, none of which the access page needs.
+
+
+def _pipeline_dashboard():
+    from src.core.dashboard.pipeline_dashboard import PipelineDashboard
+    return PipelineDashboard()
+
+
+def _sample_prep():
+    from src.core.sample.sample_page import Sample
+    return Sample()
+
+
+def _pipeline_status():
+    from src.core.status_page.pipeline_status import PipelineStatus
+    return PipelineStatus()
+
+
+def _settings():
+    from src.core.settings_page.settings import SettingsPage
+    return SettingsPage()
+
+
+def _plugin_store(main_window):
+    from src.core.plugin_manager.plugin_installer import PluginStore
+    return PluginStore(main_window)
+
+
+def _about():
+    from src.core.about_page.about import AboutPage
+    return AboutPage()
+
 
 class MainWindow(QMainWindow):
     def __init__(self, initiate : InitiateApp):
@@ -94,6 +126,7 @@ class MainWindow(QMainWindow):
         """Display the login/signup page for private access mode."""
         self.cleanup_main_ui()
 
+        from src.core.profile_page.profile import ProfilePage
         self.profile = ProfilePage()
         self.profile.go_back.connect(self.show_access_page)
         self.profile.login_success.connect(self.load_main_app)
@@ -203,39 +236,58 @@ class MainWindow(QMainWindow):
         
         self.setStatusBar(QStatusBar(self))
 
-        
-        self.pipeline_dashboard = PipelineDashboard()
-        self.sample_prep_page = Sample()
-        self.pipeline_status = PipelineStatus()
-        self.settings_page = SettingsPage()
-        self.about_page = AboutPage()
+        # Pages are built the first time they are shown, by sidebar label
+        self._page_factories = {
+            "Pipeline Dashboard": ("pipeline_dashboard", _pipeline_dashboard),
+            "Sample Prep": ("sample_prep_page", _sample_prep),
+            "Pipeline Status": ("pipeline_status", _pipeline_status),
+            "Settings": ("settings_page", _settings),
+            "Plugin Store": ("plugin_store", lambda: _plugin_store(self)),
+            "About": ("about_page", _about),
+        }
+        for attr, _factory in self._page_factories.values():
+            setattr(self, attr, None)
 
         self.plugin_manager = PluginManager()
-
         self.plugins_page = PluginsPage(self.plugin_manager)
-        self.plugin_store = PluginStore(self)
-
-        self.pipeline_status.run_status.running_jobs_count_changed.connect(self.update_pipeline_status_badge)
-
-        # Initialize the badge
-        self.update_pipeline_status_badge(self.pipeline_status.run_status.get_running_jobs_count())
 
         self.stack = QStackedWidget()
-        self.stack.addWidget(self.pipeline_dashboard.widget)
-        self.stack.addWidget(self.sample_prep_page.widget)
-        self.stack.addWidget(self.pipeline_status.widget)
         self.stack.addWidget(self.plugins_page)     # plugin page in stack
-        self.stack.addWidget(self.settings_page.widget)
-        self.stack.addWidget(self.plugin_store.widget)
-        self.stack.addWidget(self.about_page.widget)
-
         self.setCentralWidget(self.stack)
 
+        # Only the page that is visible first is built before the window paints
+        self.show_page("Pipeline Dashboard")
+        StartupTimer.get_timer().mark_on_paint(self.stack, MAIN_UI_FIRST_PAINT)
+        QTimer.singleShot(0, self._finish_loading)
+
+    def _finish_loading(self):
+        """Second startup stage, run once the main UI has been shown."""
+        # The status page feeds the sidebar badge, so it is not left until first shown
+        self.page("Pipeline Status")
         self.plugin_manager.load_all(self)
+        StartupTimer.get_timer().mark_when_idle(MAIN_UI_INTERACTIVE)
         
         # Hide loading dialog after main app finishes loading
         QTimer.singleShot(500, self._hide_loading_spinner)
 
+    def page(self, name: str):
+        """Return the page behind a sidebar label, building it on first use."""
+        attr, factory = self._page_factories[name]
+        page = getattr(self, attr)
+        if page is None:
+            page = factory()
+            setattr(self, attr, page)
+            self.stack.addWidget(page.widget)
+            if name == "Pipeline Status":
+                page.run_status.running_jobs_count_changed.connect(self.update_pipeline_status_badge)
+                # Initialize the badge
+                self.update_pipeline_status_badge(page.run_status.get_running_jobs_count())
+        return page
+
+    def show_page(self, name: str):
+        """Switch the stack to the page behind a sidebar label."""
+        self.stack.setCurrentWidget(self.page(name).widget)
+
     def _hide_loading_spinner(self):
         """Hide the loading spinner after main app has loaded."""
         try:
@@ -256,6 +308,9 @@ class MainWindow(QMainWindow):
         """
         if self.plugin_manager:
             self.plugin_manager.unload_all()
+        RemoteJobScheduler.shutdown_scheduler()
+        SSHSessionManager.get_manager().close_all()
+        CommandRunner.get_runner().cancel_all()
         super().closeEvent(e)
 
     def add_plugin_sidebar_item(self, name: str):
@@ -303,18 +358,10 @@ class MainWindow(QMainWindow):
 
         if not role:
             page = item.text()
-            if page == "Pipeline Dashboard":
-                self.stack.setCurrentWidget(self.pipeline_dashboard.widget)
-            elif page == "Sample Prep":
-                self.stack.setCurrentWidget(self.sample_prep_page.widget)
-            elif page.startswith("Pipeline Status"):
-                self.stack.setCurrentWidget(self.pipeline_status.widget)
-            elif page == "Settings":
-                self.stack.setCurrentWidget(self.settings_page.widget)
-            elif page == "Plugin Store":
-                self.stack.setCurrentWidget(self.plugin_store.widget)
-            elif page == "About":
-                self.stack.setCurrentWidget(self.about_page.widget)
+            if page.startswith("Pipeline Status"):
+                page = "Pipeline Status"
+            if page in self._page_factories:
+                self.show_page(page)
 
         else:
             role_type, plugin_name = role
@@ -324,14 +371,28 @@ class MainWindow(QMainWindow):
 
 
 def main():
+    timer = StartupTimer.get_timer()
+    # Startup benchmark: open public mode, print the milestones as JSON and exit
+    benchmark = "--startup-benchmark" in sys.argv
     app = QApplication(sys.argv)
 
     app.setStyleSheet(global_style_sheet())
 
     initiate = InitiateApp()
     window = MainWindow(initiate)
+    timer.mark_on_paint(window, FIRST_PAINT, then=INTERACTIVE)
     window.showMaximized()
 
+    if benchmark:
+        def on_mark(name, _seconds):
+            if name == INTERACTIVE:
+                window.load_main_app()
+            elif name == MAIN_UI_INTERACTIVE:
+                print(json.dumps(timer.report()))
+                window.close()
+                app.quit()
+        timer.on_mark(on_mark)
+
     sys.exit(app.exec())
 
 
@@ -1,5 +1,6 @@
 from datetime import datetime
 import json
+import logging
 import subprocess
 import csv
 import time
@@ -11,14 +12,24 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QFrame, QScrollArea,
     QHBoxLayout, QGridLayout, QPushButton, QDialog, QMessageBox, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QProcess, QThread, QObject,  QRunnable, QThreadPool, pyqtSlot, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QProcess, QThread, QObject,  QRunnable, QThreadPool, pyqtSlot, QObject, pyqtSignal, QTimer, QProcessEnvironment
 from PyQt6.QtGui import QFont
 
 from src.utils.logger_module.omix_logger import OmixForgeLogger
+from src.utils.nextflow_assets import NextflowAssets
+from src.utils.subcommands.runner import CommandRunner
 from src.utils.subcommands.shell import run_shell_command
-from src.utils.constants import CONFIG_FILE,RUN_DIR, PIPELINES_RUNS, SAMPLE_PREP_DIR
-from src.utils.fileops.file_handle import ensure_directory, write_to_file, append_to_file, json_read, delete_file, delete_directory , tar_folder
-from src.utils.encryption.handle import encrypt_file, decrypt_file, generate_key
+from src.utils.constants import CONFIG_FILE,RUN_DIR, PIPELINES_RUNS, SAMPLE_PREP_DIR, WORK_CACHE_DIR
+from src.utils.fileops.file_handle import ensure_directory, write_to_file, append_to_file, json_read, delete_directory
+from src.utils.fileops.run_log_writer import RunLogWriter
+from src.utils.encryption.handle import generate_key
+from src.utils.encryption.archive import archive_folder
+from src.utils.fileops.archive_codec import DEFAULT_ARCHIVE_CODEC, INDEXED_ARCHIVE_SUFFIX
+from src.utils.local_scheduler import LocalRunScheduler, RESOURCES_CONFIG_FILE, resource_config
+from src.utils.work_cache import DEFAULT_WORK_CACHE_GB, WorkDirCache
+from src.utils.remote.scheduler import RemoteJobScheduler
+from src.utils.remote.transfer import DEFAULT_TRANSFERS
+from src.utils.run_index import RunIndex, RUN_QUEUED, RUN_RUNNING, RUN_FAILED, RUN_CANCELLED
 from src.core.dashboard.pipeline_dash_tab.pipeline_args import PipelineArgsDialog
 from src.core.dashboard.pipeline_dash_tab.pipeline_card import PipelineCard
 from src.assets.stylesheet import close_btn_red_bg
@@ -26,35 +37,24 @@ from src.assets.stylesheet import close_btn_red_bg
 logger = OmixForgeLogger.get_logger()
 
 
-class PipelineInfoWorker(QObject):
-    """Worker thread to fetch pipeline info without blocking UI."""
-    
-    finished = pyqtSignal()
-    error = pyqtSignal(str)
-    info_ready = pyqtSignal(dict)
-    
-    def __init__(self, pipeline_name):
-        super().__init__()
-        self.pipeline_name = pipeline_name
-    
-    def run(self):
-        """Run the nextflow info command and parse output."""
-        try:
-            shell_out = run_shell_command(f"nextflow info {self.pipeline_name}")
-            info = {}
-            
-            for line in shell_out.stdout.splitlines():
-                if ": " in line:
-                    key, value = line.split(": ", 1)
-                    info[key.strip()] = value.strip()
-            
-            # Emit the parsed info dict
-            self.info_ready.emit(info)
-        except Exception as e:
-            logger.error(f"Error fetching pipeline info: {e}")
-            self.error.emit(str(e))
-        finally:
-            self.finished.emit()
+# Seconds before a Nextflow CLI query is given up; the first call may download Nextflow itself
+NEXTFLOW_QUERY_TIMEOUT = 300
+
+
+def parse_nextflow_list(output: str) -> list:
+    """Return the pipeline names in the output of `nextflow list`."""
+    return [line.split()[0] for line in output.strip().splitlines()
+            if line.strip() and not line.startswith("You can run")]
+
+
+def parse_nextflow_info(output: str) -> dict:
+    """Return the "key: value" fields in the output of `nextflow info <pipeline>`."""
+    info = {}
+    for line in output.splitlines():
+        if ": " in line:
+            key, value = line.split(": ", 1)
+            info[key.strip()] = value.strip()
+    return info
 
 class ZipEncryptSignals(QObject):
     finished = pyqtSignal(str, int)     # emits run_name on success
@@ -62,27 +62,27 @@ class ZipEncryptSignals(QObject):
 
 
 class ZipEncryptWorker(QRunnable):
-    def __init__(self, run_name, run_dir, zip_name, cred, exitCode):
+    def __init__(self, run_name, run_dir, zip_name, cred, exitCode, codec=DEFAULT_ARCHIVE_CODEC):
         super().__init__()
         self.run_name = run_name
         self.run_dir = run_dir
         self.zip_name = zip_name
         self.cred = cred
         self.exitCode = exitCode
+        self.codec = codec
         self.signals = ZipEncryptSignals()
 
     @pyqtSlot()
     def run(self):
         try:
-            tar_folder(self.run_dir, self.zip_name)
-
             key = generate_key(
                 f"{self.cred.get('user', '')}:{self.cred.get('password', '')}"
             )
 
-            encrypt_file(self.zip_name, key)
+            # Members are compressed and encrypted one by one into an indexed archive,
+            # so results can be browsed later without unpacking everything
+            archive_folder(self.run_dir, self.zip_name, key, self.codec)
 
-            delete_file(self.zip_name)
             delete_directory(self.run_dir)
 
             self.signals.finished.emit(self.run_name, self.exitCode)
@@ -125,6 +125,7 @@ class PipelineLocal(QWidget):
         super().__init__(parent)
         # keep references to running processes so they are not GC'd
         self.processes = {}
+        self.log_writers = {}  # Buffered run log writers by run_name
         self.output_displays = {}  # Store references to output display widgets by run_name
         self.current_pipeline_name = None  # Track the currently displayed pipeline
         
@@ -132,12 +133,42 @@ class PipelineLocal(QWidget):
         self.RUN_DIR = self.constants.get("folders",{}).get("RUN_DIR", RUN_DIR)
         self.PIPELINES_RUNS = self.constants.get("folders",{}).get("PIPELINES_RUNS", PIPELINES_RUNS)
         self.SAMPLE_PREP_DIR =  self.constants.get("folders",{}).get("SAMPLE_PREP_DIR", SAMPLE_PREP_DIR)
+        self.run_index = RunIndex.get_index()
+        # Forward one process output line in N to the global log (0 disables)
+        self.run_log_sample = self.constants.get("app", {}).get("run_log_sample", 1)
+        self.archive_codec = self.constants.get("app", {}).get("archive_codec", DEFAULT_ARCHIVE_CODEC)
+        # Data files copied concurrently to a remote server
+        self.remote_transfers = self.constants.get("app", {}).get("remote_transfers", DEFAULT_TRANSFERS)
+        self.remote_fetch_pipeline_info = self.constants.get("app", {}).get("remote_fetch_pipeline_info", False)
+        # Local runs wait for a share of the CPU and memory budget
+        self.local_scheduler = LocalRunScheduler.from_settings(self.constants.get("app", {}))
+        self.pending_runs = {}  # Queued local runs by run_name
+        # Re-runs of a pipeline on the same sample sheet share a work directory and resume
+        self.work_cache = WorkDirCache(
+            self.constants.get("folders", {}).get("WORK_CACHE_DIR", WORK_CACHE_DIR),
+            max_gb=self.constants.get("app", {}).get("work_cache_gb", DEFAULT_WORK_CACHE_GB),
+        )
+
+        # Flush buffered run logs that went quiet before reaching the size threshold
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(1000)
+        self._log_flush_timer.timeout.connect(self._flush_log_writers)
+        self._log_flush_timer.start()
         
-        # Worker thread and spinner for async pipeline info fetch
-        self.info_worker = None
-        self.info_worker_thread = None
+        # Nextflow CLI queries run in the background; the latest of each kind wins
+        self.command_runner = CommandRunner.get_runner()
+        self.nextflow_assets = NextflowAssets.get_assets()
+        self.list_task = None
+        self.info_task = None
         self.active_spinner = None  # Track the active spinner to prevent accessing deleted ones
-        self.remote_run_name = None
+
+        # Remote runs are queued per server; runs left from the last session are re-attached
+        self.remote_scheduler = RemoteJobScheduler.get_scheduler()
+        self.remote_scheduler.progress.connect(self._on_remote_progress)
+        self.remote_scheduler.finished.connect(self._on_remote_finished)
+        self.remote_scheduler.error.connect(self._on_remote_error)
+        PipelineLocal.active_runs.update(self.remote_scheduler.jobs())
+        self.remote_scheduler.resume()
         
         self.pipelines = []
         self.pipeline_info_lines = {}
@@ -172,23 +203,32 @@ class PipelineLocal(QWidget):
 
 
     def get_local_pipelines(self):
-        process = run_shell_command("nextflow list")
-        try:
-            output = process.stdout.strip().splitlines()
-            for line in output:
-                if line and not line.startswith("You can run"):
-                    name = line.split()[0]
-                    self.pipelines.append(name)
-        except Exception as e:
-            logger.error(f"Error decoding nextflow list output: {e}")
-    
+        """List the installed pipelines and render their cards."""
+        if self.nextflow_assets.assets_dir.is_dir():
+            # Read straight from Nextflow's assets directory; no JVM involved
+            self.pipelines = self.nextflow_assets.list_pipelines()
+            self.render_cards()
+            return
+
+        # Non-standard Nextflow setup: ask the CLI in the background
+        if self.list_task is not None:
+            self.list_task.cancel()
+        self.list_task = self.command_runner.submit(
+            "nextflow list",
+            on_finished=self._on_local_pipelines,
+            on_error=lambda err: logger.error(f"Error listing local pipelines: {err}"),
+            timeout=NEXTFLOW_QUERY_TIMEOUT,
+        )
+
+    def _on_local_pipelines(self, result):
+        self.pipelines = parse_nextflow_list(result.stdout)
+        self.render_cards()
+        logger.info(f"Found {len(self.pipelines)} local pipelines")
+
     def refresh_pipelines(self):
         """Refresh the local pipelines list and re-render cards."""
         logger.info("Refreshing local pipelines...")
-        self.pipelines = []
         self.get_local_pipelines()
-        self.render_cards()
-        logger.info(f"Refreshed: found {len(self.pipelines)} pipelines")
 
 
     def render_cards(self):
@@ -219,7 +259,10 @@ class PipelineLocal(QWidget):
                 row += 1
 
     def _find_run_for_pipeline(self, pipeline_name: str):
-        """Return the run_name key for a running process matching pipeline_name, or None."""
+        """Return the run_name key for a running or queued run matching pipeline_name, or None."""
+        for rn, entry in self.pending_runs.items():
+            if pipeline_name in (entry["pipeline"], entry["pipeline"].replace('nf-core/', '')):
+                return rn
         for rn, entry in self.processes.items():
             try:
                 p_name = entry.get('pipeline')
@@ -247,25 +290,10 @@ class PipelineLocal(QWidget):
         # Clear the old spinner reference so signals from old workers are ignored
         self.active_spinner = None
         
-        # Stop any existing worker thread - ensure it fully stops before proceeding
-        if self.info_worker_thread is not None:
-            try:
-                # Check if thread is still alive before quitting
-                if self.info_worker_thread.isRunning():
-                    self.info_worker_thread.quit()
-                    # Wait up to 3 seconds for graceful shutdown
-                    if not self.info_worker_thread.wait(3000):
-                        # If thread didn't stop gracefully, force kill it
-                        logger.warning("Worker thread didn't stop gracefully, forcing termination")
-                        # Note: terminate() is more forceful than quit()
-                        # We already called quit(), so just wait a bit longer
-                        self.info_worker_thread.wait(1000)
-            except (RuntimeError, AttributeError):
-                # Thread was already deleted or is invalid
-                pass
-            finally:
-                self.info_worker_thread = None
-                self.info_worker = None
+        # Stop the query of the previously clicked card; its JVM is killed rather than waited for
+        if self.info_task is not None:
+            self.info_task.cancel()
+            self.info_task = None
         
         # Create and show spinner
         spinner = WaitingSpinner(self.details_box)
@@ -278,22 +306,17 @@ class PipelineLocal(QWidget):
         self.details_layout.addWidget(spinner_label)
         self.details_box.show()
         
-        # Create worker thread
-        self.info_worker = PipelineInfoWorker(name)
-        self.info_worker_thread = QThread()
-        self.info_worker.moveToThread(self.info_worker_thread)
-        
-        # Connect signals
-        self.info_worker_thread.started.connect(self.info_worker.run)
-        self.info_worker.info_ready.connect(lambda info: self._on_pipeline_info_ready(info, name, spinner))
-        self.info_worker.error.connect(lambda err: self._on_pipeline_info_error(err, spinner))
-        # ensure thread quits when worker finishes and clean up objects
-        self.info_worker.finished.connect(self.info_worker_thread.quit)
-        self.info_worker.finished.connect(self.info_worker.deleteLater)
-        # Note: do NOT call deleteLater on QThread itself; it causes "wrapped C/C++ object has been deleted" errors
-        
-        # Start the thread
-        self.info_worker_thread.start()
+        info = self.nextflow_assets.pipeline_info(name)
+        if info is not None:
+            self._on_pipeline_info_ready(info, name, spinner)
+            return
+
+        self.info_task = self.command_runner.submit(
+            ["nextflow", "info", name],
+            on_finished=lambda result: self._on_pipeline_info_ready(parse_nextflow_info(result.stdout), name, spinner),
+            on_error=lambda err: self._on_pipeline_info_error(err, spinner),
+            timeout=NEXTFLOW_QUERY_TIMEOUT,
+        )
     
     def _on_pipeline_info_ready(self, info, name, spinner):
         """Handle pipeline info ready signal - replace spinner with info."""
@@ -632,34 +655,31 @@ class PipelineLocal(QWidget):
                 QMessageBox.warning(self, "SSH config", "Please select a valid configured SSH server.")
                 return
 
-            # Create worker and thread for remote submission
-            self.remote_worker = RemotePipelineWorker(pipeline, run_dir, config, ssh_server, run_name, self.PIPELINES_RUNS, self.RUN_DIR)
-            self.remote_thread = QThread()
-            self.remote_worker.moveToThread(self.remote_thread)
-
-            # Track remote submission as an active run for badge counting
-            self.remote_run_name = run_name
+            # Queue the run; the scheduler starts it when the server has a free slot
+            server_label = ssh_server.get('name') or ssh_server.get('host')
             PipelineLocal.active_runs.add(run_name)
-
-            # Connect signals
-            self.remote_worker.progress.connect(self._on_remote_progress)
-            self.remote_worker.finished.connect(self._on_remote_finished)
-            self.remote_worker.error.connect(self._on_remote_error)
-            self.remote_thread.started.connect(self.remote_worker.run)
-            self.remote_worker.finished.connect(self.remote_thread.quit)
-            self.remote_worker.error.connect(self.remote_thread.quit)
-            self.remote_worker.finished.connect(self.remote_worker.deleteLater)
-            self.remote_worker.error.connect(self.remote_worker.deleteLater)
-            self.remote_thread.finished.connect(self.remote_thread.deleteLater)
-
-            # Start the thread
-            self.remote_thread.start()
-            QMessageBox.information(self, "Pipeline Submitted", f"Submitting pipeline to {ssh_server.get('name', ssh_server.get('host'))}...")
+            started = self.remote_scheduler.submit({
+                "run_name": run_name,
+                "pipeline": pipeline,
+                "run_dir": str(run_dir),
+                "config": config,
+                "ssh_server": ssh_server,
+                "pipelines_runs_dir": str(self.PIPELINES_RUNS),
+                "run_dir_base": str(self.RUN_DIR),
+                "max_transfers": self.remote_transfers,
+                "fetch_pipeline_info": self.remote_fetch_pipeline_info,
+            })
+            if started:
+                QMessageBox.information(self, "Pipeline Submitted", f"Submitting pipeline to {server_label}...")
+            else:
+                QMessageBox.information(self, "Pipeline Queued",
+                                        f"{server_label} is running its maximum number of pipelines. "
+                                        f"The run is queued and starts when a slot is free.")
             return
 
         ensure_directory([str(run_dir), self.PIPELINES_RUNS ])
 
-        logger.info(f"Starting pipeline: {pipeline}")
+        logger.info(f"Queueing pipeline: {pipeline}")
         try:
             # Write config to JSON file in run directory
             config_file = f"{run_dir}/params.json"
@@ -668,17 +688,12 @@ class PipelineLocal(QWidget):
             
             write_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Running pipeline: {pipeline}\n")
             write_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Config: {json.dumps(config, indent=2)}\n")
+            self.run_index.record(run_name, RUN_QUEUED)
 
-            # create QProcess without parent
-            proc = QProcess()
-            proc.setProgram("nextflow")
-            # Include -params-file to pass the JSON config
-            proc.setArguments(["run", pipeline, "-profile", "docker", "-params-file", str(config_file)])
-            proc.setWorkingDirectory(str(run_dir))
-
-            # keep proc referenced
-            self.processes[run_name] = {"proc": proc, "pipeline": pipeline}
+            self.pending_runs[run_name] = {"pipeline": pipeline, "run_dir": str(run_dir), "config_file": config_file,
+                                           "samplesheet": config["input"]}
             PipelineLocal.active_runs.add(run_name)
+            self.local_scheduler.submit(run_name)
 
             # mark current run/pipeline
             self.current_run_name = run_name
@@ -693,18 +708,91 @@ class PipelineLocal(QWidget):
             except Exception:
                 pass
 
-            # connect signals
-            proc.readyReadStandardOutput.connect(lambda rn=run_name: self._proc_stdout(rn))
-            proc.readyReadStandardError.connect(lambda rn=run_name: self._proc_stderr(rn))
-            proc.finished.connect(lambda exitCode, exitStatus, rn=run_name: self._proc_finished(rn, exitCode, exitStatus))
-
-            proc.start()
-            QMessageBox.information(self, "Pipeline Started", f"Started {pipeline}\nConfig saved to {config_file}")
+            self._start_admitted_runs()
+            if run_name in self.processes:
+                QMessageBox.information(self, "Pipeline Started", f"Started {pipeline}\nConfig saved to {config_file}")
+            elif run_name in self.pending_runs:
+                QMessageBox.information(self, "Pipeline Queued",
+                                        f"{pipeline} is queued until running pipelines free enough CPUs and memory.\n"
+                                        f"Config saved to {config_file}")
         except Exception as e:
             logger.error(f"Error starting pipeline: {e}")
-            append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Error starting pipeline: {e}\n")
+            self._fail_local_run(run_name, e)
             QMessageBox.critical(self, "Error", f"Failed to start pipeline: {e}")
 
+    def _start_admitted_runs(self):
+        """Start every queued local run that fits the free CPU and memory budget."""
+        for run_name, cpus, memory_gb in self.local_scheduler.admit():
+            entry = self.pending_runs.pop(run_name, None)
+            if entry is None:
+                self.local_scheduler.release(run_name)
+                continue
+            try:
+                self._start_local_run(run_name, entry, cpus, memory_gb)
+            except Exception as e:
+                logger.error(f"Error starting pipeline {run_name}: {e}")
+                self.local_scheduler.release(run_name)
+                self._fail_local_run(run_name, e)
+
+    def _start_local_run(self, run_name, entry, cpus, memory_gb):
+        pipeline = entry["pipeline"]
+        run_dir = entry["run_dir"]
+
+        # The granted share reaches Nextflow as an extra config file
+        resources_file = f"{run_dir}/{RESOURCES_CONFIG_FILE}"
+        write_to_file(resources_file, resource_config(cpus, memory_gb))
+        append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Starting with {cpus} CPUs and {memory_gb} GB memory\n")
+        logger.info(f"Starting pipeline: {pipeline} ({cpus} CPUs, {memory_gb} GB)")
+
+        # Include -params-file to pass the JSON config
+        args = ["run", pipeline, "-profile", "docker", "-c", resources_file, "-params-file", str(entry["config_file"])]
+        # create QProcess without parent
+        proc = QProcess()
+        proc.setProgram("nextflow")
+
+        lease = self.work_cache.acquire(pipeline, entry["samplesheet"])
+        if lease is not None:
+            # Task cache and session history live with the shared work directory, not the run directory
+            env = QProcessEnvironment.systemEnvironment()
+            env.insert("NXF_CACHE_DIR", lease.cache_dir)
+            proc.setProcessEnvironment(env)
+            args += ["-w", lease.work_dir]
+            if lease.resume:
+                args.append("-resume")
+                append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Resuming from cached work directory {lease.work_dir}\n")
+        else:
+            append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", "Work directory in use by another run; starting without cache\n")
+
+        self.run_index.record(run_name, RUN_RUNNING)
+        self.log_writers[run_name] = RunLogWriter(f"{self.PIPELINES_RUNS}/{run_name}", log_every=self.run_log_sample)
+
+        proc.setArguments(args)
+        proc.setWorkingDirectory(str(run_dir))
+
+        # keep proc referenced
+        self.processes[run_name] = {"proc": proc, "pipeline": pipeline, "lease": lease}
+
+        # connect signals
+        proc.readyReadStandardOutput.connect(lambda rn=run_name: self._proc_stdout(rn))
+        proc.readyReadStandardError.connect(lambda rn=run_name: self._proc_stderr(rn))
+        proc.finished.connect(lambda exitCode, exitStatus, rn=run_name: self._proc_finished(rn, exitCode, exitStatus))
+
+        proc.start()
+
+    def _release_work_dir(self, entry):
+        lease = entry.get("lease") if entry else None
+        if lease is not None:
+            # Measuring and evicting walks the work directories; keep it off the UI thread
+            QThreadPool.globalInstance().start(lambda: self.work_cache.release(lease))
+
+    def _fail_local_run(self, run_name, error):
+        self.pending_runs.pop(run_name, None)
+        self.local_scheduler.cancel(run_name)
+        PipelineLocal.active_runs.discard(run_name)
+        self._close_log_writer(run_name)
+        append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Error starting pipeline: {error}\n")
+        self.run_index.record(run_name, RUN_FAILED, 1)
+
     def _proc_stdout(self, run_name):
         # lookup the live process by run_name (proc may have been deleted)
         entry = self.processes.get(run_name)
@@ -716,9 +804,7 @@ class PipelineLocal(QWidget):
         try:
             out = proc.readAllStandardOutput().data().decode('utf-8', errors='ignore')
             if out:
-                for line in out.splitlines():
-                    append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", line + "\n")
-                    logger.info(line)
+                self._write_run_log(run_name, "\n".join(out.splitlines()) + "\n")
         except Exception as e:
             logger.error(f"Error reading stdout for {run_name}: {e}")
 
@@ -732,17 +818,47 @@ class PipelineLocal(QWidget):
         try:
             err = proc.readAllStandardError().data().decode('utf-8', errors='ignore')
             if err:
-                for line in err.splitlines():
-                    append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", line + "\n")
-                    logger.error(line)
+                self._write_run_log(run_name, "\n".join(err.splitlines()) + "\n", logging.ERROR)
         except Exception as e:
             logger.error(f"Error reading stderr for {run_name}: {e}")
 
+    def _write_run_log(self, run_name, text, level=logging.INFO):
+        """Append text to a run log through its buffered writer, if it still has one."""
+        writer = self.log_writers.get(run_name)
+        if writer is not None:
+            writer.write(text, level)
+        else:
+            append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", text)
+
+    def _close_log_writer(self, run_name):
+        writer = self.log_writers.pop(run_name, None)
+        if writer is not None:
+            try:
+                writer.close()
+            except Exception as e:
+                logger.error(f"Error closing run log for {run_name}: {e}")
+
+    def _flush_log_writers(self):
+        for run_name, writer in list(self.log_writers.items()):
+            try:
+                writer.flush_if_due()
+            except Exception as e:
+                logger.error(f"Error flushing run log for {run_name}: {e}")
+
     def on_cancel_clicked(self):
         # Cancel the currently running pipeline (if any)
         if not hasattr(self, 'current_run_name') or not self.current_run_name:
             return
         rn = self.current_run_name
+        if self.local_scheduler.cancel(rn):
+            # Still waiting for resources: nothing to stop
+            self.pending_runs.pop(rn, None)
+            append_to_file(f"{self.PIPELINES_RUNS}/{rn}", "Pipeline run cancelled by user.\n")
+            logger.info(f"Cancelling queued pipeline run: {rn}")
+            PipelineLocal.active_runs.discard(rn)
+            self.run_index.record(rn, RUN_CANCELLED)
+            self._reset_run_buttons()
+            return
         entry = self.processes.get(rn)
         if not entry:
             return
@@ -750,7 +866,7 @@ class PipelineLocal(QWidget):
         if not proc:
             return
         try:
-            append_to_file(f"{self.PIPELINES_RUNS}/{rn}", "Pipeline run cancelled by user.\n")
+            self._write_run_log(rn, "Pipeline run cancelled by user.\n")
             logger.info(f"Cancelling pipeline run: {rn}")
             if proc.state() != QProcess.ProcessState.NotRunning:
                 proc.terminate()
@@ -761,28 +877,39 @@ class PipelineLocal(QWidget):
         except Exception as e:
             logger.error(f"Error cancelling pipeline {rn}: {e}")
         finally:
-            # clean up and update UI
-            try:
-                proc.deleteLater()
-            except Exception:
-                pass
-            self.processes.pop(rn, None)
-            PipelineLocal.active_runs.discard(rn)
-            try:
-                self.run_btn.setEnabled(True)
-            except Exception:
-                pass
-            try:
-                self.cancel_btn.setEnabled(False)
-            except Exception:
-                pass
-            self.current_run_name = None
-            self.current_pipeline = None
+            # Recorded last so it wins over the exit code reported while terminating
+            self.run_index.record(rn, RUN_CANCELLED)
+            self._reset_run_buttons()
+            # Terminating normally runs _proc_finished, which already freed the run's
+            # lease and slot; freeing them again could take them from a run admitted since
+            if self.processes.get(rn) is entry:
+                try:
+                    proc.deleteLater()
+                except Exception:
+                    pass
+                self.processes.pop(rn, None)
+                self._release_work_dir(entry)
+                self._close_log_writer(rn)
+                PipelineLocal.active_runs.discard(rn)
+                self.local_scheduler.release(rn)
+                self._start_admitted_runs()
+
+    def _reset_run_buttons(self):
+        try:
+            self.run_btn.setEnabled(True)
+        except Exception:
+            pass
+        try:
+            self.cancel_btn.setEnabled(False)
+        except Exception:
+            pass
+        self.current_run_name = None
+        self.current_pipeline = None
 
-    def _on_remote_progress(self, message):
-        logger.info(f"Remote pipeline progress: {message}")
+    def _on_remote_progress(self, run_name, message):
+        logger.info(f"Remote pipeline progress ({run_name}): {message}")
 
-    def _on_remote_finished(self, success, message):
+    def _on_remote_finished(self, run_name, success, message):
         if success:
             logger.info(f"Remote pipeline finished: {message}")
             QMessageBox.information(self, "Remote Pipeline", message)
@@ -790,37 +917,29 @@ class PipelineLocal(QWidget):
             logger.error(f"Remote pipeline failed: {message}")
             QMessageBox.critical(self, "Remote Pipeline Error", message)
 
-        if getattr(self, 'remote_run_name', None):
-            PipelineLocal.active_runs.discard(self.remote_run_name)
-            self.remote_run_name = None
-
-        # Clean up references
-        self.remote_worker = None
-        self.remote_thread = None
+        PipelineLocal.active_runs.discard(run_name)
 
-    def _on_remote_error(self, error_msg):
-        logger.error(f"Remote pipeline error: {error_msg}")
+    def _on_remote_error(self, run_name, error_msg):
+        logger.error(f"Remote pipeline error ({run_name}): {error_msg}")
         QMessageBox.critical(self, "Remote Pipeline Error", f"Remote submission failed: {error_msg}")
 
-        if getattr(self, 'remote_run_name', None):
-            PipelineLocal.active_runs.discard(self.remote_run_name)
-            self.remote_run_name = None
-
-        # Clean up references
-        self.remote_worker = None
-        self.remote_thread = None
+        PipelineLocal.active_runs.discard(run_name)
 
     def _proc_finished(self, run_name, exitCode, exitStatus):
+        # Pick up output still pending in the pipes, then hand the log back to plain appends
+        self._proc_stdout(run_name)
+        self._proc_stderr(run_name)
+        self._close_log_writer(run_name)
         try:
 
             try:
                 app = QApplication.instance()
                 try:
                     if app.cred:
-                        zip_name = f"{self.RUN_DIR}/{run_name.replace('.txt', '.tar.gz')}"
+                        zip_name = f"{self.RUN_DIR}/{run_name.replace('.txt', INDEXED_ARCHIVE_SUFFIX)}"
                         run_dir = f"{self.RUN_DIR}/{run_name.replace('.txt','')}"
 
-                        worker = ZipEncryptWorker(run_name, run_dir, zip_name, app.cred, exitCode)
+                        worker = ZipEncryptWorker(run_name, run_dir, zip_name, app.cred, exitCode, self.archive_codec)
 
                         # Connect callbacks
                         worker.signals.finished.connect(self._on_zip_encrypt_done)
@@ -830,15 +949,18 @@ class PipelineLocal(QWidget):
                         QThreadPool.globalInstance().start(worker)
                 except AttributeError:
                     append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Pipeline run completed <<exit-code:{exitCode}>>.\n")
+                    self.run_index.record_exit(run_name, exitCode)
                     logger.info(f"Pipeline {run_name} finished (code={exitCode})")
             except Exception as e:
                 logger.error(f"Failed to complete run - {e}")
                 append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Pipeline run completed <<exit-code:{1}>>.\n")
+                self.run_index.record_exit(run_name, 1)
 
             
         finally:
             # Clean up stored process
             entry = self.processes.pop(run_name, None)
+            self._release_work_dir(entry)
             PipelineLocal.active_runs.discard(run_name)
             proc = None
             if entry:
@@ -857,31 +979,35 @@ class PipelineLocal(QWidget):
                     pass
             # If this finished run was the currently displayed one, update buttons
             if hasattr(self, 'current_run_name') and self.current_run_name == run_name:
-                try:
-                    self.run_btn.setEnabled(True)
-                except Exception:
-                    pass
-                try:
-                    self.cancel_btn.setEnabled(False)
-                except Exception:
-                    pass
-                # clear current run tracking
-                self.current_run_name = None
-                self.current_pipeline = None
+                self._reset_run_buttons()
+
+            # Its CPUs and memory go to the next queued run
+            self.local_scheduler.release(run_name)
+            self._start_admitted_runs()
 
     def _on_zip_encrypt_done(self, run_name, exitCode):
         logger.info(f"Zip/encrypt cleanup completed for run: {run_name}")
         append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Pipeline run completed <<exit-code:{exitCode}>>.\n")
+        if self.run_index.state(run_name) != RUN_CANCELLED:
+            self.run_index.record_exit(run_name, exitCode)
         logger.info(f"Pipeline {run_name} finished (code={exitCode})")
 
 
     def _on_zip_encrypt_error(self, run_name, err, exitCode):
         logger.error(f"Zip/encrypt failed for run {run_name}: {err}")
         append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", f"Pipeline run completed <<exit-code:{1}>>.\n")
+        self.run_index.record_exit(run_name, 1)
         logger.error(f"Pipeline {run_name} finished (code={exitCode}) , But encryption failed")
         
 
     def closeEvent(self, event):
+        # Queued runs never started; they are not resumed on the next start
+        for rn in self.local_scheduler.queued():
+            self.local_scheduler.cancel(rn)
+            self.pending_runs.pop(rn, None)
+            append_to_file(f"{self.PIPELINES_RUNS}/{rn}", "Pipeline run cancelled: the application was closed before it started.\n")
+            self.run_index.record(rn, RUN_CANCELLED)
+
         # Terminate any running processes when the widget is closed/destroyed
         for rn, entry in list(self.processes.items()):
             proc = entry.get('proc') if entry else None
@@ -900,19 +1026,15 @@ class PipelineLocal(QWidget):
             except Exception:
                 pass
             self.processes.pop(rn, None)
+            self._close_log_writer(rn)
+            lease = entry.get("lease") if entry else None
+            if lease is not None:
+                self.work_cache.release(lease)
         
         # Stop any worker threads cleanly
-        try:
-            if getattr(self, 'info_worker_thread', None) is not None:
-                if self.info_worker_thread.isRunning():
-                    self.info_worker_thread.quit()
-                    # Wait longer to ensure thread stops
-                    if not self.info_worker_thread.wait(3000):
-                        logger.warning("Info worker thread didn't stop in time during closeEvent")
-                self.info_worker_thread = None
-                self.info_worker = None
-        except Exception as e:
-            logger.error(f"Error stopping info worker thread: {e}")
+        for task in (self.list_task, self.info_task):
+            if task is not None:
+                task.cancel()
 
         try:
             if getattr(self, 'delete_thread', None) is not None:
@@ -927,458 +1049,9 @@ class PipelineLocal(QWidget):
             logger.error(f"Error stopping delete worker thread: {e}")
 
         try:
-            if getattr(self, 'remote_thread', None) is not None:
-                if self.remote_thread.isRunning():
-                    self.remote_thread.quit()
-                    # Wait longer to ensure thread stops
-                    if not self.remote_thread.wait(3000):
-                        logger.warning("Remote worker thread didn't stop in time during closeEvent")
-                self.remote_thread = None
-                self.remote_worker = None
+            # Remote runs keep going on their servers and are re-attached on the next start
+            self.remote_scheduler.shutdown()
         except Exception as e:
-            logger.error(f"Error stopping remote worker thread: {e}")
+            logger.error(f"Error stopping remote workers: {e}")
 
         super().closeEvent(event)
-
-class RemotePipelineWorker(QObject):
-    """Worker to run pipeline on remote server asynchronously."""
-    
-    progress = pyqtSignal(str)
-    finished = pyqtSignal(bool, str)  # success, message
-    error = pyqtSignal(str)
-    
-    def __init__(self, pipeline, run_dir, config, ssh_server, run_name, pipelines_runs_dir, run_dir_base):
-        super().__init__()
-        self.pipeline = pipeline
-        self.run_dir = run_dir
-        self.config = config
-        self.ssh_server = ssh_server
-        self.run_name = run_name
-        self.pipelines_runs_dir = pipelines_runs_dir
-        self.run_dir_base = run_dir_base
-    
-    def run(self):
-        try:
-            # build paths - remove .txt extension from run_name for remote directory
-            remote_base = f"/tmp/omixforge_runs/{self.run_name.replace(' ', '_').replace('.txt', '')}"
-            host = self.ssh_server.get('host')
-            user = self.ssh_server.get('username')
-            port = self.ssh_server.get('port', "")
-            if port == "":
-                port = None
-            key_path = self.ssh_server.get('key_path')
-            if not all([host, user, key_path]):
-                raise ValueError("Incomplete SSH server configuration")
-
-            # ensure local run_dir exists and config stored
-            ensure_directory([str(self.run_dir), self.pipelines_runs_dir])
-            config_file = f"{self.run_dir}/params.json"
-            with open(config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
-
-            # Create initial log file
-            local_log = f"{self.pipelines_runs_dir}/{self.run_name}"
-            write_to_file(local_log, f"Remote pipeline submission started for {self.pipeline} on {self.ssh_server.get('host')}\n")
-
-            sample_sheet = self.config.get('input')
-            if not sample_sheet:
-                raise ValueError("Sample sheet path missing")
-
-            self.progress.emit("Creating remote directory...")
-            append_to_file(local_log, "Creating remote directory...\n")
-            # create remote directory
-            if port is None:
-                proc = subprocess.run(["ssh", "-i", key_path, f"{user}@{host}", f"mkdir -p {remote_base}"], 
-                                    capture_output=True, text=True)
-            else:
-                proc = subprocess.run(["ssh", "-i", key_path, "-p", str(port), f"{user}@{host}", f"mkdir -p {remote_base}"], 
-                                    capture_output=True, text=True)
-            if proc.returncode != 0:
-                append_to_file(local_log, f"Error: Failed to create remote directory <<exit-code:1>>: {proc.stderr}\n")
-                raise RuntimeError(f"Failed to create remote dir: {proc.stderr}")
-
-            self.progress.emit("Copying sample sheet...")
-            append_to_file(local_log, "Copying sample sheet...\n")
-            # copy sample sheet
-            sample_sheet_name = Path(sample_sheet).name
-            remote_sample_sheet = f"{remote_base}/{sample_sheet_name}"
-            if port is None:
-                proc = subprocess.run(["scp", "-i", key_path, sample_sheet, f"{user}@{host}:{remote_sample_sheet}"], 
-                                capture_output=True, text=True)
-            else:
-                proc = subprocess.run(["scp", "-i", key_path, "-P", str(port), sample_sheet, f"{user}@{host}:{remote_sample_sheet}"], 
-                                capture_output=True, text=True)
-            if proc.returncode != 0:
-                append_to_file(local_log, f"Error: Failed to copy sample sheet <<exit-code:1>>: {proc.stderr}\n")
-                raise RuntimeError(f"Failed to copy sample sheet: {proc.stderr}")
-
-            # Copy data files and collect filenames for remote path replacement
-            self.progress.emit("Copying data files to remote...")
-            append_to_file(local_log, "Copying data files to remote...\n")
-            data_files_copied = []
-            with open(sample_sheet, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    for key, value in row.items():
-                        if key.startswith('fastq') and value:
-                            file_path = Path(value).expanduser()
-                            if file_path.exists():
-                                filename = file_path.name
-                                remote_file = f"{remote_base}/{filename}"
-                                append_to_file(local_log, f"Copying data file: {file_path} -> {remote_file}\n")
-                                if port is None:
-                                    proc = subprocess.run(["scp", "-i", key_path, str(file_path), f"{user}@{host}:{remote_file}"], 
-                                                        capture_output=True, text=True)
-                                else:
-                                    proc = subprocess.run(["scp", "-i", key_path, "-P", str(port), str(file_path), f"{user}@{host}:{remote_file}"], 
-                                                        capture_output=True, text=True)
-                                if proc.returncode != 0:
-                                    error_msg = f"Failed to copy data file {file_path}: {proc.stderr}"
-                                    append_to_file(local_log, f"Error: {error_msg}\n")
-                                    raise RuntimeError(error_msg)
-                                data_files_copied.append((str(file_path), remote_file))
-                            else:
-                                error_msg = f"Data file not found: {file_path}"
-                                append_to_file(local_log, f"Warning: {error_msg}\n")
-                                logger.warning(error_msg)
-
-            # Create remote script to update sample sheet paths on the server
-            self.progress.emit("Updating sample sheet paths on remote server...")
-            append_to_file(local_log, "Updating sample sheet paths on remote server...\n")
-            remote_script = f"{remote_base}/update_samplesheet.py"
-            script_content = f"""#!/usr/bin/env python3
-import csv
-import sys
-
-sample_sheet = "{remote_sample_sheet}"
-remote_base = "{remote_base}"
-
-# Mapping of original paths to remote paths
-path_mapping = {{
-{chr(10).join([f'    "{local}": "{remote}",' for local, remote in data_files_copied])}
-}}
-
-try:
-    # Read sample sheet
-    with open(sample_sheet, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = reader.fieldnames
-    
-    # Update paths
-    for row in rows:
-        for key in row:
-            if key.startswith('fastq') and row[key]:
-                if row[key] in path_mapping:
-                    row[key] = path_mapping[row[key]]
-    
-    # Write updated sample sheet back
-    with open(sample_sheet, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    
-    print(f"Updated sample sheet: {{sample_sheet}}")
-except Exception as e:
-    print(f"Error updating sample sheet: {{e}}", file=sys.stderr)
-    sys.exit(1)
-"""
-            
-            # Write script to local temp location and copy to remote
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.py') as tmp:
-                tmp.write(script_content)
-                tmp_script_path = tmp.name
-            
-            try:
-                if port is None:
-                    proc = subprocess.run(["scp", "-i", key_path, tmp_script_path, f"{user}@{host}:{remote_script}"], 
-                                        capture_output=True, text=True)
-                else:
-                    proc = subprocess.run(["scp", "-i", key_path, "-P", str(port), tmp_script_path, f"{user}@{host}:{remote_script}"], 
-                                        capture_output=True, text=True)
-                if proc.returncode != 0:
-                    append_to_file(local_log, f"Error: Failed to copy update script <<exit-code:1>>: {proc.stderr}\n")
-                    raise RuntimeError(f"Failed to copy update script: {proc.stderr}")
-                
-                # Execute remote script
-                if port is None:
-                    proc = subprocess.run(["ssh", "-i", key_path, f"{user}@{host}", f"python3 {remote_script}"], 
-                                        capture_output=True, text=True)
-                else:
-                    proc = subprocess.run(["ssh", "-i", key_path, "-p", str(port), f"{user}@{host}", f"python3 {remote_script}"], 
-                                            capture_output=True, text=True)
-                if proc.returncode != 0:
-                    error_msg = f"Failed to update sample sheet on remote: {proc.stderr}"
-                    append_to_file(local_log, f"Error: <<exit-code:1>> {error_msg}\n")
-                    raise RuntimeError(error_msg)
-                append_to_file(local_log, f"Remote script output: {proc.stdout}\n")
-            finally:
-                # Clean up temp script
-                try:
-                    Path(tmp_script_path).unlink()
-                except Exception:
-                    pass
-
-            # Update config with remote paths
-            self.config['input'] = remote_sample_sheet
-            if 'outdir' in self.config:
-                self.config['outdir'] = remote_base
-
-            self.progress.emit("Copying pipeline config...")
-            append_to_file(local_log, "Copying pipeline config...\n")
-            # rewrite config with updated paths and copy to remote
-            with open(config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            if port is None:
-                proc = subprocess.run(["scp", "-i", key_path, config_file, f"{user}@{host}:{remote_base}/params.json"], 
-                                    capture_output=True, text=True)
-            else:
-                proc = subprocess.run(["scp", "-i", key_path, "-P", str(port), config_file, f"{user}@{host}:{remote_base}/params.json"], 
-                                    capture_output=True, text=True)
-            if proc.returncode != 0:
-                append_to_file(local_log, f"Error: Failed to copy updated config <<exit-code:1>>: {proc.stderr}\n")
-                raise RuntimeError(f"Failed to copy updated config: {proc.stderr}")
-
-            # Copy pipeline directory to remote nextflow assets
-            pipeline_local_dir = Path.home() / ".nextflow" / "assets" / self.pipeline
-            logger.info(f"Looking for local pipeline directory at: {pipeline_local_dir}")
-            if pipeline_local_dir.exists():
-                self.progress.emit("Copying pipeline directory...")
-                append_to_file(local_log, "Copying pipeline directory...\n")
-
-                # Get the assets base directory
-                assets_base = Path.home() / ".nextflow" / "assets"
-                
-                # Remote paths - use explicit expansion
-                remote_assets_base = f"/home/{user}/.nextflow/assets"
-                remote_pipeline_dir = f"{remote_assets_base}/{self.pipeline}"
-                
-                # Create remote directory structure
-                if port is None:
-                    proc = subprocess.run(["ssh", "-i", key_path, f"{user}@{host}", 
-                                          f"mkdir -p {remote_assets_base}"],
-                                        capture_output=True, text=True)
-                else:
-                    proc = subprocess.run(["ssh", "-i", key_path, "-p", str(port), f"{user}@{host}", 
-                                          f"mkdir -p {remote_assets_base}"],
-                                        capture_output=True, text=True)
-                if proc.returncode != 0:
-                    append_to_file(local_log, f"Warning: Failed to create remote nextflow assets dir : {proc.stderr}\n")
-
-                try:
-                    # Use tar to copy with git directory preserved
-                    # Tar from assets base directory to preserve the full pipeline path (e.g., nf-core/demo)
-                    tar_proc = subprocess.run(
-                        ["tar", "-C", str(assets_base), "-czf", "-", self.pipeline],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                    )
-                    if tar_proc.returncode != 0:
-                        raise RuntimeError(tar_proc.stderr.decode("utf-8", errors="ignore") or "tar failed")
-
-                    # Extract on remote in assets base directory to recreate full structure
-                    if port is None:
-                        ssh_cmd = ["ssh", "-i", key_path, f"{user}@{host}", 
-                                   f"mkdir -p {remote_assets_base} && cd {remote_assets_base} && tar -xzf -"]
-                    else:
-                        ssh_cmd = ["ssh", "-i", key_path, "-p", str(port), f"{user}@{host}", 
-                                   f"mkdir -p {remote_assets_base} && cd {remote_assets_base} && tar -xzf -"]
-                    ssh_proc = subprocess.run(
-                        ssh_cmd,
-                        input=tar_proc.stdout,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                    )
-                    if ssh_proc.returncode != 0:
-                        raise RuntimeError(ssh_proc.stderr.decode("utf-8", errors="ignore") or "remote tar extract failed")
-                    
-                    logger.info(f"Successfully copied pipeline to {remote_pipeline_dir} via tar/ssh")
-                    append_to_file(local_log, f"Successfully copied pipeline to {remote_pipeline_dir} via tar/ssh\n")
-                except Exception as exc:
-                    append_to_file(local_log, f"Warning: Failed to copy pipeline dir: {exc}\n")
-                    logger.warning(f"Failed to copy pipeline dir: {exc}")
-
-            self.progress.emit("Starting remote pipeline...")
-            append_to_file(local_log, "Starting remote pipeline...\n")
-            # run pipeline remotely and save remote logs
-            remote_log = f"{remote_base}/run.log"
-            nextflow_cmd = f"cd {remote_base} && bash -l -c 'nextflow run {self.pipeline} -profile docker -params-file params.json > run.log 2>&1'"
-            
-            # Start the pipeline process
-            if port is None:
-                ssh_proc = subprocess.Popen(
-                    ["ssh", "-i", key_path, f"{user}@{host}", nextflow_cmd],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-            else:
-                ssh_proc = subprocess.Popen(
-                    ["ssh", "-i", key_path, "-p", str(port), f"{user}@{host}", nextflow_cmd],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-
-            # Poll the remote log file every 30 seconds while the process runs
-            last_fetched_size = 0
-            poll_interval = 30  # seconds
-            
-            while ssh_proc.poll() is None:  # While process is still running
-                time.sleep(poll_interval)
-                
-                # Fetch new content from remote log using tail
-                try:
-                    tail_cmd = f"tail -c +{last_fetched_size + 1} {remote_log} 2>/dev/null || true"
-                    if port is None:
-                        tail_proc = subprocess.run(
-                            ["ssh", "-i", key_path, f"{user}@{host}", tail_cmd],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
-                    else:
-                        tail_proc = subprocess.run(
-                            ["ssh", "-i", key_path, "-p", str(port), f"{user}@{host}", tail_cmd],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
-                    
-                    if tail_proc.returncode == 0 and tail_proc.stdout:
-                        new_content = tail_proc.stdout
-                        # Emit progress with new log lines
-                        for line in new_content.splitlines():
-                            if line.strip():
-                                self.progress.emit(f"Remote: {line}")
-                        append_to_file(local_log, f"[Remote log update] {new_content}\n")
-                        last_fetched_size += len(new_content.encode('utf-8'))
-                except Exception as poll_exc:
-                    logger.warning(f"Error polling remote log: {poll_exc}")
-                    append_to_file(local_log, f"Warning: Error polling remote log: {poll_exc}\n")
-            
-            # Process has finished, get final return code
-            return_code = ssh_proc.wait()
-            
-            # Fetch any remaining log content
-            try:
-                if port is None:
-                    final_log_proc = subprocess.run(
-                        ["ssh", "-i", key_path, f"{user}@{host}", f"cat {remote_log}"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                else:
-                    final_log_proc = subprocess.run(
-                        ["ssh", "-i", key_path, "-p", str(port), f"{user}@{host}", f"cat {remote_log}"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                if final_log_proc.returncode == 0:
-                    final_content = final_log_proc.stdout
-                    append_to_file(local_log, f"\n--- Final Remote Pipeline Log ---\n{final_content}\n")
-            except Exception as final_exc:
-                logger.warning(f"Error fetching final log: {final_exc}")
-            
-            # Check if pipeline succeeded
-            if return_code != 0:
-                error_msg = f"Remote run failed <<exit-code:{return_code}>>"
-                append_to_file(local_log, f"Error: {error_msg}\n")
-                raise RuntimeError(error_msg)
-
-            self.progress.emit("Syncing results back to local...")
-            append_to_file(local_log, "Syncing results back to local...\n")
-            # sync the entire remote run directory back to local
-            if port is None:
-                proc = subprocess.run(["scp", "-i", key_path, "-r", f"{user}@{host}:{remote_base}", str(Path(self.run_dir).parent)], 
-                                    capture_output=True, text=True)
-            else:
-                proc = subprocess.run(["scp", "-i", key_path, "-P", str(port), "-r", f"{user}@{host}:{remote_base}", str(Path(self.run_dir).parent)], 
-                                    capture_output=True, text=True)
-            if proc.returncode != 0:
-                append_to_file(local_log, f"Warning: Failed to sync results: {proc.stderr}\n")
-                logger.warning(f"Failed to sync remote results: {proc.stderr}")
-
-            self.progress.emit("Fetching remote log...")
-            append_to_file(local_log, "Fetching remote log...\n")
-            # pull log to local run registry for visibility (now from synced directory)
-            local_run_log = Path(self.run_dir) / "run.log"
-            if local_run_log.exists():
-                try:
-                    with open(local_run_log, 'r') as f:
-                        remote_content = f.read()
-                    append_to_file(local_log, f"\n--- Remote Pipeline Output ---\n{remote_content}\n")
-                except Exception as e:
-                    append_to_file(local_log, f"Error reading synced remote log: {e}\n")
-            else:
-                append_to_file(local_log, "Warning: Remote log not found in synced results.\n")
-
-            append_to_file(local_log, f"Remote job finished, log fetched from {host}:{remote_log} <<exit-code:{proc.returncode}>>\n")
-            self.finished.emit(True, f"Pipeline finished successfully on {host}")
-            
-        except Exception as e:
-            self.error.emit(str(e))
-
-    def _proc_stdout(self, run_name):
-        # lookup the live process by run_name (proc may have been deleted)
-        entry = self.processes.get(run_name)
-        if not entry:
-            return
-        proc = entry.get('proc')
-        if not proc:
-            return
-        try:
-            out = proc.readAllStandardOutput().data().decode('utf-8', errors='ignore')
-            if out:
-                for line in out.splitlines():
-                    append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", line + "\n")
-                    logger.info(line)
-        except Exception as e:
-            logger.error(f"Error reading stdout for {run_name}: {e}")
-
-    def _proc_stderr(self, run_name):
-        entry = self.processes.get(run_name)
-        if not entry:
-            return
-        proc = entry.get('proc')
-        if not proc:
-            return
-        try:
-            err = proc.readAllStandardError().data().decode('utf-8', errors='ignore')
-            if err:
-                for line in err.splitlines():
-                    append_to_file(f"{self.PIPELINES_RUNS}/{run_name}", line + "\n")
-                    logger.error(line)
-        except Exception as e:
-            logger.error(f"Error reading stderr for {run_name}: {e}")
-
-    def _on_remote_progress(self, message):
-        logger.info(f"Remote pipeline progress: {message}")
-
-    def _on_remote_finished(self, success, message):
-        if success:
-            logger.info(f"Remote pipeline finished: {message}")
-            QMessageBox.information(self, "Remote Pipeline", message)
-        else:
-            logger.error(f"Remote pipeline failed: {message}")
-            QMessageBox.critical(self, "Remote Pipeline Error", message)
-
-        if getattr(self, 'remote_run_name', None):
-            PipelineLocal.active_runs.discard(self.remote_run_name)
-            self.remote_run_name = None
-
-        # Clean up references
-        self.remote_worker = None
-        self.remote_thread = None
-
-    def _on_remote_error(self, error_msg):
-        logger.error(f"Remote pipeline error: {error_msg}")
-        QMessageBox.critical(self, "Remote Pipeline Error", f"Remote submission failed: {error_msg}")
-
-        if getattr(self, 'remote_run_name', None):
-            PipelineLocal.active_runs.discard(self.remote_run_name)
-            self.remote_run_name = None
-
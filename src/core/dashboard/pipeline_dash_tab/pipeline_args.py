@@ -1,6 +1,7 @@
 from src.utils.logger_module.omix_logger import OmixForgeLogger
 from src.utils.constants import RUN_DIR, SAMPLE_PREP_DIR, CONFIG_FILE
 from src.utils.fileops.file_handle import json_read
+from src.utils.nextflow_assets import NextflowAssets
 
 logger = OmixForgeLogger.get_logger()
 
@@ -324,7 +325,9 @@ class PipelineArgsDialog(QDialog):
     def params_extraction(self):
         """Extract parameters into a list of command-line arguments."""
         try:
-            json_content = json_read(f"{self.pipeline_info['local path']}/nextflow_schema.json")
+            json_content = NextflowAssets.get_assets().pipeline_schema(self.pipeline_name)
+            if json_content is None:
+                json_content = json_read(f"{self.pipeline_info['local path']}/nextflow_schema.json")
             self.params_list = json_content.get("definitions", {})
             if "$defs" in json_content.keys():
                 self.params_list = json_content.get("$defs", {})
@@ -0,0 +1,391 @@
+import csv
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+from src.utils.fileops.file_handle import ensure_directory, write_to_file, append_to_file
+from src.utils.remote.job import JobUnreachable, RemoteJob
+from src.utils.remote.retrieve import DEFAULT_EXCLUDE, RetrievalError, fetch_results
+from src.utils.remote.session_manager import SSHSessionManager
+from src.utils.remote.staging import RemoteStager
+from src.utils.remote.transfer import DEFAULT_TRANSFERS, TransferCancelled
+from src.utils.run_index import RunIndex, RUN_QUEUED, RUN_RUNNING, RUN_FAILED
+
+logger = OmixForgeLogger.get_logger()
+
+
+def samplesheet_update_script(remote_sample_sheet: str, remote_base: str, path_mapping) -> str:
+    """Return the Python script that rewrites the sample sheet's fastq paths on the server.
+
+    Parameters
+    ----------
+    remote_sample_sheet : str
+        Sample sheet path on the server.
+    remote_base : str
+        Run directory on the server.
+    path_mapping : list of tuple
+        (local path, remote path) of each staged data file.
+    """
+    return f"""#!/usr/bin/env python3
+import csv
+import sys
+
+sample_sheet = "{remote_sample_sheet}"
+remote_base = "{remote_base}"
+
+# Mapping of original paths to remote paths
+path_mapping = {{
+{chr(10).join([f'    "{local}": "{remote}",' for local, remote in path_mapping])}
+}}
+
+try:
+    # Read sample sheet
+    with open(sample_sheet, 'r') as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+        fieldnames = reader.fieldnames
+
+    # Update paths
+    for row in rows:
+        for key in row:
+            if key.startswith('fastq') and row[key]:
+                if row[key] in path_mapping:
+                    row[key] = path_mapping[row[key]]
+
+    # Write updated sample sheet back
+    with open(sample_sheet, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"Updated sample sheet: {{sample_sheet}}")
+except Exception as e:
+    print(f"Error updating sample sheet: {{e}}", file=sys.stderr)
+    sys.exit(1)
+"""
+
+
+class RemotePipelineWorker(QObject):
+    """Worker to run pipeline on remote server asynchronously."""
+    
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(bool, str)  # success, message
+    error = pyqtSignal(str)
+    unreachable = pyqtSignal(str)  # lost the server; the job is left running there
+    job_started = pyqtSignal(int)  # PID of the detached pipeline on the server
+    log_offset = pyqtSignal(int)  # bytes of the remote log written to the local log
+
+    def __init__(self, pipeline, run_dir, config, ssh_server, run_name, pipelines_runs_dir, run_dir_base, max_transfers=DEFAULT_TRANSFERS,
+                 fetch_pipeline_info=False, attach_pid=None, log_offset=0):
+        super().__init__()
+        self.max_transfers = max_transfers
+        self.fetch_pipeline_info = fetch_pipeline_info
+        # Set when resuming a job that is already running on the server
+        self.attach_pid = attach_pid
+        self.log_offset_start = log_offset
+        self._job = None
+        self._stager = None
+        self._stopped = False
+        self.pipeline = pipeline
+        self.run_dir = run_dir
+        self.config = config
+        self.ssh_server = ssh_server
+        self.run_name = run_name
+        self.pipelines_runs_dir = pipelines_runs_dir
+        self.run_dir_base = run_dir_base
+
+    @classmethod
+    def from_job(cls, job: dict):
+        """Create a worker for a job record of the RemoteJobScheduler."""
+        return cls(job["pipeline"], job["run_dir"], job["config"], job["ssh_server"], job["run_name"],
+                   job["pipelines_runs_dir"], job["run_dir_base"], max_transfers=job.get("max_transfers", DEFAULT_TRANSFERS),
+                   fetch_pipeline_info=job.get("fetch_pipeline_info", False),
+                   attach_pid=job.get("pid"), log_offset=job.get("offset", 0))
+
+    def stop(self):
+        """Stop following the remote job without ending it, e.g. on shutdown.
+
+        A submission still staging its inputs is cancelled before the job starts.
+        """
+        self._stopped = True
+        if self._stager is not None:
+            self._stager.cancel()
+        if self._job is not None:
+            self._job.detach()
+
+    def run(self):
+        run_index = RunIndex.get_index()
+        # remote directory named after the run, without the .txt extension
+        remote_base = f"/tmp/omixforge_runs/{self.run_name.replace(' ', '_').replace('.txt', '')}"
+        local_log = f"{self.pipelines_runs_dir}/{self.run_name}"
+        try:
+            manager = SSHSessionManager.get_manager()
+            if self.attach_pid is None:
+                job = self._submit(manager, remote_base, local_log)
+                self.job_started.emit(job.pid)
+            else:
+                # The job kept running on the server while the app was closed
+                self.progress.emit(f"Re-attaching to {self.ssh_server.get('host')}...")
+                try:
+                    session = manager.connection(self.ssh_server)
+                except ConnectionError as e:
+                    raise JobUnreachable(str(e)) from e
+                job = RemoteJob(session, remote_base, pid=self.attach_pid, offset=self.log_offset_start)
+                append_to_file(local_log, f"Re-attached to remote pipeline (PID {job.pid})\n")
+            self._job = job
+            if self._stopped:
+                return
+            session = job.session
+            host = session.host
+            remote_log = job.log_path
+
+            # Stream the remote log as it is written
+            pending = bytearray()
+
+            def on_log_data(data):
+                pending.extend(data)
+                end = pending.rfind(b"\n") + 1
+                if not end:
+                    return
+                text = pending[:end].decode("utf-8", errors="replace")
+                del pending[:end]
+                for line in text.splitlines():
+                    if line.strip():
+                        self.progress.emit(f"Remote: {line}")
+                append_to_file(local_log, text)
+                self.log_offset.emit(job.offset - len(pending))
+
+            if not job.follow(on_log_data, reconnect=lambda: manager.connection(self.ssh_server)):
+                # Detached on shutdown; the job is picked up again on the next start
+                return
+            if pending:
+                append_to_file(local_log, pending.decode("utf-8", errors="replace") + "\n")
+
+            return_code = job.exit_code()
+            if return_code is None:
+                return_code = 1
+
+            # Check if pipeline succeeded
+            if return_code != 0:
+                error_msg = f"Remote run failed <<exit-code:{return_code}>>"
+                append_to_file(local_log, f"Error: {error_msg}\n")
+                raise RuntimeError(error_msg)
+
+            self.progress.emit("Syncing results back to local...")
+            append_to_file(local_log, "Syncing results back to local...\n")
+            manager.connection(self.ssh_server)
+            # fetch the published results (not work/) as one verified tar stream
+            exclude = () if self.fetch_pipeline_info else DEFAULT_EXCLUDE
+            fetch_code = 0
+            try:
+                fetched = fetch_results(session, remote_base, self.run_dir, exclude=exclude, progress=self.progress.emit)
+                append_to_file(local_log, f"Fetched {fetched} result file(s) from {host}\n")
+            except RetrievalError as exc:
+                fetch_code = 1
+                append_to_file(local_log, f"Warning: Failed to sync results: {exc}\n")
+                logger.warning(f"Failed to sync remote results: {exc}")
+
+            # The remote log was streamed into local_log while the job ran
+            append_to_file(local_log, f"Remote job finished, log fetched from {host}:{remote_log} <<exit-code:{fetch_code}>>\n")
+            run_index.record_exit(self.run_name, fetch_code)
+            self.finished.emit(True, f"Pipeline finished successfully on {host}")
+            
+        except TransferCancelled:
+            # Stopped while staging; the scheduler submits the run again on the next start
+            append_to_file(local_log, "Staging cancelled, the run will be submitted again on the next start\n")
+            run_index.record(self.run_name, RUN_QUEUED)
+        except JobUnreachable as e:
+            # Not a failure: the run stays recorded as running and is re-attached later
+            append_to_file(local_log, f"Lost connection to the server, will re-attach: {e}\n")
+            self.unreachable.emit(str(e))
+        except Exception as e:
+            run_index.record(self.run_name, RUN_FAILED, 1)
+            self.error.emit(str(e))
+
+    def _submit(self, manager, remote_base, local_log):
+        """Stage the inputs on the server and start the pipeline there.
+
+        Returns
+        -------
+        RemoteJob
+            The started job.
+        """
+        run_index = RunIndex.get_index()
+        # ensure local run_dir exists and config stored
+        ensure_directory([str(self.run_dir), self.pipelines_runs_dir])
+        config_file = f"{self.run_dir}/params.json"
+        with open(config_file, 'w') as f:
+            json.dump(self.config, f, indent=2)
+
+        # Create initial log file
+        write_to_file(local_log, f"Remote pipeline submission started for {self.pipeline} on {self.ssh_server.get('host')}\n")
+        run_index.record(self.run_name, RUN_RUNNING)
+
+        # All remote steps run as channels of the server's shared connection
+        self.progress.emit(f"Connecting to {self.ssh_server.get('host')}...")
+        session = manager.connection(self.ssh_server)
+        host = session.host
+        user = session.user
+
+        sample_sheet = self.config.get('input')
+        if not sample_sheet:
+            raise ValueError("Sample sheet path missing")
+
+        self.progress.emit("Creating remote directory...")
+        append_to_file(local_log, "Creating remote directory...\n")
+        # create remote directory
+        proc = session.run(f"mkdir -p {remote_base}")
+        if proc.returncode != 0:
+            append_to_file(local_log, f"Error: Failed to create remote directory <<exit-code:1>>: {proc.stderr}\n")
+            raise RuntimeError(f"Failed to create remote dir: {proc.stderr}")
+
+        self.progress.emit("Copying sample sheet...")
+        append_to_file(local_log, "Copying sample sheet...\n")
+        # copy sample sheet
+        sample_sheet_name = Path(sample_sheet).name
+        remote_sample_sheet = f"{remote_base}/{sample_sheet_name}"
+        proc = session.upload(sample_sheet, remote_sample_sheet)
+        if proc.returncode != 0:
+            append_to_file(local_log, f"Error: Failed to copy sample sheet <<exit-code:1>>: {proc.stderr}\n")
+            raise RuntimeError(f"Failed to copy sample sheet: {proc.stderr}")
+
+        # Collect data files and their remote paths for remote path replacement
+        self.progress.emit("Copying data files to remote...")
+        append_to_file(local_log, "Copying data files to remote...\n")
+        data_files_copied = []
+        with open(sample_sheet, 'r') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                for key, value in row.items():
+                    if key.startswith('fastq') and value:
+                        file_path = Path(value).expanduser()
+                        if file_path.exists():
+                            remote_file = f"{remote_base}/{file_path.name}"
+                            append_to_file(local_log, f"Copying data file: {file_path} -> {remote_file}\n")
+                            data_files_copied.append((str(file_path), remote_file))
+                        else:
+                            error_msg = f"Data file not found: {file_path}"
+                            append_to_file(local_log, f"Warning: {error_msg}\n")
+                            logger.warning(error_msg)
+
+        # Stage them in the server's cache (sending only what it lacks) and link them into the run dir
+        self._stager = RemoteStager(session, self.max_transfers)
+        if self._stopped:
+            self._stager.cancel()
+        try:
+            reused = self._stager.stage(data_files_copied, progress=self.progress.emit)
+        except TransferCancelled:
+            raise
+        except RuntimeError as exc:
+            append_to_file(local_log, f"Error: {exc}\n")
+            raise
+        if reused:
+            append_to_file(local_log, f"Reused {len(reused)} data file(s) already staged on {host}\n")
+
+        # Create remote script to update sample sheet paths on the server
+        self.progress.emit("Updating sample sheet paths on remote server...")
+        append_to_file(local_log, "Updating sample sheet paths on remote server...\n")
+        remote_script = f"{remote_base}/update_samplesheet.py"
+        script_content = samplesheet_update_script(remote_sample_sheet, remote_base, data_files_copied)
+        
+        # Write script to local temp location and copy to remote
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.py') as tmp:
+            tmp.write(script_content)
+            tmp_script_path = tmp.name
+        
+        try:
+            proc = session.upload(tmp_script_path, remote_script)
+            if proc.returncode != 0:
+                append_to_file(local_log, f"Error: Failed to copy update script <<exit-code:1>>: {proc.stderr}\n")
+                raise RuntimeError(f"Failed to copy update script: {proc.stderr}")
+            
+            # Execute remote script
+            proc = session.run(f"python3 {remote_script}")
+            if proc.returncode != 0:
+                error_msg = f"Failed to update sample sheet on remote: {proc.stderr}"
+                append_to_file(local_log, f"Error: <<exit-code:1>> {error_msg}\n")
+                raise RuntimeError(error_msg)
+            append_to_file(local_log, f"Remote script output: {proc.stdout}\n")
+        finally:
+            # Clean up temp script
+            try:
+                Path(tmp_script_path).unlink()
+            except Exception:
+                pass
+
+        # Update config with remote paths
+        self.config['input'] = remote_sample_sheet
+        # Published results go to their own folder, apart from Nextflow's work/
+        self.config['outdir'] = f"{remote_base}/results"
+
+        self.progress.emit("Copying pipeline config...")
+        append_to_file(local_log, "Copying pipeline config...\n")
+        # rewrite config with updated paths and copy to remote
+        with open(config_file, 'w') as f:
+            json.dump(self.config, f, indent=2)
+        proc = session.upload(config_file, f"{remote_base}/params.json")
+        if proc.returncode != 0:
+            append_to_file(local_log, f"Error: Failed to copy updated config <<exit-code:1>>: {proc.stderr}\n")
+            raise RuntimeError(f"Failed to copy updated config: {proc.stderr}")
+
+        # Copy pipeline directory to remote nextflow assets
+        pipeline_local_dir = Path.home() / ".nextflow" / "assets" / self.pipeline
+        logger.info(f"Looking for local pipeline directory at: {pipeline_local_dir}")
+        if pipeline_local_dir.exists():
+            self.progress.emit("Copying pipeline directory...")
+            append_to_file(local_log, "Copying pipeline directory...\n")
+
+            # Get the assets base directory
+            assets_base = Path.home() / ".nextflow" / "assets"
+            
+            # Remote paths - use explicit expansion
+            remote_assets_base = f"/home/{user}/.nextflow/assets"
+            remote_pipeline_dir = f"{remote_assets_base}/{self.pipeline}"
+            
+            # Create remote directory structure
+            proc = session.run(f"mkdir -p {remote_assets_base}")
+            if proc.returncode != 0:
+                append_to_file(local_log, f"Warning: Failed to create remote nextflow assets dir : {proc.stderr}\n")
+
+            try:
+                # Use tar to copy with git directory preserved
+                # Tar from assets base directory to preserve the full pipeline path (e.g., nf-core/demo)
+                tar_proc = subprocess.run(
+                    ["tar", "-C", str(assets_base), "-czf", "-", self.pipeline],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+                if tar_proc.returncode != 0:
+                    raise RuntimeError(tar_proc.stderr.decode("utf-8", errors="ignore") or "tar failed")
+
+                # Extract on remote in assets base directory to recreate full structure
+                ssh_proc = session.run(
+                    f"mkdir -p {remote_assets_base} && cd {remote_assets_base} && tar -xzf -",
+                    input=tar_proc.stdout,
+                    text=False,
+                )
+                if ssh_proc.returncode != 0:
+                    raise RuntimeError(ssh_proc.stderr.decode("utf-8", errors="ignore") or "remote tar extract failed")
+                
+                logger.info(f"Successfully copied pipeline to {remote_pipeline_dir} via tar/ssh")
+                append_to_file(local_log, f"Successfully copied pipeline to {remote_pipeline_dir} via tar/ssh\n")
+            except Exception as exc:
+                append_to_file(local_log, f"Warning: Failed to copy pipeline dir: {exc}\n")
+                logger.warning(f"Failed to copy pipeline dir: {exc}")
+
+        if self._stopped:
+            raise TransferCancelled("Stopped before the remote pipeline was started")
+        self.progress.emit("Starting remote pipeline...")
+        append_to_file(local_log, "Starting remote pipeline...\n")
+        # run pipeline remotely and save remote logs
+        nextflow_cmd = f"bash -l -c 'nextflow run {self.pipeline} -profile docker -params-file params.json'"
+
+        # Start the pipeline detached, so it does not depend on this connection
+        job = RemoteJob(session, remote_base)
+        pid = job.start(nextflow_cmd)
+        append_to_file(local_log, f"Remote pipeline started with PID {pid}\n")
+        return job
@@ -4,6 +4,7 @@ from src.assets.stylesheet import close_btn_red_bg
 from src.utils.logger_module.omix_logger import OmixForgeLogger
 from src.utils.constants import PIPELINE_DIR, CONFIG_FILE
 from src.utils.fileops.file_handle import list_files_in_directory, json_read, file_exists
+from src.utils.fileops.dir_watcher import DirectoryWatcher
 from src.utils.widgets.filetree import FilesTreeWidget
 from src.utils.resource import resource_path
 logger = OmixForgeLogger.get_logger()
@@ -98,11 +99,10 @@ class PipelineEditorTab(QWidget):
 
         self.render_cards()
 
-        # Periodic refresh
-        self._refresh_timer = QTimer(self)
-        self._refresh_timer.setInterval(2000)
-        self._refresh_timer.timeout.connect(self._periodic_refresh)
-        self._refresh_timer.start()
+        # Refresh on filesystem events while the page is visible
+        self._dir_watch = DirectoryWatcher.get_watcher().subscribe(
+            [self.PIPELINE_DIR], self._periodic_refresh, owner=self, active=False
+        )
 
 
     def get_local_pipelines_status(self):
@@ -229,3 +229,11 @@ class PipelineEditorTab(QWidget):
             self.render_cards()
         except Exception:
             pass
+
+    def showEvent(self, event):
+        DirectoryWatcher.get_watcher().resume(self._dir_watch)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        DirectoryWatcher.get_watcher().pause(self._dir_watch)
+        super().hideEvent(event)
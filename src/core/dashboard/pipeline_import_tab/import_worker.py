@@ -1,4 +1,5 @@
 from PyQt6.QtCore import  QObject, pyqtSignal
+from src.utils.nextflow_assets import NextflowAssets
 from src.utils.subcommands.shell import run_shell_command
 from src.utils.logger_module.omix_logger import OmixForgeLogger
 
@@ -25,8 +26,7 @@ class PipelineImportWorker(QObject):
         """Import pipeline from nf-core repository."""
         try:
             # Check if pipeline already exists
-            pipeline_exist  = run_shell_command("nextflow list")
-            if self.pipeline_name in pipeline_exist.stdout:
+            if f"nf-core/{self.pipeline_name}" in NextflowAssets.get_assets().list_pipelines():
                 self.import_ready.emit(False, "Pipeline already exists locally")
                 return
             
@@ -1,9 +1,10 @@
-from PyQt6.QtWidgets import QLabel, QWidget, QVBoxLayout, QComboBox, QScrollArea, QSizePolicy, QPushButton
+from PyQt6.QtWidgets import QLabel, QWidget, QVBoxLayout, QComboBox, QScrollArea, QSizePolicy, QPushButton, QLineEdit
 from PyQt6.QtCore import QThread, QObject, pyqtSignal, Qt
 from pyqtwaitingspinner import WaitingSpinner
 
 
 from src.utils.logger_module.omix_logger import OmixForgeLogger
+from src.utils.nfcore_utils import PipelineCatalog
 from src.core.dashboard.pipeline_import_tab.import_worker import PipelineImportWorker
 from src.core.dashboard.pipeline_import_tab.refresh_worker import PipelineRefreshWorker
 
@@ -29,7 +30,7 @@ class PipelineImport(QWidget):
         """
         super().__init__(parent)
 
-        self.pipelines = []
+        self.pipelines = PipelineCatalog()
         
         # Worker threads for async operations
         self.refresh_worker = None
@@ -58,6 +59,13 @@ class PipelineImport(QWidget):
         self.btn.setObjectName("refersh_pipeline")
         self.content_layout.addWidget(self.btn)
 
+        # Search bar, filters the combo box as the user types
+        self.search_input = QLineEdit(parent=self.content)
+        self.search_input.setPlaceholderText("Search pipelines by name, topic or description...")
+        self.search_input.setObjectName("search_pipelines")
+        self.search_input.textChanged.connect(self.filter_pipelines)
+        self.content_layout.addWidget(self.search_input)
+
         # Combo box
         self.combobox = QComboBox(parent=self.content)
         self.combobox.setObjectName("select_pipelines_box")
@@ -108,7 +116,7 @@ class PipelineImport(QWidget):
         self.refresh_spinner = WaitingSpinner(self.content)
         self.refresh_spinner.start()
         self.active_refresh_spinner = self.refresh_spinner  # Track as active
-        self.content_layout.insertWidget(3, self.refresh_spinner)
+        self.content_layout.insertWidget(4, self.refresh_spinner)
         
         # Create worker thread
         self.refresh_worker = PipelineRefreshWorker()
@@ -147,8 +155,7 @@ class PipelineImport(QWidget):
         
         # Update combo
         self.combobox.clear()
-        for pipeline in self.pipelines:
-            self.combobox.addItem(pipeline.name)
+        self.filter_pipelines(self.search_input.text())
         
         self.btn.setText("Refresh Pipelines")
         self.btn.setEnabled(True)
@@ -177,6 +184,23 @@ class PipelineImport(QWidget):
         self.btn.setEnabled(True)
         logger.error(f"Error refreshing pipelines: {error_msg}")
 
+    def filter_pipelines(self, text: str):
+        """Show the pipelines matching the search text in the combo box, best match first."""
+        names = self.pipelines.search(text)
+        selected = self.combobox.currentText()
+        if names == [self.combobox.itemText(i) for i in range(self.combobox.count())]:
+            return
+
+        # The selection is restored without rebuilding its details when it is still listed
+        self.combobox.blockSignals(True)
+        self.combobox.clear()
+        self.combobox.addItems(names)
+        if selected in names:
+            self.combobox.setCurrentIndex(names.index(selected))
+        self.combobox.blockSignals(False)
+        if self.combobox.currentText() != selected:
+            self.current_text(self.combobox.currentIndex())
+
     def current_text(self, _):  # We receive the index, but don't use it.
         # Clear previous detail widgets so new selection doesn't duplicate
         self.clear_details()
@@ -186,35 +210,34 @@ class PipelineImport(QWidget):
             # nothing selected -> show nothing
             return
 
-        for pipeline in self.pipelines:
-            if pipeline.name == ctext:
-                # create and track detail labels so we can clear them later
-                self.pipeline_name = QLabel(f"Name: {pipeline.name}")
-                self.full_name = QLabel(f"Full Name: {pipeline.full_name}")
-                self.description = QLabel(f"Description: {pipeline.description}")
-                self.description.setWordWrap(True)
-                self.topics = QLabel(f"Topics: {', '.join(pipeline.topics)}")
-                self.topics.setWordWrap(True)
-                self.archived = QLabel(f"Archived: {pipeline.archived}")
+        pipeline = self.pipelines.get(ctext)
+        if pipeline is None:
+            # no matching pipeline -> show nothing
+            return
 
-                self.import_btn = QPushButton("Import Pipelines", parent=self.content)
-                self.import_btn.clicked.connect(self.import_pipeline)
-                self.import_btn.setObjectName("import_selected_pipeline")
+        # create and track detail labels so we can clear them later
+        self.pipeline_name = QLabel(f"Name: {pipeline.name}")
+        self.full_name = QLabel(f"Full Name: {pipeline.full_name}")
+        self.description = QLabel(f"Description: {pipeline.description}")
+        self.description.setWordWrap(True)
+        self.topics = QLabel(f"Topics: {', '.join(pipeline.topics)}")
+        self.topics.setWordWrap(True)
+        self.archived = QLabel(f"Archived: {pipeline.archived}")
 
-                for w in (
-                    self.pipeline_name,
-                    self.full_name,
-                    self.description,
-                    self.topics,
-                    self.archived,
-                    self.import_btn
-                ):
-                    self.content_layout.addWidget(w)
-                    self.detail_widgets.append(w)
-                return
+        self.import_btn = QPushButton("Import Pipelines", parent=self.content)
+        self.import_btn.clicked.connect(self.import_pipeline)
+        self.import_btn.setObjectName("import_selected_pipeline")
 
-        # If we get here no matching pipeline found -> show nothing
-        return
+        for w in (
+            self.pipeline_name,
+            self.full_name,
+            self.description,
+            self.topics,
+            self.archived,
+            self.import_btn
+        ):
+            self.content_layout.addWidget(w)
+            self.detail_widgets.append(w)
 
     def clear_details(self):
         """Remove previously-added detail widgets from the layout and delete them."""
@@ -11,7 +11,7 @@ class PipelineRefreshWorker(QObject):
     
     finished = pyqtSignal()
     error = pyqtSignal(str)
-    pipelines_ready = pyqtSignal(list)
+    pipelines_ready = pyqtSignal(object)  # PipelineCatalog
     
     def run(self):
         """Fetch pipelines from nf-core."""
@@ -1,7 +1,8 @@
+import threading
 
-from src.utils.constants import INITIATE_CACHE_JSON, CONFIG_DIR, CONFIG_FILE, populate_constants
+from src.utils.constants import CONFIG_FILE, populate_constants
+from src.utils.catalog_cache import CatalogCache
 from src.utils.nfcore_utils import NfcoreUtils
-from src.utils.fileops.file_handle import  json_write, ensure_directory
 from src.utils.logger_module.omix_logger import OmixForgeLogger
 
 logger = OmixForgeLogger.get_logger()
@@ -10,23 +11,39 @@ class InitiateApp:
     def __init__(self):
         """Initialize the application with system checks and configuration loading."""
         self.load_json_data() 
-        self.docker_installed = self.check_docker_installed()
-        self.nextflow_installed = self.check_nextflow_installed()     
+        # Environment probes run alongside window construction; the results are awaited on first use
+        self._probes = threading.Thread(target=self._run_probes, name="environment-probes", daemon=True)
+        self._probes.start()
         self.constants = populate_constants(CONFIG_FILE)  
 
+    def _run_probes(self):
+        self._docker_installed = self.check_docker_installed()
+        self._nextflow_installed = self.check_nextflow_installed()
+
+    @property
+    def docker_installed(self) -> bool:
+        self._probes.join()
+        return self._docker_installed
+
+    @property
+    def nextflow_installed(self) -> bool:
+        self._probes.join()
+        return self._nextflow_installed
+
     
     def load_json_data(self):
-        """Load and cache JSON pipeline data from nfcore API."""
+        """Load the cached nf-core pipeline catalog and refresh it in the background."""
         logger.info("Loading initiate cache JSON data.")
         self.nfcore_utils = NfcoreUtils()
-        self.cache_json_data = self.nfcore_utils.get_pipelines_json()
+        cache = CatalogCache.get_cache()
+        # Startup never waits on nf-co.re; a stale or missing catalog is fetched behind the UI
+        self.cache_json_data = cache.load()
+        if not cache.is_fresh():
+            cache.refresh_in_background()
         if self.cache_json_data:
             logger.info("Successfully loaded initiate cache JSON data.")
-            ensure_directory(CONFIG_DIR)
-            json_write(INITIATE_CACHE_JSON, self.cache_json_data)
         else:
-            logger.error("Failed to load initiate cache JSON data.")
-            return None
+            logger.info("No cached nf-core catalog yet; fetching it in the background.")
         
     def check_docker_installed(self) -> bool:
         """Check if Docker is installed on the system."""
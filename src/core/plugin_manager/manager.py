@@ -80,6 +80,9 @@ class PluginManager:
         RuntimeError
             If plugin class is missing or doesn't inherit PluginBase.
         """
+        # The libraries plugins may use are imported with the first plugin, not at startup
+        import src.core.plugin_manager.plugin_installer_tabs.lib_imports  # noqa: F401
+
         spec = importlib.util.spec_from_file_location(path.stem, path)
         module = importlib.util.module_from_spec(spec)
         sys.modules[path.stem] = module
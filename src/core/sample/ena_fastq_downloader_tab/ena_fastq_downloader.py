@@ -404,7 +404,7 @@ class ENAFastqDownloader(QWidget):
         # Update fixed progress bar
         self.fetch_progress_bar.setMaximum(total)
         self.fetch_progress_bar.setValue(current)
-        self.fetch_status_label.setText(f"Fetching accession {current}/{total}...")
+        self.fetch_status_label.setText(f"Resolved {current}/{total} accessions...")
     
     def _on_fetch_complete(self, successful_results, failed_accessions):
         """Handle fetch completion."""
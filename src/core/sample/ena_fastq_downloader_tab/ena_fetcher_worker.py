@@ -1,10 +1,8 @@
 """Worker thread for fetching accession data from ENA API."""
 
-import requests
-import json
 from PyQt6.QtCore import QObject, pyqtSignal
 from src.utils.logger_module.omix_logger import OmixForgeLogger
-from src.utils.constants import BASE_EBI_URL, FIELDS
+from src.utils.ena_resolver import ENAResolver
 
 logger = OmixForgeLogger.get_logger()
 
@@ -14,7 +12,7 @@ class ENAFetcherWorker(QObject):
     
     finished = pyqtSignal()
     error = pyqtSignal(str)
-    fetch_progress = pyqtSignal(int, int)  # current, total
+    fetch_progress = pyqtSignal(int, int)  # resolved, total
     result_ready = pyqtSignal(list, list)  # successful_results, failed_accessions
     
     def __init__(self, accessions):
@@ -26,69 +24,30 @@ class ENAFetcherWorker(QObject):
             List of accession numbers (e.g., ['SRR10376955', 'SRR10376956'])
         """
         super().__init__()
-        self.accessions = [acc.strip() for acc in accessions if acc.strip()]
+        # Duplicates are resolved once
+        self.accessions = list(dict.fromkeys(acc.strip() for acc in accessions if acc.strip()))
     
     def run(self):
         """Fetch data for all accessions from ENA API."""
+        resolver = ENAResolver()
         try:
-            successful_results = []
-            failed_accessions = []
-            
-            total = len(self.accessions)
-            
-            for idx, accession in enumerate(self.accessions):
-                try:
-                    self.fetch_progress.emit(idx + 1, total)
-                    
-                    # Build URL with single accession
-                    url = f"{BASE_EBI_URL}?accession={accession}&result=read_run&fields={FIELDS}&format=json&download=true&limit=0"
-                    
-                    logger.info(f"Fetching data for accession: {accession}")
-                    response = requests.get(url, timeout=30)
-                    response.raise_for_status()
-                    
-                    # Parse JSON response
-                    data = response.json()
-                    
-                    if data and isinstance(data, list) and len(data) > 0:
-                        # Extract FTP URLs
-                        for record in data:
-                            successful_results.append({
-                                'accession': accession,
-                                'data': record,
-                                'fastq_urls': self._extract_ftp_urls(record)
-                            })
-                        logger.info(f"Successfully fetched data for {accession}")
-                    else:
-                        logger.warning(f"No data returned for accession: {accession}")
-                        failed_accessions.append((accession, "No data returned from API"))
-                        
-                except requests.exceptions.Timeout:
-                    error_msg = f"Request timeout for {accession}"
-                    logger.warning(error_msg)
-                    failed_accessions.append((accession, error_msg))
-                    
-                except requests.exceptions.HTTPError as e:
-                    error_msg = f"HTTP Error {e.response.status_code} for {accession}"
-                    logger.warning(error_msg)
-                    failed_accessions.append((accession, error_msg))
-                    
-                except json.JSONDecodeError as e:
-                    error_msg = f"Invalid JSON response for {accession}"
-                    logger.warning(error_msg)
-                    failed_accessions.append((accession, error_msg))
-                    
-                except Exception as e:
-                    error_msg = f"Error fetching {accession}: {str(e)}"
-                    logger.error(error_msg)
-                    failed_accessions.append((accession, error_msg))
-            
+            self.fetch_progress.emit(0, len(self.accessions))
+            records, failed_accessions = resolver.resolve(self.accessions, self.fetch_progress.emit)
+
+            successful_results = [{
+                'accession': accession,
+                'data': record,
+                'fastq_urls': self._extract_ftp_urls(record)
+            } for accession, record in records]
+            logger.info(f"Resolved {len(successful_results)} runs from {len(self.accessions)} accessions")
+
             self.result_ready.emit(successful_results, failed_accessions)
             
         except Exception as e:
             logger.error(f"Fatal error in fetcher worker: {e}")
             self.error.emit(str(e))
         finally:
+            resolver.close()
             self.finished.emit()
     
     def _extract_ftp_urls(self, record):
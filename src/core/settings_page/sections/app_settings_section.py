@@ -1,15 +1,87 @@
-from PyQt6.QtWidgets import QCheckBox
+from PyQt6.QtWidgets import QCheckBox, QComboBox, QHBoxLayout, QLabel, QSpinBox
 from src.core.settings_page.sections.section_base import SettingsSection
+from src.utils.fileops.archive_codec import DEFAULT_ARCHIVE_CODEC, available_codecs
+from src.utils.local_scheduler import host_cpus, host_memory_gb
+from src.utils.remote.transfer import DEFAULT_TRANSFERS
+from src.utils.work_cache import DEFAULT_WORK_CACHE_GB
+
+RESOURCE_KEYS = ("local_cpus", "local_memory_gb", "run_cpus", "run_memory_gb")
 
 
 class AppSettingsSection(SettingsSection):
     def __init__(self):
         super().__init__("Application Settings")
 
-        self.auto_update = QCheckBox("Enable auto updates")
-        self.dark_mode = QCheckBox("Enable dark mode")
-        self.confirm_exit = QCheckBox("Confirm before exit")
+        # Keys without a widget here (e.g. run_log_sample) are kept as loaded
+        self._data = {}
+
+        row = QHBoxLayout()
+        row.addWidget(QLabel("Run archive compression"))
+        self.archive_codec = QComboBox()
+        self.archive_codec.setObjectName("archive_codec")
+        for codec in available_codecs():
+            self.archive_codec.addItem(codec)
+        self.archive_codec.setCurrentText(DEFAULT_ARCHIVE_CODEC)
+        row.addWidget(self.archive_codec)
+        row.addStretch()
+        self.layout.addLayout(row)
+
+        row = QHBoxLayout()
+        row.addWidget(QLabel("Parallel transfers to remote servers"))
+        self.remote_transfers = QSpinBox()
+        self.remote_transfers.setObjectName("remote_transfers")
+        self.remote_transfers.setRange(1, 32)
+        self.remote_transfers.setValue(DEFAULT_TRANSFERS)
+        row.addWidget(self.remote_transfers)
+        row.addStretch()
+        self.layout.addLayout(row)
+
+        # Budget shared by local runs and the share each run is granted; 0 means automatic
+        for key, label, maximum in zip(RESOURCE_KEYS, (
+            "CPUs for local runs", "Memory for local runs (GB)", "CPUs per local run", "Memory per local run (GB)"
+        ), (host_cpus(), host_memory_gb()) * 2):
+            row = QHBoxLayout()
+            row.addWidget(QLabel(label))
+            spin = QSpinBox()
+            spin.setObjectName(key)
+            spin.setRange(0, maximum)
+            spin.setSpecialValueText("Auto")
+            setattr(self, key, spin)
+            row.addWidget(spin)
+            row.addStretch()
+            self.layout.addLayout(row)
+
+        row = QHBoxLayout()
+        row.addWidget(QLabel("Disk for cached work directories (GB)"))
+        self.work_cache_gb = QSpinBox()
+        self.work_cache_gb.setObjectName("work_cache_gb")
+        self.work_cache_gb.setRange(1, 100000)
+        self.work_cache_gb.setValue(DEFAULT_WORK_CACHE_GB)
+        row.addWidget(self.work_cache_gb)
+        row.addStretch()
+        self.layout.addLayout(row)
+
+        self.remote_fetch_pipeline_info = QCheckBox("Fetch pipeline_info reports from remote runs")
+        self.remote_fetch_pipeline_info.setObjectName("remote_fetch_pipeline_info")
+        self.layout.addWidget(self.remote_fetch_pipeline_info)
+
+    def get_settings(self):
+        return {
+            **self._data,
+            "archive_codec": self.archive_codec.currentText(),
+            "remote_transfers": self.remote_transfers.value(),
+            "remote_fetch_pipeline_info": self.remote_fetch_pipeline_info.isChecked(),
+            "work_cache_gb": self.work_cache_gb.value(),
+            **{key: getattr(self, key).value() for key in RESOURCE_KEYS},
+        }
 
-        self.layout.addWidget(self.auto_update)
-        self.layout.addWidget(self.dark_mode)
-        self.layout.addWidget(self.confirm_exit)
+    def load_settings(self, data):
+        self._data = dict(data)
+        codec = data.get("archive_codec", DEFAULT_ARCHIVE_CODEC)
+        if codec in available_codecs():
+            self.archive_codec.setCurrentText(codec)
+        self.remote_transfers.setValue(int(data.get("remote_transfers", DEFAULT_TRANSFERS)))
+        self.remote_fetch_pipeline_info.setChecked(bool(data.get("remote_fetch_pipeline_info", False)))
+        self.work_cache_gb.setValue(int(data.get("work_cache_gb", DEFAULT_WORK_CACHE_GB)))
+        for key in RESOURCE_KEYS:
+            getattr(self, key).setValue(int(data.get(key, 0)))
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QFileDialog, QLabel
 )
 from src.core.settings_page.sections.section_base import SettingsSection
+from src.utils.remote.scheduler import DEFAULT_MAX_RUNS
 
 
 class ServerConfigWidget(QWidget):
@@ -22,6 +23,9 @@ class ServerConfigWidget(QWidget):
         self.username_edit.setPlaceholderText("Username")
         self.key_edit = QLineEdit()
         self.key_edit.setPlaceholderText("Key Path")
+        self.max_runs_edit = QLineEdit()
+        self.max_runs_edit.setPlaceholderText(str(DEFAULT_MAX_RUNS))
+        self.max_runs_edit.setToolTip("Pipeline runs allowed at the same time on this server; more are queued")
 
         browse = QPushButton("Browse")
         browse.clicked.connect(self._browse_key)
@@ -38,6 +42,8 @@ class ServerConfigWidget(QWidget):
         layout.addWidget(self.username_edit)
         layout.addWidget(QLabel("Key:"))
         layout.addWidget(self.key_edit)
+        layout.addWidget(QLabel("Max runs:"))
+        layout.addWidget(self.max_runs_edit)
         layout.addWidget(browse)
         layout.addWidget(remove)
 
@@ -52,12 +58,15 @@ class ServerConfigWidget(QWidget):
     def get_config(self):
         port_text = self.port_edit.text()
         port = int(port_text) if port_text else ""
+        max_runs_text = self.max_runs_edit.text().strip()
+        max_runs = int(max_runs_text) if max_runs_text.isdigit() else ""
         return {
             "name": self.name_edit.text().strip(),
             "host": self.host_edit.text().strip(),
             "port": port,
             "username": self.username_edit.text().strip(),
-            "key_path": self.key_edit.text().strip()
+            "key_path": self.key_edit.text().strip(),
+            "max_runs": max_runs
         }
 
 
@@ -94,5 +103,6 @@ class ServerSettingsSection(SettingsSection):
             server.port_edit.setText(str(server_data.get("port", "")))
             server.username_edit.setText(server_data.get("username", ""))
             server.key_edit.setText(server_data.get("key_path", ""))
+            server.max_runs_edit.setText(str(server_data.get("max_runs", "")))
 
         
\ No newline at end of file
@@ -26,9 +26,9 @@ class SettingsPage(QWidget):
 
         layout.addWidget(self.folder_section)
         layout.addWidget(self.server_section)
+        layout.addWidget(self.app_section)
         # TBD
         # layout.addWidget(self.profile_section)
-        # layout.addWidget(self.app_section)
         layout.addStretch()
 
         # Buttons
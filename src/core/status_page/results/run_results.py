@@ -3,14 +3,20 @@ from pathlib import Path
 from src.assets.stylesheet import close_btn_red_bg
 from src.utils.logger_module.omix_logger import OmixForgeLogger
 from src.utils.constants import RUN_DIR, CONFIG_FILE
-from src.utils.fileops.file_handle import list_files_in_directory, delete_directory, delete_file, untar_folder, json_read, file_exists
-from src.utils.encryption.handle import generate_key, decrypt_file
+from src.utils.fileops.file_handle import list_files_in_directory, delete_directory, delete_file, json_read, file_exists
+from src.utils.fileops.dir_watcher import DirectoryWatcher
+from src.utils.encryption.handle import generate_key, decrypt_folder
+from src.utils.fileops.archive_codec import is_encrypted_archive, strip_archive_suffix
+from src.utils.encryption.archive import IndexedArchiveReader, is_indexed_archive
 from src.utils.widgets.filetree import FilesTreeWidget
 from src.utils.widgets.loading import LoadingDialog
 from src.utils.resource import resource_path
 from src.utils.widgets.credential_popup import CredentialsDialog
+from src.utils.run_index import RunIndex
 logger = OmixForgeLogger.get_logger()
 
+RESULT_FILE_EXTS = [".md", ".MD", ".txt", ".json", ".csv", ".config", ".yaml", ".yml", ".html", ".pdf", ".svg"]
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QFrame, QScrollArea,
     QHBoxLayout, QGridLayout, QPushButton, QApplication, QMessageBox, QDialog
@@ -43,9 +49,8 @@ class TarDecryptWorker(QRunnable):
                 f"{self.cred.get('user', '')}:{self.cred.get('password', '')}"
             )
 
-            decrypt_file(self.tar_name, key)
-            untar_folder( self.tar_name.replace(".enc","") ,self.run_dir)
-            delete_file(self.tar_name.replace(".enc",""))
+            # Indexed archives extract member by member, without an intermediate tarball
+            decrypt_folder(self.tar_name, self.run_dir, key)
 
             self.signals.finished.emit(self.run_name)
 
@@ -55,10 +60,11 @@ class TarDecryptWorker(QRunnable):
 class PipelineDataCard(QFrame):
     clicked = pyqtSignal(str)
 
-    def __init__(self, name: str, locked: bool = False):
+    def __init__(self, name: str, locked: bool = False, state: str = None):
         super().__init__()
         self.name = name
         self.locked = locked
+        self.state = state
 
         self.setObjectName("pipelineCard")
 
@@ -89,6 +95,12 @@ class PipelineDataCard(QFrame):
 
         layout.addStretch()
 
+        # Run state from the run index
+        if state:
+            self.state_label = QLabel(state.capitalize())
+            self.state_label.setAlignment(Qt.AlignmentFlag.AlignVCenter)
+            layout.addWidget(self.state_label)
+
         # Lock icon
         self.lock_label = QLabel()
         self.lock_label.setAlignment(Qt.AlignmentFlag.AlignVCenter)
@@ -114,6 +126,7 @@ class PipelineResultsPage(QWidget):
 
         self.pipeline_runs = []
         self.files_tree_window = None
+        self.run_index = RunIndex.get_index()
 
         self.constants = json_read(CONFIG_FILE)
         self.RUN_DIR = self.constants.get("folders",{}).get("RUN_DIR", RUN_DIR)
@@ -144,15 +157,15 @@ class PipelineResultsPage(QWidget):
 
         self.render_cards()
 
-        # Periodic refresh
-        self._refresh_timer = QTimer(self)
-        self._refresh_timer.setInterval(2000)
-        self._refresh_timer.timeout.connect(self._periodic_refresh)
-        self._refresh_timer.start()
+        # Refresh on filesystem events while the page is visible
+        self._dir_watch = DirectoryWatcher.get_watcher().subscribe(
+            [self.RUN_DIR, self.run_index.index_path], self._periodic_refresh, owner=self, active=False
+        )
 
 
     def get_local_pipelines_status(self):
-        self.pipeline_runs = list_files_in_directory(self.RUN_DIR )
+        # Archives still being written end in .part and are not listed until complete
+        self.pipeline_runs = [name for name in list_files_in_directory(self.RUN_DIR) if not name.endswith(".part")]
 
 
     def render_cards(self):
@@ -166,8 +179,9 @@ class PipelineResultsPage(QWidget):
                 item.widget().deleteLater()
 
         for name in self.pipeline_runs:
-            locked = name.endswith(".tar.gz.enc")
-            card = PipelineDataCard(name, locked)
+            locked = is_encrypted_archive(name)
+            state = self.run_index.state(f'{strip_archive_suffix(name)}.txt')
+            card = PipelineDataCard(name, locked, state)
             card.clicked.connect(self.on_card_clicked)
 
             card.setMaximumHeight(150)
@@ -203,8 +217,11 @@ class PipelineResultsPage(QWidget):
         self.details_layout.addLayout(self.action_items_top)
 
         # Open Files Tree Window
-        run_dir = f'{self.RUN_DIR}/{name.replace(".tar.gz.enc", "")}'
-        self.open_files_tree(run_dir)
+        run_dir = f'{self.RUN_DIR}/{strip_archive_suffix(name)}'
+        if is_encrypted_archive(name):
+            self.open_archive_tree(name)
+        else:
+            self.open_files_tree(run_dir)
 
         # Actions
         actions = QHBoxLayout()
@@ -217,10 +234,10 @@ class PipelineResultsPage(QWidget):
         decrept_btn.clicked.connect(lambda: self.on_decrypt_clicked(name))
 
         actions.addStretch()
-        if ".tar.gz.enc" in name:
+        if is_encrypted_archive(name):
             app = QApplication.instance()
             try:
-                if app.cred and ".tar.gz.enc" in name:
+                if app.cred and is_encrypted_archive(name):
                     actions.addWidget(decrept_btn)
                     actions.addWidget(delete_btn)
             except:
@@ -263,13 +280,41 @@ class PipelineResultsPage(QWidget):
 
         self.files_tree_window = FilesTreeWidget(
             root_dir=run_dir,
-            allowed_exts=[".md", ".MD", ".txt", ".json", ".csv", ".config", ".yaml", ".yml"],
+            allowed_exts=RESULT_FILE_EXTS,
             parent=self.details_box,
             exclude_dirs=[".nextflow", "work",]
         )
 
         self.details_layout.addWidget(self.files_tree_window)
 
+    def open_archive_tree(self, name: str):
+        """Embed the file tree of a locked run, read from its encrypted index"""
+
+        archive_path = f"{self.RUN_DIR}/{name}"
+        app = QApplication.instance()
+        cred = getattr(app, "cred", None)
+
+        # Only indexed archives can be browsed; older ones must be decrypted first
+        if not cred or not is_indexed_archive(archive_path):
+            return
+
+        try:
+            key = generate_key(f"{cred.get('user', '')}:{cred.get('password', '')}")
+            archive = IndexedArchiveReader(archive_path, key)
+        except Exception as e:
+            logger.warning(f"Cannot open archive index of {name}: {e}")
+            return
+
+        self.files_tree_window = FilesTreeWidget(
+            root_dir=strip_archive_suffix(name),
+            allowed_exts=RESULT_FILE_EXTS,
+            parent=self.details_box,
+            exclude_dirs=[".nextflow", "work",],
+            archive=archive,
+        )
+
+        self.details_layout.addWidget(self.files_tree_window)
+
     def on_decrypt_clicked(self, name: str):
         try:
             dialog = CredentialsDialog(self)
@@ -292,7 +337,7 @@ class PipelineResultsPage(QWidget):
             }
             if app.cred == cred:
                 tar_name = f"{self.RUN_DIR}/{name}"
-                run_dir = f"{self.RUN_DIR}/{name.replace('.tar.gz.enc','')}"
+                run_dir = f"{self.RUN_DIR}/{strip_archive_suffix(name)}"
 
                 self.loading_dialog = LoadingDialog(
                     message="Decrypting pipeline…",
@@ -351,7 +396,7 @@ class PipelineResultsPage(QWidget):
 
         try:
 
-            if name.endswith(".tar.gz.enc"):
+            if is_encrypted_archive(name):
                 delete_file(f"{self.RUN_DIR}/{name}")
             else:
                 delete_directory(f"{self.RUN_DIR}/{name}")
@@ -395,3 +440,11 @@ class PipelineResultsPage(QWidget):
             self.render_cards()
         except Exception:
             pass
+
+    def showEvent(self, event):
+        DirectoryWatcher.get_watcher().resume(self._dir_watch)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        DirectoryWatcher.get_watcher().pause(self._dir_watch)
+        super().hideEvent(event)
@@ -0,0 +1,159 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QRectF
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle
+
+from src.utils.fileops.log_tail import RUN_FAILED, RUN_CANCELLED, RUN_COMPLETED, RUN_QUEUED
+
+STATE_COLORS = {
+    RUN_FAILED: "#ff4c4c",      # Red for error
+    RUN_CANCELLED: "#6c70dc",
+    RUN_COMPLETED: "#4bb543",   # Green for completed
+    RUN_QUEUED: "#9e9e9e",      # Grey while waiting for a slot
+}
+DEFAULT_STATE_COLOR = "#f0ad4e"  # Yellow for running/unknown
+
+
+class RunStatusModel(QAbstractListModel):
+    """List model of pipeline runs and their states."""
+
+    StateRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._states = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._names):
+            return None
+
+        name = self._names[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return name
+        if role == RunStatusModel.StateRole:
+            return self._states.get(name)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"{name} ({self._states.get(name) or 'unknown'})"
+        return None
+
+    def update_runs(self, names: list, states: dict) -> None:
+        """Apply a new run listing, signalling only the rows that changed.
+
+        New runs are inserted at their place in names. If runs already shown
+        changed their order, the model is reset instead.
+
+        Parameters
+        ----------
+        names : list
+            Run names in display order.
+        states : dict
+            Run state keyed by run name.
+        """
+        wanted = set(names)
+
+        # Removed runs
+        for row in reversed(range(len(self._names))):
+            name = self._names[row]
+            if name not in wanted:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._names[row]
+                self._states.pop(name, None)
+                self.endRemoveRows()
+
+        # Runs that moved relative to each other: lay the whole list out again
+        known = set(self._names)
+        if [name for name in names if name in known] != self._names:
+            self.beginResetModel()
+            self._names = list(names)
+            self._states = {name: states.get(name) for name in names}
+            self.endResetModel()
+            return
+
+        # Changed states
+        for row, name in enumerate(self._names):
+            state = states.get(name)
+            if self._states.get(name) != state:
+                self._states[name] = state
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [RunStatusModel.StateRole, Qt.ItemDataRole.ToolTipRole])
+
+        # New runs, inserted where they sort; each stretch of them as one block
+        row = 0
+        while row < len(names):
+            if names[row] in known:
+                row += 1
+                continue
+            end = row
+            while end < len(names) and names[end] not in known:
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self._names[row:row] = names[row:end]
+            for name in names[row:end]:
+                self._states[name] = states.get(name)
+            self.endInsertRows()
+            row = end
+
+
+class RunCardDelegate(QStyledItemDelegate):
+    """Paints a run as a rounded card coloured by its state."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.card_width = 240
+        self.card_height = 56
+        self.font = QFont("Arial", 12, QFont.Weight.Bold)
+
+    def sizeHint(self, option, index):
+        return QSize(self.card_width, self.card_height)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        rect = QRectF(option.rect).adjusted(4, 4, -4, -4)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        background = "#eaeaea" if hovered else STATE_COLORS.get(index.data(RunStatusModel.StateRole), DEFAULT_STATE_COLOR)
+
+        painter.setPen(QPen(QColor("#cccccc"), 1))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(rect, 10, 10)
+
+        painter.setPen(QColor("black" if hovered else "#444444"))
+        painter.setFont(self.font)
+        text_rect = rect.adjusted(12, 0, -12, 0)
+        text = painter.fontMetrics().elidedText(index.data(), Qt.TextElideMode.ElideRight, int(text_rect.width()))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+
+        painter.restore()
+
+
+class RunCardView(QListView):
+    """Wrapping list view that lays run cards out in a fixed number of columns."""
+
+    def __init__(self, columns: int = 3, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+
+        self.card_delegate = RunCardDelegate(self)
+        self.setItemDelegate(self.card_delegate)
+
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setStyleSheet("QListView { border: none; background: transparent; }")
+
+    def resizeEvent(self, event):
+        width = max(1, self.viewport().width() // self.columns)
+        if width != self.card_delegate.card_width:
+            self.card_delegate.card_width = width
+            self.doItemsLayout()
+        super().resizeEvent(event)
@@ -2,58 +2,23 @@
 from src.assets.stylesheet import close_btn_red_bg
 from src.utils.logger_module.omix_logger import OmixForgeLogger
 from src.utils.constants import RUN_DIR, PIPELINES_RUNS, CONFIG_FILE
-from src.utils.fileops.file_handle import list_files_in_directory, read_from_file, delete_directory, delete_file, json_read
+from src.utils.fileops.archive_codec import ARCHIVE_SUFFIXES
+from src.utils.fileops.file_handle import list_files_in_directory, delete_directory, delete_file, json_read
+from src.utils.fileops.log_tail import LogTailer
+from src.utils.fileops.dir_watcher import DirectoryWatcher
+from src.utils.run_index import RunIndex
+from src.utils.widgets.log_viewer import LogTailViewer
 
 logger = OmixForgeLogger.get_logger()
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QFrame, QScrollArea,
-    QHBoxLayout, QGridLayout, QPushButton, QApplication
+    QWidget, QVBoxLayout, QLabel, QFrame,
+    QHBoxLayout, QPushButton, QApplication
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThreadPool
-from PyQt6.QtGui import QFont
 
 from src.core.dashboard.pipeline_dash_tab.local_pipeline import PipelineLocal
-
-
-class PipelineCard(QFrame):
-    clicked = pyqtSignal(str)
-
-    def __init__(self, name, background):
-        super().__init__()
-        self.name = name
-
-        self.setObjectName("pipelineResultCard")
-        
-        self.setStyleSheet("""
-            QFrame#pipelineResultCard {{
-                border: 1px solid #ccc;
-                border-radius: 10px;
-                padding: 12px;
-                background: {background};
-                color: #444;
-            }}
-            QFrame#pipelineResultCard:hover {{
-                background: #eaeaea;
-            }}
-            QFrame#pipelineResultCard:hover QLabel {{
-                color: black;
-            }}
-        """.format(background=background))
-
-        layout = QHBoxLayout()
-        label = QLabel(name)
-        
-               
-        label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        layout.addWidget(label)
-        layout.addStretch()
-        self.setLayout(layout)
-
-    
-    def mousePressEvent(self, event):
-        self.clicked.emit(self.name)
-        event.accept()
+from src.core.status_page.status.run_model import RunStatusModel, RunCardView
 
 
 class PipelineRunStatus(QWidget):
@@ -68,25 +33,22 @@ class PipelineRunStatus(QWidget):
         self.PIPELINES_RUNS = self.constants.get("folders",{}).get("PIPELINES_RUNS", PIPELINES_RUNS)
        
         self.pipeline_runs = []
+        self.run_states = {}
+        self.log_tailer = LogTailer()
+        self.run_index = RunIndex.get_index()
+        self.run_index.backfill(self.PIPELINES_RUNS)
         self.get_local_pipelines_status()
 
         main_layout = QVBoxLayout(self)
 
-        # GRID LAYOUT FOR CARDS
-        self.cards_grid = QGridLayout()
-
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-
-        # scroll only in vertical direction
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-
-        scroll_widget = QWidget()
-        scroll_widget.setLayout(self.cards_grid)
-        scroll.setWidget(scroll_widget)
+        # RUN CARDS
+        # Runs live in a model; the view only paints the cards that are visible
+        self.run_model = RunStatusModel(self)
+        self.run_view = RunCardView(columns=3)
+        self.run_view.setModel(self.run_model)
+        self.run_view.clicked.connect(lambda index: self.on_card_clicked(index.data()))
 
-        main_layout.addWidget(scroll)
+        main_layout.addWidget(self.run_view)
 
         # DETAILS BOX
         self.details_box = QFrame()
@@ -96,11 +58,12 @@ class PipelineRunStatus(QWidget):
 
         self.render_cards()
 
-        # Periodically refresh the run list so status updates while processes write logs
-        self._refresh_timer = QTimer(self)
-        self._refresh_timer.setInterval(2000)
-        self._refresh_timer.timeout.connect(self._periodic_refresh)
-        self._refresh_timer.start()
+        # Refresh when run logs appear or disappear, or the run index records a new state.
+        # The cards only follow while the page is visible; the badge count always does.
+        watcher = DirectoryWatcher.get_watcher()
+        self._runs_watch = watcher.subscribe([self.PIPELINES_RUNS, self.run_index.index_path],
+                                             self._periodic_refresh, owner=self, active=False)
+        self._jobs_watch = watcher.subscribe([self.run_index.index_path], self._emit_running_jobs_count, owner=self)
 
         # Timer used to refresh the details content when a run is selected
         self._details_timer = None
@@ -111,6 +74,20 @@ class PipelineRunStatus(QWidget):
         items_collected = list_files_in_directory(self.PIPELINES_RUNS )
         self.pipeline_runs = items_collected
 
+        # The run index is authoritative; logs are only tailed for runs it does not know about
+        run_states = {}
+        tailed = []
+        for name in items_collected:
+            state = self.run_index.state(name)
+            if state is None:
+                path = f"{self.PIPELINES_RUNS}/{name}"
+                state = self.log_tailer.status(path)
+                tailed.append(path)
+            run_states[name] = state
+
+        self.log_tailer.prune(tailed)
+        self.run_states = run_states
+
 
     def get_running_jobs_count(self):
         # Get the number of running pipeline jobs from PipelineLocal
@@ -118,42 +95,8 @@ class PipelineRunStatus(QWidget):
 
 
     def render_cards(self):
-        columns = 3
-        row = 0
-        col = 0
-
-        # Clear existing cards so re-rendering doesn't duplicate widgets
-        for i in reversed(range(self.cards_grid.count())):
-            item = self.cards_grid.takeAt(i)
-            if item.widget():
-                item.widget().deleteLater()
-
-        for index, name in enumerate(self.pipeline_runs):
-            content = read_from_file(f"{self.PIPELINES_RUNS}/{name}")
-
-            if "<<exit-code:1>>" in content.lower():
-                card = PipelineCard(name, "#ff4c4c")
-            elif "cancelled" in content.lower():
-                card = PipelineCard(name, "#6c70dc")  # Red for error
-            elif "<<exit-code:0>>" in content.lower():
-                card = PipelineCard(name, "#4bb543")  # Green for completed
-            else:
-                card = PipelineCard(name, "#f0ad4e")  # Yellow for running/unknown
-            
-            card.clicked.connect(self.on_card_clicked)
-
-            card.setMaximumHeight(200)
-            # Add card to grid
-            self.cards_grid.addWidget(card, row, col)
-
-            # next column
-            col += 1
-
-            # wrap to next row
-            if col >= columns:
-                col = 0
-                row += 1
-    
+        # The model diffs against what it already shows, so unchanged cards are not repainted
+        self.run_model.update_runs(self.pipeline_runs, self.run_states)
 
     def on_card_clicked(self, name):
         # if same card selected again, do nothing (avoid rebuild / duplicate buttons)
@@ -188,20 +131,11 @@ class PipelineRunStatus(QWidget):
         self.details_layout.addLayout(self.action_items_top)
 
 
-        # Read file content and create a label that we will refresh periodically
-        content = read_from_file(f"{self.PIPELINES_RUNS}/{name}")
-        self._details_content_label = QLabel(content)
-        self._details_content_label.setWordWrap(True)
-        self._details_content_label.setFont(QFont("Courier New", 10))
+        # Show only the end of the log; earlier lines are loaded when scrolling up
+        self._details_viewer = LogTailViewer(f"{self.PIPELINES_RUNS}/{name}")
+        self._details_viewer.setMinimumHeight(250)
 
-        # Scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll.setWidget(self._details_content_label)
-
-        self.details_layout.addWidget(scroll)
+        self.details_layout.addWidget(self._details_viewer)
 
         # start a short timer to refresh the contents of the details view
         if self._details_timer:
@@ -243,16 +177,19 @@ class PipelineRunStatus(QWidget):
 
             app = QApplication.instance()
             if getattr(app, "cred", False):
-                try:
-                    delete_file(f'{self.RUN_DIR}/{file_name.replace(".txt", ".zip.enc")}')
-                except Exception:
-                    pass
+                # The run's encrypted archive, indexed or legacy
+                for suffix in ARCHIVE_SUFFIXES:
+                    try:
+                        delete_file(f'{self.RUN_DIR}/{file_name.replace(".txt", suffix)}')
+                    except Exception:
+                        pass
 
             # Delete the run files/directories if present
             try:
                 delete_file(f"{self.PIPELINES_RUNS}/{file_name}")
             except Exception:
                 pass
+            self.run_index.forget(file_name)
 
             try:
                 delete_directory(f'{self.RUN_DIR}/{file_name.replace(".txt", "")}')
@@ -305,18 +242,28 @@ class PipelineRunStatus(QWidget):
                 child_layout.deleteLater()
 
     def _periodic_refresh(self):
-        # Called by timer to refresh list and cards
+        # Called by the directory watcher to refresh list and cards
         try:
             self.get_local_pipelines_status()
             self.render_cards()
-            self.running_jobs_count_changed.emit(self.get_running_jobs_count())
         except Exception:
             pass
 
+    def _emit_running_jobs_count(self):
+        self.running_jobs_count_changed.emit(self.get_running_jobs_count())
+
+    def showEvent(self, event):
+        DirectoryWatcher.get_watcher().resume(self._runs_watch)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        DirectoryWatcher.get_watcher().pause(self._runs_watch)
+        super().hideEvent(event)
+
     def _refresh_details_content(self, name):
         try:
-            content = read_from_file(f"{self.PIPELINES_RUNS}/{name}")
-            if hasattr(self, '_details_content_label') and self._details_content_label:
-                self._details_content_label.setText(content)
+            # Only the bytes written since the last tick are read
+            if getattr(self, '_details_viewer', None):
+                self._details_viewer.refresh()
         except Exception:
             pass
@@ -0,0 +1,176 @@
+import os
+import threading
+import time
+
+from src.utils.constants import INITIATE_CACHE_JSON, INITIATE_CACHE_META_JSON
+from src.utils.fileops.file_handle import ensure_directory, json_read, json_write
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+CATALOG_URL = "https://nf-co.re/pipelines.json"
+# A catalog younger than this is used without asking the server
+DEFAULT_CATALOG_TTL = 6 * 60 * 60
+
+
+class CatalogCache:
+    """
+    Offline-first cache of the nf-core pipeline catalog.
+
+    The catalog is served from INITIATE_CACHE_JSON, so reading it never
+    waits on the network. refresh() revalidates it with the ETag and
+    Last-Modified of the stored copy: an unchanged catalog costs a 304
+    without a body, and only a changed one is downloaded and replaces the
+    file. A failed refresh leaves the stored copy in place.
+    """
+
+    _cache = None
+
+    @staticmethod
+    def get_cache():
+        """
+        Returns the shared catalog cache.
+        Creates it on first use.
+        """
+        if CatalogCache._cache is None:
+            CatalogCache._cache = CatalogCache()
+        return CatalogCache._cache
+
+    def __init__(self, cache_path: str = INITIATE_CACHE_JSON, meta_path: str = INITIATE_CACHE_META_JSON,
+                 url: str = CATALOG_URL, ttl: float = DEFAULT_CATALOG_TTL):
+        """Describe the cache; nothing is read until first use.
+
+        Parameters
+        ----------
+        cache_path : str
+            JSON file holding the catalog as served.
+        meta_path : str
+            JSON file with the validators and fetch time of that copy.
+        url : str
+            Catalog URL.
+        ttl : float
+            Seconds a fetched catalog counts as fresh.
+        """
+        self.cache_path = str(cache_path)
+        self.meta_path = str(meta_path)
+        self.url = url
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._data = None
+        self._refreshing = None
+
+        try:
+            self._meta = json_read(self.meta_path)
+        except (OSError, ValueError):
+            self._meta = {}
+
+    def load(self):
+        """Return the stored catalog, or None if there is none yet."""
+        with self._lock:
+            if self._data is None:
+                try:
+                    self._data = json_read(self.cache_path)
+                except (OSError, ValueError):
+                    return None
+            return self._data
+
+    def is_fresh(self) -> bool:
+        """Return True if the stored catalog was validated within the TTL."""
+        with self._lock:
+            fetched_at = self._meta.get("fetched_at", 0)
+        return self.load() is not None and time.time() - fetched_at < self.ttl
+
+    def refresh(self, force: bool = False, timeout: float = 20, retries: int = 3) -> bool:
+        """Revalidate the catalog with the server.
+
+        Parameters
+        ----------
+        force : bool
+            Ask the server even if the stored copy is within the TTL.
+        timeout : float
+            Seconds to wait for each request.
+        retries : int
+            Attempts before giving up.
+
+        Returns
+        -------
+        bool
+            True if the catalog is current, either downloaded or confirmed
+            unchanged; False if the server could not be reached.
+        """
+        # Only a refresh needs requests, and it runs after startup
+        import requests
+
+        # One request at a time; a caller arriving meanwhile gets its result
+        with self._refresh_lock:
+            if not force and self.is_fresh():
+                return True
+
+            headers = {}
+            if self.load() is not None:
+                if self._meta.get("etag"):
+                    headers["If-None-Match"] = self._meta["etag"]
+                if self._meta.get("last_modified"):
+                    headers["If-Modified-Since"] = self._meta["last_modified"]
+
+            for attempt in range(1, retries + 1):
+                try:
+                    response = requests.get(self.url, headers=headers, timeout=timeout)
+                except requests.RequestException as e:
+                    logger.error(f"Error retrieving nf-core pipelines: {e}")
+                    continue
+
+                if response.status_code == 304:
+                    logger.info("nf-core pipeline catalog unchanged")
+                    self._store_meta(response)
+                    return True
+                if response.status_code == 200:
+                    try:
+                        data = response.json()
+                    except ValueError as e:
+                        logger.error(f"Invalid nf-core pipeline catalog: {e}")
+                        continue
+                    self._store(response.content, data)
+                    self._store_meta(response)
+                    logger.info("Downloaded nf-core pipeline catalog")
+                    return True
+                logger.error(f"Error retrieving nf-core pipelines: HTTP {response.status_code} "
+                             f"(attempt {attempt}/{retries})")
+            return False
+
+    def refresh_in_background(self) -> threading.Thread:
+        """Start refresh() in a daemon thread unless one is running."""
+        with self._lock:
+            if self._refreshing is not None and self._refreshing.is_alive():
+                return self._refreshing
+            self._refreshing = threading.Thread(target=self.refresh, name="catalog-refresh", daemon=True)
+            self._refreshing.start()
+            return self._refreshing
+
+    def _store(self, content: bytes, data: dict) -> None:
+        # The body is written as received; re-encoding megabytes of JSON gains nothing
+        try:
+            ensure_directory(os.path.dirname(self.cache_path))
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.error(f"Failed to save nf-core pipeline catalog: {e}")
+        with self._lock:
+            self._data = data
+
+    def _store_meta(self, response) -> None:
+        with self._lock:
+            self._meta = {
+                "etag": response.headers.get("ETag", self._meta.get("etag")),
+                "last_modified": response.headers.get("Last-Modified", self._meta.get("last_modified")),
+                "fetched_at": time.time(),
+            }
+            meta = dict(self._meta)
+        try:
+            ensure_directory(os.path.dirname(self.meta_path))
+            json_write(self.meta_path, meta)
+        except OSError as e:
+            logger.error(f"Failed to save nf-core catalog metadata: {e}")
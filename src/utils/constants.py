@@ -11,11 +11,13 @@ PIPELINES_RUNS = DATA_DIR / "pipelines_runs"
 CONFIG_DIR = APP_DIR / ".omixforge"
 AUTH_DIR = CONFIG_DIR / "auth"
 SAMPLE_PREP_DIR = DATA_DIR / "sample_prep"
+WORK_CACHE_DIR = DATA_DIR / "work_cache"
 PLUGIN_DIR = CONFIG_DIR / "plugins"
 
 PLUGINS_API_URL = "https://api.github.com/repos/mohdsinanm/OmixForge-plugins/contents"
 
 BASE_EBI_URL = "https://www.ebi.ac.uk/ena/portal/api/filereport"
+ENA_SEARCH_URL = "https://www.ebi.ac.uk/ena/portal/api/search"
 FIELDS = "study_accession,sample_accession,experiment_accession,run_accession,tax_id,scientific_name,fastq_ftp,submitted_ftp,sra_ftp,bam_ftp"
 
 
@@ -23,7 +25,12 @@ FIELDS = "study_accession,sample_accession,experiment_accession,run_accession,ta
 ## Files
 AUTH_JSON = AUTH_DIR / "auth_data.json.enc"
 INITIATE_CACHE_JSON = CONFIG_DIR / "nfcore_cache.json"
+INITIATE_CACHE_META_JSON = CONFIG_DIR / "nfcore_cache.meta.json"
 CONFIG_FILE = CONFIG_DIR / "app.config"
+RUN_INDEX_JSONL = CONFIG_DIR / "run_index.jsonl"
+STAGING_HASHES_JSON = CONFIG_DIR / "staging_hashes.json"
+REMOTE_JOBS_JSON = CONFIG_DIR / "remote_jobs.json"
+WORK_CACHE_JSON = CONFIG_DIR / "work_cache.json"
 
 def populate_constants(config_path):
     """Read or create application configuration file with default settings.
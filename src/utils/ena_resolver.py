@@ -0,0 +1,209 @@
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.constants import BASE_EBI_URL, ENA_SEARCH_URL, FIELDS
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+# ENA answers a few parallel requests per client; more only earns 429s
+DEFAULT_MAX_REQUESTS = 4
+# Run accessions per search query; longer queries are rejected by the portal API
+DEFAULT_RUN_BATCH = 100
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_BACKOFF = 60
+
+RUN_ACCESSION = re.compile(r"^[SED]RR\d+$", re.IGNORECASE)
+
+
+class ENAResolver:
+    """
+    Resolves ENA/SRA accessions to their read_run records.
+
+    Run accessions are looked up in batches, with one OR-query POSTed to
+    the portal search endpoint per batch. Every other accession (project,
+    study, sample, experiment) is expanded to all of its runs by a single
+    filereport call. Requests share one pooled session and run a few at a
+    time. Rate limits and server errors are retried with exponential
+    backoff, honouring Retry-After.
+    """
+
+    def __init__(self, filereport_url: str = BASE_EBI_URL, search_url: str = ENA_SEARCH_URL,
+                 fields: str = FIELDS, max_requests: int = DEFAULT_MAX_REQUESTS,
+                 batch_size: int = DEFAULT_RUN_BATCH, retries: int = 5, timeout: float = 30,
+                 backoff: float = 1.0):
+        """Set up the session.
+
+        Parameters
+        ----------
+        filereport_url : str
+            ENA portal filereport endpoint.
+        search_url : str
+            ENA portal search endpoint.
+        fields : str
+            Comma-separated read_run fields to return.
+        max_requests : int
+            Requests in flight at the same time.
+        batch_size : int
+            Run accessions per search request.
+        retries : int
+            Attempts per request before it is reported as failed.
+        timeout : float
+            Seconds to wait for each response.
+        backoff : float
+            Seconds before the first retry; doubled for each further one.
+        """
+        self.filereport_url = filereport_url
+        self.search_url = search_url
+        self.fields = fields
+        self.max_requests = max_requests
+        self.batch_size = batch_size
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max_requests)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def resolve(self, accessions, on_progress=None) -> tuple:
+        """Resolve accessions to records.
+
+        Parameters
+        ----------
+        accessions : list of str
+            Accessions in any order; duplicates are resolved once.
+        on_progress : callable, optional
+            Called with (resolved, total) accessions each time a request completes.
+
+        Returns
+        -------
+        tuple of list
+            [(accession, record)] in input order and [(accession, error message)].
+        """
+        accessions = list(dict.fromkeys(acc.strip() for acc in accessions if acc.strip()))
+        runs = [acc for acc in accessions if RUN_ACCESSION.match(acc)]
+        others = [acc for acc in accessions if not RUN_ACCESSION.match(acc)]
+
+        jobs = [(self._fetch_runs, runs[i:i + self.batch_size]) for i in range(0, len(runs), self.batch_size)]
+        jobs += [(self._fetch_accessions, [acc]) for acc in others]
+
+        outcomes = {}  # accession -> list of records, or an error message
+        resolved, total = 0, len(accessions)
+        with ThreadPoolExecutor(max_workers=self.max_requests, thread_name_prefix="ena") as pool:
+            futures = {pool.submit(fetch, batch): batch for fetch, batch in jobs}
+            for future in as_completed(futures):
+                outcomes.update(future.result())
+                resolved += len(futures[future])
+                if on_progress is not None:
+                    on_progress(resolved, total)
+
+        records, failed = [], []
+        for accession in accessions:
+            outcome = outcomes[accession]
+            if isinstance(outcome, str):
+                failed.append((accession, outcome))
+            elif not outcome:
+                logger.warning(f"No data returned for accession: {accession}")
+                failed.append((accession, "No data returned from API"))
+            else:
+                records.extend((accession, record) for record in outcome)
+        return records, failed
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _fetch_runs(self, batch: list) -> dict:
+        """Look up a batch of run accessions with one search request."""
+        query = " OR ".join(f'run_accession="{acc}"' for acc in batch)
+        logger.info(f"Fetching data for {len(batch)} run accessions")
+        try:
+            data = self._records("POST", self.search_url, data={
+                "result": "read_run", "query": query, "fields": self.fields, "format": "json", "limit": 0,
+            })
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code not in RETRY_STATUSES and len(batch) > 1:
+                # The batch was refused as a whole (e.g. a malformed accession); ask for each run alone
+                logger.warning(f"Batched run lookup failed ({e}), resolving {len(batch)} runs one by one")
+                return self._fetch_accessions(batch)
+            return dict.fromkeys(batch, self._describe(e, f"{len(batch)} run accessions"))
+        except Exception as e:
+            return dict.fromkeys(batch, self._describe(e, f"{len(batch)} run accessions"))
+
+        by_run = {acc.upper(): [] for acc in batch}
+        for record in data:
+            run = str(record.get("run_accession", "")).upper()
+            if run in by_run:
+                by_run[run].append(record)
+        return {acc: by_run[acc.upper()] for acc in batch}
+
+    def _fetch_accessions(self, accessions: list) -> dict:
+        """Expand each accession to its runs with a filereport request."""
+        outcomes = {}
+        for accession in accessions:
+            logger.info(f"Fetching data for accession: {accession}")
+            try:
+                outcomes[accession] = self._records("GET", self.filereport_url, params={
+                    "accession": accession, "result": "read_run", "fields": self.fields,
+                    "format": "json", "limit": 0,
+                })
+            except Exception as e:
+                outcomes[accession] = self._describe(e, accession)
+        return outcomes
+
+    def _records(self, method: str, url: str, **kwargs) -> list:
+        """Send a request with retries and return the records of its JSON body."""
+        response = self._request(method, url, **kwargs)
+        # ENA answers an accession without runs with an empty body
+        if not response.text.strip():
+            return []
+        data = response.json()
+        return data if isinstance(data, list) else []
+
+    def _request(self, method: str, url: str, **kwargs):
+        for attempt in range(1, self.retries + 1):
+            last = attempt == self.retries
+            try:
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if last:
+                    raise
+                time.sleep(self._delay(attempt))
+                continue
+
+            if response.status_code in RETRY_STATUSES and not last:
+                delay = self._delay(attempt, response.headers.get("Retry-After"))
+                logger.warning(f"ENA returned HTTP {response.status_code}, retrying in {delay:.1f}s "
+                               f"(attempt {attempt}/{self.retries})")
+                response.close()
+                time.sleep(delay)
+                continue
+            response.raise_for_status()
+            return response
+
+    def _delay(self, attempt: int, retry_after: str = None) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_BACKOFF)
+            except ValueError:
+                pass
+        return min(self.backoff * 2 ** (attempt - 1), MAX_BACKOFF)
+
+    @staticmethod
+    def _describe(error: Exception, what: str) -> str:
+        if isinstance(error, requests.exceptions.Timeout):
+            message = f"Request timeout for {what}"
+        elif isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            message = f"HTTP Error {error.response.status_code} for {what}"
+        elif isinstance(error, json.JSONDecodeError):
+            message = f"Invalid JSON response for {what}"
+        else:
+            message = f"Error fetching {what}: {error}"
+        logger.warning(message)
+        return message
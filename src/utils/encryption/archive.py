@@ -0,0 +1,383 @@
+import base64
+import json
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from src.utils.fileops.archive_codec import CODEC_NONE, CODEC_GZIP, CODEC_ZSTD, DEFAULT_ARCHIVE_CODEC, is_incompressible, zstandard
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+# Indexed archive layout
+# ----------------------
+# header  : MAGIC | version (1 byte) | chunk size (4 bytes) | salt (16 bytes)
+# members : frames of every file, back to back
+# frame   : flags (1 byte) | ciphertext length (4 bytes) | AES-GCM ciphertext + tag
+# index   : AES-GCM encrypted, zlib-compressed JSON list of members
+# trailer : index offset (8 bytes) | index length (8 bytes) | END_MAGIC
+#
+# Each member is encrypted on its own, with a nonce range recorded in the
+# index, so one file can be read by seeking to its offset without touching
+# the rest of the archive. The member id and frame number are bound to every
+# frame as associated data.
+MAGIC = b"OMXARC\x00"
+END_MAGIC = b"OMXAEND\x00"
+VERSION = 1
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_HEADER = struct.Struct(">7sBI16s")
+_FRAME = struct.Struct(">BI")
+_TRAILER = struct.Struct(">QQ8s")
+_FINAL = 0x01
+_COMPRESSED = 0x02
+_INDEX_NONCE = (1 << 95).to_bytes(12, "big")
+
+
+def is_indexed_archive(filepath: str) -> bool:
+    """Return True if the file is an indexed encrypted archive."""
+    with open(filepath, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _derive_key(key, salt: bytes) -> AESGCM:
+    """Derive the per-archive AES-GCM key from a Fernet key."""
+    # Fernet() validates the key and raises ValueError for malformed ones
+    Fernet(key)
+    raw = base64.urlsafe_b64decode(key)
+    derived = HKDF(algorithm=hashes.SHA256(), length=32, salt=salt, info=b"omixforge-archive").derive(raw)
+    return AESGCM(derived)
+
+
+def _nonce(counter: int) -> bytes:
+    return counter.to_bytes(12, "big")
+
+
+def _aad(member_id: int, frame: int, flags: int) -> bytes:
+    return struct.pack(">QQB", member_id, frame, flags)
+
+
+def _compress(chunk: bytes, codec: str) -> tuple:
+    """Compress one frame, returning (flags, data)."""
+    if codec == CODEC_NONE or not chunk:
+        return 0, chunk
+
+    if is_incompressible(chunk):
+        return 0, chunk
+
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd archives need the 'zstandard' package")
+        return _COMPRESSED, zstandard.ZstdCompressor(level=3).compress(chunk)
+    return _COMPRESSED, zlib.compress(chunk, 6)
+
+
+def _decompress(data: bytes, flags: int, codec: str) -> bytes:
+    if not flags & _COMPRESSED:
+        return data
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd archives need the 'zstandard' package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class IndexedArchiveWriter:
+    """
+    Writes an encrypted archive with an offset table of its members.
+
+    Frames are compressed on a thread pool and encrypted in order, so
+    archiving uses all cores while memory stays bounded by a few frames
+    per worker.
+    """
+
+    def __init__(self, path: str, key, codec: str = DEFAULT_ARCHIVE_CODEC,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = None):
+        """Create a new archive.
+
+        Parameters
+        ----------
+        path : str
+            Output path.
+        key : str or bytes
+            Fernet key, e.g. from generate_key.
+        codec : str
+            Per-frame compression: CODEC_GZIP (zlib), CODEC_ZSTD or CODEC_NONE.
+        chunk_size : int
+            Plaintext bytes per frame.
+        workers : int, optional
+            Compression threads; defaults to the CPU count.
+        """
+        if codec not in (CODEC_NONE, CODEC_GZIP, CODEC_ZSTD):
+            raise ValueError(f"Unknown archive codec: {codec}")
+
+        salt = os.urandom(16)
+        self._aead = _derive_key(key, salt)
+        self.codec = codec
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, chunk_size, salt))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="archive")
+        self._members = []
+        self._counter = 0
+        self.closed = False
+
+    def add_folder(self, folder_path: str, arcname: str = None) -> None:
+        """Add a folder and everything below it.
+
+        Parameters
+        ----------
+        folder_path : str
+            Folder to add.
+        arcname : str, optional
+            Name of the folder inside the archive; its basename by default.
+        """
+        folder_path = os.path.abspath(folder_path)
+        arcname = arcname or os.path.basename(folder_path)
+        self._add_entry(folder_path, arcname)
+
+        for root, dirs, files in os.walk(folder_path):
+            dirs.sort()
+            relative = os.path.relpath(root, folder_path)
+            base = arcname if relative == "." else f"{arcname}/{relative.replace(os.sep, '/')}"
+
+            # Linked directories are listed here but not descended into; they are kept as links
+            for name in dirs:
+                self._add_entry(os.path.join(root, name), f"{base}/{name}")
+            for name in sorted(files):
+                self._add_entry(os.path.join(root, name), f"{base}/{name}")
+
+    def add_file(self, path: str, arcname: str) -> None:
+        """Add a single file under arcname."""
+        self._add_entry(path, arcname)
+
+    def close(self) -> None:
+        """Write the index and trailer and close the archive."""
+        if self.closed:
+            return
+        try:
+            index = json.dumps({"version": VERSION, "codec": self.codec, "members": self._members}).encode()
+            ciphertext = self._aead.encrypt(_INDEX_NONCE, zlib.compress(index), b"index")
+            offset = self._file.tell()
+            self._file.write(ciphertext)
+            self._file.write(_TRAILER.pack(offset, len(ciphertext), END_MAGIC))
+        finally:
+            self.closed = True
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._file.close()
+
+    def _add_entry(self, path: str, arcname: str) -> None:
+        stat = os.lstat(path)
+        member = {"name": arcname, "mode": stat.st_mode & 0o7777, "mtime": stat.st_mtime}
+
+        if os.path.islink(path):
+            member.update(type="symlink", target=os.readlink(path))
+        elif os.path.isdir(path):
+            member.update(type="dir")
+        else:
+            member.update(type="file", size=stat.st_size)
+            member.update(self._write_file(path, len(self._members)))
+
+        self._members.append(member)
+
+    def _write_file(self, path: str, member_id: int) -> dict:
+        """Write the frames of one file and return its offset table entry."""
+        offset = self._file.tell()
+        first_nonce = self._counter
+        frames = 0
+        pending = []
+
+        with open(path, "rb") as f:
+            chunk = f.read(self.chunk_size)
+            while True:
+                next_chunk = f.read(self.chunk_size) if chunk else b""
+                final = not next_chunk
+                pending.append((self._executor.submit(_compress, chunk, self.codec), final))
+
+                # Keep a bounded number of frames in flight
+                while len(pending) > 2 * self.workers or (final and pending):
+                    future, is_final = pending.pop(0)
+                    flags, data = future.result()
+                    self._write_frame(member_id, frames, flags | (_FINAL if is_final else 0), data)
+                    frames += 1
+
+                if final:
+                    break
+                chunk = next_chunk
+
+        return {"offset": offset, "length": self._file.tell() - offset, "nonce": first_nonce, "frames": frames}
+
+    def _write_frame(self, member_id: int, frame: int, flags: int, data: bytes) -> None:
+        ciphertext = self._aead.encrypt(_nonce(self._counter), data, _aad(member_id, frame, flags))
+        self._counter += 1
+        self._file.write(_FRAME.pack(flags, len(ciphertext)))
+        self._file.write(ciphertext)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class IndexedArchiveReader:
+    """
+    Random-access reader for indexed encrypted archives.
+
+    Only the index is decrypted on open; member contents are decrypted on
+    demand, one member at a time.
+    """
+
+    def __init__(self, path: str, key):
+        """Open an archive and decrypt its index.
+
+        Parameters
+        ----------
+        path : str
+            Archive path.
+        key : str or bytes
+            Fernet key the archive was written with.
+        """
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError("Not an indexed archive")
+            magic, version, self.chunk_size, salt = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError("Not an indexed archive")
+            if version != VERSION:
+                raise ValueError(f"Unsupported archive version: {version}")
+            self._aead = _derive_key(key, salt)
+
+            f.seek(0, os.SEEK_END)
+            if f.tell() < _HEADER.size + _TRAILER.size:
+                raise ValueError("Archive is truncated")
+            f.seek(-_TRAILER.size, os.SEEK_END)
+            index_offset, index_length, end_magic = _TRAILER.unpack(f.read(_TRAILER.size))
+            if end_magic != END_MAGIC:
+                raise ValueError("Archive is truncated")
+
+            f.seek(index_offset)
+            try:
+                index = zlib.decompress(self._aead.decrypt(_INDEX_NONCE, f.read(index_length), b"index"))
+            except InvalidTag:
+                raise InvalidToken from None
+
+        index = json.loads(index)
+        self.codec = index["codec"]
+        self._members = {member["name"]: (member_id, member) for member_id, member in enumerate(index["members"])}
+
+    def members(self) -> list:
+        """Return the index entries of all members in archive order."""
+        return [member for _, member in sorted(self._members.values(), key=lambda item: item[0])]
+
+    def names(self) -> list:
+        """Return the names of all members."""
+        return [member["name"] for member in self.members()]
+
+    def get_member(self, name: str) -> dict:
+        """Return the index entry of a member."""
+        if name not in self._members:
+            raise KeyError(f"No member named '{name}' in archive")
+        return self._members[name][1]
+
+    def iter_chunks(self, name: str):
+        """Yield the decrypted contents of a file member chunk by chunk."""
+        member_id, member = self._members.get(name, (None, None))
+        if member is None:
+            raise KeyError(f"No member named '{name}' in archive")
+        if member["type"] != "file":
+            raise ValueError(f"'{name}' is not a file")
+
+        with open(self.path, "rb") as f:
+            f.seek(member["offset"])
+            for frame in range(member["frames"]):
+                flags, length = _FRAME.unpack(f.read(_FRAME.size))
+                try:
+                    data = self._aead.decrypt(_nonce(member["nonce"] + frame), f.read(length),
+                                              _aad(member_id, frame, flags))
+                except InvalidTag:
+                    raise InvalidToken from None
+                if (flags & _FINAL) != (frame == member["frames"] - 1):
+                    raise ValueError(f"Archive member '{name}' is corrupt")
+                yield _decompress(data, flags, self.codec)
+
+    def read(self, name: str) -> bytes:
+        """Return the decrypted contents of a file member."""
+        return b"".join(self.iter_chunks(name))
+
+    def extract(self, name: str, dest_dir: str) -> str:
+        """Extract one member below dest_dir and return its path."""
+        member = self.get_member(name)
+        target = self._target_path(dest_dir, name)
+
+        if member["type"] == "dir":
+            # Modes and times of directories are applied by extract_all once they are filled
+            os.makedirs(target, exist_ok=True)
+            return target
+        elif member["type"] == "symlink":
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if os.path.lexists(target):
+                os.remove(target)
+            os.symlink(member["target"], target)
+            return target
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as out:
+                for chunk in self.iter_chunks(name):
+                    out.write(chunk)
+
+        os.chmod(target, member["mode"])
+        os.utime(target, (member["mtime"], member["mtime"]))
+        return target
+
+    def extract_all(self, dest_dir: str) -> None:
+        """Extract every member below dest_dir."""
+        dirs = []
+        for member in self.members():
+            self.extract(member["name"], dest_dir)
+            if member["type"] == "dir":
+                dirs.append(member)
+
+        # Writing files into a directory changes its mtime, and a read-only mode would
+        # block the writes; apply both once the contents are in place
+        for member in reversed(dirs):
+            target = self._target_path(dest_dir, member["name"])
+            os.chmod(target, member["mode"])
+            os.utime(target, (member["mtime"], member["mtime"]))
+
+    @staticmethod
+    def _target_path(dest_dir: str, name: str) -> str:
+        dest_dir = os.path.abspath(dest_dir)
+        target = os.path.abspath(os.path.join(dest_dir, name))
+        if os.path.commonpath([dest_dir, target]) != dest_dir:
+            raise ValueError(f"Archive member '{name}' points outside the target directory")
+        return target
+
+
+def archive_folder(folder_path: str, archive_path: str, key, codec: str = DEFAULT_ARCHIVE_CODEC) -> None:
+    """Write a folder to an indexed encrypted archive.
+
+    The archive is written next to archive_path and renamed into place once
+    complete.
+    """
+    part_path = f"{archive_path}.part"
+    try:
+        with IndexedArchiveWriter(part_path, key, codec) as writer:
+            writer.add_folder(folder_path)
+        os.replace(part_path, archive_path)
+    except Exception as e:
+        logger.error(f"Failed to archive folder {folder_path}: {e}")
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
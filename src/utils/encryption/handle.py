@@ -1,6 +1,9 @@
 import base64
 from cryptography.fernet import Fernet
 import hashlib
+import os
+import tarfile
+from src.utils.encryption.archive import IndexedArchiveReader, is_indexed_archive
 from src.utils.logger_module.omix_logger import OmixForgeLogger
 logger = OmixForgeLogger.get_logger()
 
@@ -21,20 +24,6 @@ def generate_encrypted_file(data: str, filepath: str, key: bytes):
         file.write(encrypted_data)
     logger.info(f"Encrypted file generated at: {filepath}")
 
-def encrypt_file(path:str, key: bytes):
-    """
-    Given a file path and a key, encrypt the file and save it with .enc extension.    
-    
-    :param path: Path to the file to be encrypted
-    :param key: Encryption key
-    """
-    fernet = Fernet(key)
-    with open(path, 'rb') as original_file:
-        encrypted = fernet.encrypt(original_file.read())
-    with open(path + ".enc", 'wb') as encrypted_file:
-        encrypted_file.write(encrypted)
-
-
 def decrypt_file(filepath: str, key: bytes, need_data: bool = False):
     """
     Decrypt an encrypted file.
@@ -71,6 +60,35 @@ def decrypt_file(filepath: str, key: bytes, need_data: bool = False):
         
 
 
+def decrypt_folder(enc_path: str, extract_to: str, key: bytes):
+    """
+    Decrypt an encrypted run archive and extract it.
+
+    Indexed archives are extracted member by member. Archives locked before
+    them (a .tar.gz encrypted as a single Fernet token) are decrypted to a
+    temporary .tar.gz first.
+
+    :param enc_path: Encrypted archive
+    :param extract_to: Directory to extract into
+    :param key: Encryption key
+    """
+    try:
+        if is_indexed_archive(enc_path):
+            IndexedArchiveReader(enc_path, key).extract_all(extract_to)
+            return
+
+        tar_path = decrypt_file(enc_path, key)
+        try:
+            with tarfile.open(tar_path, "r:*") as tar:
+                tar.extractall(path=extract_to)
+        finally:
+            os.remove(tar_path)
+
+    except Exception as e:
+        logger.error(f"Failed to decrypt folder {enc_path}: {e}")
+        raise
+
+
 def generate_key( s: str) -> str:
     """
     Generate a URL-safe base64-encoded key from a given string using SHA-256 hashing.
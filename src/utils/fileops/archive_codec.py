@@ -0,0 +1,52 @@
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # optional; zstd archives need the zstandard package
+    zstandard = None
+
+CODEC_NONE = "none"
+CODEC_GZIP = "gzip"
+CODEC_ZSTD = "zstd"
+DEFAULT_ARCHIVE_CODEC = CODEC_GZIP
+
+# Indexed archives (see encryption.archive) can be browsed without extracting
+INDEXED_ARCHIVE_SUFFIX = ".omxa.enc"
+# Runs locked before indexed archives: a .tar.gz encrypted as one Fernet token
+LEGACY_ARCHIVE_SUFFIX = ".tar.gz.enc"
+ARCHIVE_SUFFIXES = (INDEXED_ARCHIVE_SUFFIX, LEGACY_ARCHIVE_SUFFIX)
+
+# Blocks whose sample does not shrink below this ratio are stored, not deflated
+_INCOMPRESSIBLE_RATIO = 0.95
+_PROBE_BYTES = 64 * 1024
+
+
+def available_codecs() -> list:
+    """Return the archive codecs usable in this installation."""
+    codecs = [CODEC_GZIP, CODEC_NONE]
+    if zstandard is not None:
+        codecs.insert(0, CODEC_ZSTD)
+    return codecs
+
+
+def is_encrypted_archive(name: str) -> bool:
+    """Return True if name is an encrypted run archive."""
+    return name.endswith(ARCHIVE_SUFFIXES)
+
+
+def strip_archive_suffix(name: str) -> str:
+    """Return the run name of an archive, e.g. 'demo_run.omxa.enc' -> 'demo_run'."""
+    for suffix in ARCHIVE_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def is_incompressible(data: bytes) -> bool:
+    """Return True if a fast probe of data barely shrinks.
+
+    Already compressed content (BAM, fastq.gz, images) is stored instead of
+    being compressed a second time.
+    """
+    sample = data[:_PROBE_BYTES]
+    return bool(sample) and len(zlib.compress(sample, 1)) > len(sample) * _INCOMPRESSIBLE_RATIO
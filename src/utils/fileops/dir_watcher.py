@@ -0,0 +1,195 @@
+import os
+
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+
+class _Subscription:
+    """Paths and callback of one subscriber."""
+
+    def __init__(self, paths: set, callback, active: bool):
+        self.paths = paths
+        self.callback = callback
+        self.active = active
+        self.dirty = False
+
+
+class DirectoryWatcher(QObject):
+    """
+    Shared filesystem watcher for the app folders.
+
+    Subscribers register the directories or files they display and a
+    callback. Events from QFileSystemWatcher are debounced, so a burst of
+    writes results in one callback. Paths the OS cannot watch (missing,
+    removed, or unsupported filesystems) fall back to a slow poll.
+    """
+
+    _instance = None
+
+    @staticmethod
+    def get_watcher():
+        """
+        Returns the shared directory watcher.
+        Creates it on first use.
+        """
+        if DirectoryWatcher._instance is None:
+            DirectoryWatcher._instance = DirectoryWatcher()
+        return DirectoryWatcher._instance
+
+    def __init__(self, debounce_ms: int = 300, poll_interval_ms: int = 5000, parent=None):
+        """Initialize the watcher.
+
+        Parameters
+        ----------
+        debounce_ms : int
+            Quiet period after the last event before subscribers are notified.
+        poll_interval_ms : int
+            Interval at which paths that cannot be watched are polled.
+        parent : QObject, optional
+            Parent object for this watcher.
+        """
+        super().__init__(parent)
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_path_changed)
+        self._fs_watcher.fileChanged.connect(self._on_path_changed)
+
+        self._subscriptions = {}
+        self._next_id = 0
+        self._changed = set()
+        self._unwatched = set()
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self._notify)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self._poll)
+
+    def subscribe(self, paths: list, callback, owner: QObject = None, active: bool = True) -> int:
+        """Call callback whenever one of paths changes.
+
+        Parameters
+        ----------
+        paths : list
+            Directories or files to watch.
+        callback : callable
+            Called without arguments after changes settle.
+        owner : QObject, optional
+            The subscription is dropped when this object is destroyed.
+        active : bool
+            Whether to start notifying straight away; see pause and resume.
+
+        Returns
+        -------
+        int
+            Subscription id.
+        """
+        paths = {os.path.abspath(str(p)) for p in paths}
+        sub_id = self._next_id
+        self._next_id += 1
+        self._subscriptions[sub_id] = _Subscription(paths, callback, active)
+
+        for path in paths:
+            self._watch(path)
+
+        if owner is not None:
+            owner.destroyed.connect(lambda *_: self._on_owner_destroyed(sub_id))
+        return sub_id
+
+    def unsubscribe(self, sub_id: int) -> None:
+        """Drop a subscription and stop watching paths nobody needs."""
+        subscription = self._subscriptions.pop(sub_id, None)
+        if subscription is None:
+            return
+
+        still_needed = set().union(*(s.paths for s in self._subscriptions.values()))
+        for path in subscription.paths - still_needed:
+            self._unwatched.discard(path)
+            if path in self._watched_paths():
+                self._fs_watcher.removePath(path)
+        self._update_poll_timer()
+
+    def pause(self, sub_id: int) -> None:
+        """Hold notifications, e.g. while the subscribing page is hidden."""
+        subscription = self._subscriptions.get(sub_id)
+        if subscription:
+            subscription.active = False
+
+    def resume(self, sub_id: int) -> None:
+        """Resume notifications, catching up once if anything changed meanwhile."""
+        subscription = self._subscriptions.get(sub_id)
+        if subscription is None or subscription.active:
+            return
+
+        subscription.active = True
+        if subscription.dirty:
+            subscription.dirty = False
+            self._call(subscription)
+
+    def _on_owner_destroyed(self, sub_id: int) -> None:
+        try:
+            self.unsubscribe(sub_id)
+        except RuntimeError:
+            # The watcher itself is already gone at application exit
+            pass
+
+    def _watched_paths(self) -> set:
+        return set(self._fs_watcher.directories()) | set(self._fs_watcher.files())
+
+    def _watch(self, path: str) -> bool:
+        """Start watching a path, falling back to polling when that fails."""
+        if path in self._watched_paths():
+            return True
+
+        if os.path.exists(path) and self._fs_watcher.addPath(path):
+            self._unwatched.discard(path)
+            self._update_poll_timer()
+            return True
+
+        self._unwatched.add(path)
+        self._update_poll_timer()
+        return False
+
+    def _update_poll_timer(self) -> None:
+        if self._unwatched and not self._poll_timer.isActive():
+            self._poll_timer.start()
+        elif not self._unwatched and self._poll_timer.isActive():
+            self._poll_timer.stop()
+
+    def _on_path_changed(self, path: str) -> None:
+        # Files replaced through a rename, and removed directories, drop out of the watcher
+        if path not in self._watched_paths():
+            self._watch(path)
+
+        self._changed.add(path)
+        self._debounce.start()
+
+    def _poll(self) -> None:
+        for path in list(self._unwatched):
+            if os.path.exists(path):
+                self._watch(path)
+                self._changed.add(path)
+
+        if self._changed:
+            self._debounce.start()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, set()
+        for subscription in list(self._subscriptions.values()):
+            if not subscription.paths & changed:
+                continue
+            if subscription.active:
+                self._call(subscription)
+            else:
+                subscription.dirty = True
+
+    def _call(self, subscription: _Subscription) -> None:
+        try:
+            subscription.callback()
+        except Exception as e:
+            logger.error(f"Error in directory watcher callback: {e}")
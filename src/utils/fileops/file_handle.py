@@ -1,4 +1,5 @@
 import os
+import hashlib
 import shutil
 import json
 import zipfile
@@ -65,6 +66,14 @@ def get_file_size(file_path: str) -> int:
         return os.path.getsize(file_path)
     return 0
 
+def file_sha256(file_path: str) -> str:
+    """Return the hex sha256 of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
 def copy_file(src: str, dest: str) -> None:
     """Copy a file from src to dest."""
     
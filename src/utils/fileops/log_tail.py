@@ -0,0 +1,124 @@
+import os
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+logger = OmixForgeLogger.get_logger()
+
+RUN_RUNNING = "running"
+RUN_COMPLETED = "completed"
+RUN_FAILED = "failed"
+RUN_CANCELLED = "cancelled"
+# Accepted but waiting for a free slot; only ever recorded in the run index
+RUN_QUEUED = "queued"
+
+# Markers written into run logs by PipelineLocal, in order of precedence
+_MARKERS = (
+    (RUN_FAILED, b"<<exit-code:1>>"),
+    (RUN_CANCELLED, b"cancelled"),
+    (RUN_COMPLETED, b"<<exit-code:0>>"),
+)
+# Bytes kept from the previous read so a marker split across reads is still found
+_CARRY = max(len(marker) for _, marker in _MARKERS) - 1
+
+
+class _LogState:
+    __slots__ = ("offset", "size", "mtime", "carry", "found")
+
+    def __init__(self):
+        self.offset = 0
+        self.size = -1
+        self.mtime = -1
+        self.carry = b""
+        self.found = set()
+
+
+class LogTailer:
+    """
+    Incrementally parse run logs for their completion markers.
+
+    A byte offset is kept per log so only newly appended bytes are read,
+    and nothing is read at all when the size and mtime are unchanged.
+    """
+
+    def __init__(self, chunk_size: int = 1024 * 1024):
+        """Initialize the tailer.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of bytes read from a log at once.
+        """
+        self.chunk_size = chunk_size
+        self._states = {}
+
+    def status(self, file_path: str) -> str:
+        """Return the parsed run status of a log, reading only new bytes.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the run log.
+
+        Returns
+        -------
+        str
+            One of RUN_RUNNING, RUN_COMPLETED, RUN_FAILED or RUN_CANCELLED.
+        """
+        file_path = str(file_path)
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            self._states.pop(file_path, None)
+            return RUN_RUNNING
+
+        state = self._states.get(file_path)
+        if state is None:
+            state = self._states[file_path] = _LogState()
+
+        if state.size == st.st_size and state.mtime == st.st_mtime_ns:
+            return self._resolve(state)
+
+        # Truncated or rewritten in place - start over
+        if st.st_size < state.offset or (st.st_size == state.offset and state.mtime != st.st_mtime_ns):
+            state = self._states[file_path] = _LogState()
+
+        try:
+            with open(file_path, "rb") as f:
+                f.seek(state.offset)
+                while True:
+                    chunk = f.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    self._scan(state, chunk)
+                    state.offset += len(chunk)
+        except OSError as e:
+            logger.error(f"Error tailing run log '{file_path}': {e}")
+
+        state.size = st.st_size
+        state.mtime = st.st_mtime_ns
+        return self._resolve(state)
+
+    def forget(self, file_path: str) -> None:
+        """Drop the cached state of a log, e.g. after it was deleted."""
+        self._states.pop(str(file_path), None)
+
+    def prune(self, file_paths) -> None:
+        """Drop the cached state of every log not in file_paths."""
+        keep = {str(p) for p in file_paths}
+        for path in list(self._states):
+            if path not in keep:
+                del self._states[path]
+
+    def _scan(self, state: _LogState, chunk: bytes) -> None:
+        """Look for markers in a chunk, including the tail of the previous one."""
+        window = state.carry + chunk.lower()
+        for status, marker in _MARKERS:
+            if status not in state.found and marker in window:
+                state.found.add(status)
+        state.carry = window[-_CARRY:]
+
+    @staticmethod
+    def _resolve(state: _LogState) -> str:
+        for status, _ in _MARKERS:
+            if status in state.found:
+                return status
+        return RUN_RUNNING
@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+logger = OmixForgeLogger.get_logger()
+
+# Process output goes to its own child logger so it can be tuned apart from app messages
+run_logger = logger.getChild("runs")
+
+
+class RunLogWriter:
+    """
+    Buffered writer for a single run log.
+
+    The log stays open for the life of the run. Output is flushed to disk
+    once flush_bytes are buffered, once flush_interval seconds have passed,
+    or when the writer is closed. Lines are forwarded to the global logger
+    in one record per flush, keeping only every log_every-th line.
+    """
+
+    def __init__(self, file_path: str, flush_bytes: int = 64 * 1024, flush_interval: float = 1.0, log_every: int = 1):
+        """Open a run log for appending.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the run log.
+        flush_bytes : int
+            Buffered size that triggers a flush.
+        flush_interval : float
+            Seconds after which buffered output is flushed.
+        log_every : int
+            Forward one line in log_every to the global logger; 0 disables forwarding.
+        """
+        self.file_path = str(file_path)
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.log_every = log_every
+
+        self._lock = threading.Lock()
+        self._file = open(self.file_path, "a", encoding="utf-8")
+        self._buffer = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._lines_seen = 0
+        self._sampled = {logging.INFO: [], logging.ERROR: []}
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, text: str, level: int = logging.INFO) -> None:
+        """Buffer output for the run log.
+
+        Parameters
+        ----------
+        text : str
+            Text to append, usually one or more complete lines.
+        level : int
+            Level used when forwarding the lines to the global logger.
+        """
+        if not text:
+            return
+
+        with self._lock:
+            if self._file.closed:
+                return
+
+            self._buffer.append(text)
+            self._buffered += len(text)
+
+            if self.log_every:
+                sampled = self._sampled.setdefault(level, [])
+                for line in text.splitlines():
+                    if self._lines_seen % self.log_every == 0:
+                        sampled.append(line)
+                    self._lines_seen += 1
+
+            if self._buffered >= self.flush_bytes or time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self) -> None:
+        """Write buffered output to disk and the global logger."""
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+
+    def flush_if_due(self) -> None:
+        """Flush only when the time threshold has passed, e.g. from a timer."""
+        with self._lock:
+            if not self._file.closed and self._buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def close(self) -> None:
+        """Flush remaining output and close the run log."""
+        with self._lock:
+            if self._file.closed:
+                return
+            try:
+                self._flush()
+            finally:
+                self._file.close()
+
+    def _flush(self) -> None:
+        """Flush without taking the lock. Caller must hold it."""
+        if self._buffer:
+            try:
+                self._file.write("".join(self._buffer))
+                self._file.flush()
+            except OSError as e:
+                logger.error(f"Error writing run log '{self.file_path}': {e}")
+            self._buffer.clear()
+            self._buffered = 0
+
+        for level, lines in self._sampled.items():
+            if lines:
+                run_logger.log(level, "\n".join(lines))
+                lines.clear()
+
+        self._last_flush = time.monotonic()
@@ -0,0 +1,115 @@
+import os
+from collections import OrderedDict
+
+RESOURCES_CONFIG_FILE = "omixforge_resources.config"
+
+
+def host_cpus() -> int:
+    """Return the number of CPUs of this machine."""
+    return os.cpu_count() or 1
+
+
+def host_memory_gb() -> int:
+    """Return the physical memory of this machine in whole GB."""
+    try:
+        return max(1, os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 1024 ** 3)
+    except (ValueError, OSError, AttributeError):
+        return 8
+
+
+def resource_config(cpus: int, memory_gb: int) -> str:
+    """Return a Nextflow config that keeps a run within cpus and memory_gb.
+
+    executor.cpus and executor.memory bound what the local executor runs at
+    once; process.resourceLimits caps single tasks that ask for more, which
+    would otherwise fail on the local executor.
+    """
+    return (
+        "// Generated by OmixForge: resources granted to this run\n"
+        "executor {\n"
+        f"    cpus = {cpus}\n"
+        f"    memory = '{memory_gb} GB'\n"
+        "}\n"
+        "process {\n"
+        f"    resourceLimits = [cpus: {cpus}, memory: '{memory_gb} GB']\n"
+        "}\n"
+    )
+
+
+class LocalRunScheduler:
+    """
+    Admission control for local pipeline runs.
+
+    Every run asks for a share of the machine (CPUs and memory). Runs are
+    admitted in submission order while the shares of the running ones fit
+    the configured budget; the rest wait. A run that asks for more than the
+    whole budget is granted the budget and runs alone.
+    """
+
+    def __init__(self, cpus: int = 0, memory_gb: int = 0, run_cpus: int = 0, run_memory_gb: int = 0):
+        """Set the budget; 0 means the machine's own resources.
+
+        Parameters
+        ----------
+        cpus : int
+            CPUs available to all local runs together.
+        memory_gb : int
+            Memory in GB available to all local runs together.
+        run_cpus : int
+            CPUs granted to each run; half the budget when 0.
+        run_memory_gb : int
+            Memory in GB granted to each run; half the budget when 0.
+        """
+        self.cpus = int(cpus) or host_cpus()
+        self.memory_gb = int(memory_gb) or host_memory_gb()
+        self.run_cpus = min(int(run_cpus) or max(1, self.cpus // 2), self.cpus)
+        self.run_memory_gb = min(int(run_memory_gb) or max(1, self.memory_gb // 2), self.memory_gb)
+        self._queue = OrderedDict()  # run_name -> (cpus, memory_gb)
+        self._running = {}
+
+    @classmethod
+    def from_settings(cls, app: dict):
+        """Build a scheduler from the app settings."""
+        return cls(app.get("local_cpus", 0), app.get("local_memory_gb", 0),
+                   app.get("run_cpus", 0), app.get("run_memory_gb", 0))
+
+    def submit(self, run_name: str) -> None:
+        """Queue a run with the per-run share."""
+        self._queue[run_name] = (self.run_cpus, self.run_memory_gb)
+
+    def admit(self) -> list:
+        """Move the runs that fit the free budget from the queue to running.
+
+        Returns
+        -------
+        list of tuple
+            (run_name, cpus, memory_gb) of each admitted run, in queue order.
+        """
+        admitted = []
+        while self._queue:
+            run_name, (cpus, memory_gb) = next(iter(self._queue.items()))
+            used_cpus = sum(c for c, _ in self._running.values())
+            used_memory = sum(m for _, m in self._running.values())
+            # Strict order: a large run at the head is not overtaken by smaller ones
+            if self._running and (used_cpus + cpus > self.cpus or used_memory + memory_gb > self.memory_gb):
+                break
+            del self._queue[run_name]
+            self._running[run_name] = (cpus, memory_gb)
+            admitted.append((run_name, cpus, memory_gb))
+        return admitted
+
+    def release(self, run_name: str) -> None:
+        """Return the share of a finished run to the budget."""
+        self._running.pop(run_name, None)
+
+    def cancel(self, run_name: str) -> bool:
+        """Drop a queued run; returns True if it was still queued."""
+        return self._queue.pop(run_name, None) is not None
+
+    def queued(self) -> list:
+        """Return the names of queued runs, in admission order."""
+        return list(self._queue)
+
+    def running(self) -> list:
+        """Return the names of admitted runs."""
+        return list(self._running)
@@ -0,0 +1,231 @@
+import copy
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+# Simple manifest assignments: key = 'value', "value" or """value"""
+_ASSIGNMENT = re.compile(r"""(\w+)\s*=\s*(?:\"\"\"(.*?)\"\"\"|'([^'\n]*)'|"([^"\n]*)")""", re.S)
+_DOTTED_ASSIGNMENT = re.compile(r"""manifest\.(\w+)\s*=\s*(?:\"\"\"(.*?)\"\"\"|'([^'\n]*)'|"([^"\n]*)")""", re.S)
+
+
+def default_assets_dir() -> Path:
+    """Return the directory Nextflow pulls pipelines into."""
+    if os.environ.get("NXF_ASSETS"):
+        return Path(os.environ["NXF_ASSETS"])
+    return Path(os.environ.get("NXF_HOME") or Path.home() / ".nextflow") / "assets"
+
+
+def parse_manifest(config_text: str) -> dict:
+    """Return the string fields of the manifest scope of a nextflow.config."""
+    manifest = {}
+    for match in _DOTTED_ASSIGNMENT.finditer(config_text):
+        manifest[match.group(1)] = next(g for g in match.groups()[1:] if g is not None)
+
+    start = re.search(r"\bmanifest\s*\{", config_text)
+    if start:
+        depth, end = 1, start.end()
+        while end < len(config_text) and depth:
+            depth += {"{": 1, "}": -1}.get(config_text[end], 0)
+            end += 1
+        block = config_text[start.end():end - 1]
+        # Nested lists and maps (e.g. contributors) are skipped, their strings are not manifest fields
+        block = re.sub(r"\[[^\[\]]*(\[[^\[\]]*\][^\[\]]*)*\]", "", block)
+        for match in _ASSIGNMENT.finditer(block):
+            manifest[match.group(1)] = next(g for g in match.groups()[1:] if g is not None)
+    return manifest
+
+
+def _read(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return ""
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+class GitCheckout:
+    """Read-only view of the refs of a pipeline's git checkout, without git."""
+
+    def __init__(self, path: Path):
+        self.git_dir = Path(path) / ".git"
+
+    def head(self) -> tuple:
+        """Return (branch or None, commit id) of HEAD."""
+        head = _read(self.git_dir / "HEAD").strip()
+        if head.startswith("ref: "):
+            ref = head[len("ref: "):]
+            branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+            return branch, self.refs().get(ref, "")
+        return None, head
+
+    def refs(self) -> dict:
+        """Return {ref name: commit id} from loose and packed refs."""
+        refs = {}
+        for line in _read(self.git_dir / "packed-refs").splitlines():
+            if line and line[0] not in "#^":
+                commit, _, ref = line.partition(" ")
+                refs[ref] = commit
+        for kind in ("heads", "tags", "remotes"):
+            base = self.git_dir / "refs" / kind
+            for root, _dirs, files in os.walk(base):
+                for name in files:
+                    path = Path(root) / name
+                    refs[path.relative_to(self.git_dir).as_posix()] = _read(path).strip()
+        return refs
+
+    def remote_url(self) -> str:
+        """Return the URL of the origin remote."""
+        in_origin = False
+        for line in _read(self.git_dir / "config").splitlines():
+            line = line.strip()
+            if line.startswith("["):
+                in_origin = line == '[remote "origin"]'
+            elif in_origin and line.startswith("url"):
+                return line.split("=", 1)[1].strip()
+        return ""
+
+    def stamp(self) -> tuple:
+        """Return mtimes that change whenever the refs or HEAD change."""
+        return tuple(_mtime(self.git_dir / name) for name in
+                     ("HEAD", "packed-refs", "config", "refs/heads", "refs/tags", "refs/remotes/origin"))
+
+
+class NextflowAssets:
+    """
+    Reads the pipelines Nextflow pulled into its assets directory.
+
+    `nextflow list` and `nextflow info` start a JVM each; the same facts
+    are on disk: one git checkout per pipeline under <org>/<name>, its refs,
+    the manifest in nextflow.config and the parameters in nextflow_schema.json.
+    Results are cached and reused while the mtimes of the files they were
+    read from are unchanged.
+    """
+
+    _assets = None
+
+    @staticmethod
+    def get_assets():
+        """
+        Returns the shared assets reader.
+        Creates it on first use.
+        """
+        if NextflowAssets._assets is None:
+            NextflowAssets._assets = NextflowAssets()
+        return NextflowAssets._assets
+
+    def __init__(self, assets_dir=None):
+        """Point the reader at an assets directory.
+
+        Parameters
+        ----------
+        assets_dir : str or Path, optional
+            Defaults to $NXF_ASSETS or $NXF_HOME/assets (~/.nextflow/assets).
+        """
+        self.assets_dir = Path(assets_dir) if assets_dir else default_assets_dir()
+        self._lock = threading.Lock()
+        self._list = (None, [])
+        self._info = {}
+        self._schemas = {}
+
+    def pipeline_dir(self, name: str) -> Path:
+        return self.assets_dir / name
+
+    def list_pipelines(self) -> list:
+        """Return the names ("org/name") of the pulled pipelines, like `nextflow list`."""
+        # A pipeline directory changes its mtime when Nextflow finishes cloning into it
+        entries = [(org.name, entry) for org in self._scandir(self.assets_dir) if org.is_dir()
+                   for entry in self._scandir(org.path) if entry.is_dir()]
+        stamp = (_mtime(self.assets_dir), tuple((org, entry.name, _mtime(Path(entry.path))) for org, entry in entries))
+        with self._lock:
+            if self._list[0] == stamp:
+                return list(self._list[1])
+
+        names = sorted(f"{org}/{entry.name}" for org, entry in entries
+                       if os.path.isdir(os.path.join(entry.path, ".git")))
+        with self._lock:
+            self._list = (stamp, names)
+        return list(names)
+
+    def pipeline_info(self, name: str):
+        """Return the fields `nextflow info <name>` shows, or None if name is not pulled.
+
+        Returns
+        -------
+        dict or None
+            "project name", "repository", "local path", "main script",
+            "description", "author", "version", "revision" and "revisions".
+        """
+        path = self.pipeline_dir(name)
+        if not (path / ".git").is_dir():
+            return None
+
+        checkout = GitCheckout(path)
+        stamp = (_mtime(path / "nextflow.config"), checkout.stamp())
+        with self._lock:
+            cached = self._info.get(name)
+            if cached and cached[0] == stamp:
+                return dict(cached[1])
+
+        manifest = parse_manifest(_read(path / "nextflow.config"))
+        branch, commit = checkout.head()
+        refs = checkout.refs()
+        branches = sorted(ref[len("refs/heads/"):] for ref in refs if ref.startswith("refs/heads/"))
+        tags = sorted(ref[len("refs/tags/"):] for ref in refs if ref.startswith("refs/tags/"))
+
+        info = {
+            "project name": manifest.get("name") or name,
+            "repository": checkout.remote_url() or manifest.get("homePage", ""),
+            "local path": str(path),
+            "main script": manifest.get("mainScript", "main.nf"),
+            "description": " ".join(manifest.get("description", "").split()),
+            "author": " ".join(manifest.get("author", "").split()),
+            "version": manifest.get("version", ""),
+            "revision": f"{branch or 'detached'} ({commit[:10]})" if commit else branch or "",
+            "revisions": ", ".join(branches + tags),
+        }
+        with self._lock:
+            self._info[name] = (stamp, info)
+        return dict(info)
+
+    def pipeline_schema(self, name: str):
+        """Return the parsed nextflow_schema.json of a pulled pipeline.
+
+        Returns
+        -------
+        dict or None
+            A copy of the schema; None if the pipeline has no readable schema.
+        """
+        path = self.pipeline_dir(name) / "nextflow_schema.json"
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._schemas.get(name)
+            if cached and cached[0] == stamp:
+                return copy.deepcopy(cached[1])
+
+        try:
+            schema = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._schemas[name] = (stamp, schema)
+        return copy.deepcopy(schema)
+
+    @staticmethod
+    def _scandir(path) -> list:
+        try:
+            with os.scandir(path) as entries:
+                return list(entries)
+        except OSError:
+            return []
@@ -1,10 +1,19 @@
-import requests
-from datetime import datetime
+import calendar
+import difflib
+import re
+import time
+from bisect import bisect_left
 
+from src.utils.catalog_cache import CatalogCache
 from src.utils.logger_module.omix_logger import OmixForgeLogger
 
 logger = OmixForgeLogger.get_logger()
 
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Search ranks, best first: where in a pipeline a query term was found
+MATCH_NAME, MATCH_TOPIC, MATCH_DESCRIPTION, MATCH_FUZZY = range(4)
+
 
 class RemoteWorkflowList:
     """A information container for a remote workflow.
@@ -14,6 +23,10 @@ class RemoteWorkflowList:
             (https://developer.github.com/v3/repos/#get).
     """
 
+    # The catalog holds one of these per nf-core pipeline; slots keep them small
+    __slots__ = ("name", "full_name", "description", "topics", "archived", "stargazers_count",
+                 "watchers_count", "forks_count", "local_wf", "local_is_latest", "_releases", "_releases_parsed")
+
     def __init__(self, data):
         """Initialize RemoteWorkflowList with GitHub API workflow data.
         
@@ -26,25 +39,138 @@ class RemoteWorkflowList:
         self.name = data.get("name")
         self.full_name = data.get("full_name")
         self.description = data.get("description")
-        self.topics = data.get("topics", [])
+        self.topics = data.get("topics") or []
         self.archived = data.get("archived")
         self.stargazers_count = data.get("stargazers_count")
         self.watchers_count = data.get("watchers_count")
         self.forks_count = data.get("forks_count")
 
-        # Placeholder vars for releases info (ignore pre-releases)
-        self.releases = [r for r in data.get("releases", []) if r.get("published_at") is not None]
+        # Releases are parsed on first access; most pipelines are never looked at
+        self._releases = data.get("releases") or []
+        self._releases_parsed = False
 
         # Placeholder vars for local comparison
         self.local_wf = None
         self.local_is_latest = None
 
-        # Beautify date
-        for release in self.releases:
+    @property
+    def releases(self) -> list:
+        """Published releases (pre-releases ignored), each with its published_at_timestamp."""
+        if not self._releases_parsed:
+            # published_at is UTC, so it is converted without the local timezone
+            self._releases = [
+                dict(release, published_at_timestamp=calendar.timegm(
+                    time.strptime(release["published_at"], "%Y-%m-%dT%H:%M:%SZ")))
+                for release in self._releases if release.get("published_at") is not None
+            ]
+            self._releases_parsed = True
+        return self._releases
+
+
+class PipelineCatalog:
+    """
+    The nf-core pipelines, indexed by name, topic and search term.
+
+    search() matches every word of a query against the start of the words
+    of a pipeline's name, topics and description, and against any part of
+    its name; a word that matches nothing is looked up as a likely typo.
+    The index is built once per catalog, so filtering as the user types
+    only bisects a sorted word list.
+    """
+
+    def __init__(self, workflows=()):
+        """Index the workflows.
 
-            release["published_at_timestamp"] = int(
-                datetime.strptime(release.get("published_at"), "%Y-%m-%dT%H:%M:%SZ").strftime("%s")
-            )
+        Parameters
+        ----------
+        workflows : iterable of RemoteWorkflowList
+            Pipelines in catalog order; a later duplicate name replaces an earlier one.
+        """
+        self.by_name = {}
+        for workflow in workflows:
+            self.by_name[workflow.name] = workflow
+
+        self.by_topic = {}
+        words = {}  # word -> {name: best MATCH_* rank of the word in that pipeline}
+        for name, workflow in self.by_name.items():
+            for topic in workflow.topics:
+                self.by_topic.setdefault(topic, []).append(name)
+            for rank, text in ((MATCH_NAME, name), (MATCH_TOPIC, " ".join(workflow.topics)),
+                               (MATCH_DESCRIPTION, workflow.description or "")):
+                for word in _WORD.findall(text.lower()):
+                    ranks = words.setdefault(word, {})
+                    ranks[name] = min(ranks.get(name, rank), rank)
+        self._words = sorted(words)
+        self._ranks = words
+        self._names_lower = {name: name.lower() for name in self.by_name}
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+    def __iter__(self):
+        return iter(self.by_name.values())
+
+    def __contains__(self, name) -> bool:
+        return name in self.by_name
+
+    def get(self, name: str):
+        """Return the pipeline called name, or None."""
+        return self.by_name.get(name)
+
+    def names(self) -> list:
+        """Return the pipeline names in catalog order."""
+        return list(self.by_name)
+
+    def with_topic(self, topic: str) -> list:
+        """Return the names of the pipelines tagged with topic."""
+        return list(self.by_topic.get(topic, []))
+
+    def search(self, query: str) -> list:
+        """Return the names of the pipelines matching every word of query, best first.
+
+        Pipelines whose name is or starts with the query come first, then
+        matches in names, topics, descriptions and finally likely typos;
+        ties keep catalog order. An empty query returns every name.
+        """
+        query = query.strip().lower()
+        terms = _WORD.findall(query)
+        if not terms:
+            return self.names()
+
+        best = None  # name -> rank so far, combined over the terms
+        for term in terms:
+            ranks = self._term_ranks(term)
+            if best is None:
+                best = ranks
+            else:
+                best = {name: max(best[name], rank) for name, rank in ranks.items() if name in best}
+            if not best:
+                return []
+
+        order = {name: index for index, name in enumerate(self.by_name)}
+
+        def sort_key(name):
+            lower = self._names_lower[name]
+            return (lower != query, not lower.startswith(query), best[name], order[name])
+
+        return sorted(best, key=sort_key)
+
+    def _term_ranks(self, term: str) -> dict:
+        ranks = {}
+        # Words starting with the term are a contiguous run of the sorted word list
+        index = bisect_left(self._words, term)
+        while index < len(self._words) and self._words[index].startswith(term):
+            for name, rank in self._ranks[self._words[index]].items():
+                ranks[name] = min(ranks.get(name, rank), rank)
+            index += 1
+        for name, lower in self._names_lower.items():
+            if term in lower:
+                ranks[name] = MATCH_NAME
+        if not ranks:
+            for word in difflib.get_close_matches(term, self._words, n=5, cutoff=0.75):
+                for name in self._ranks[word]:
+                    ranks[name] = MATCH_FUZZY
+        return ranks
 
 
 class NfcoreUtils:
@@ -57,48 +183,23 @@ class NfcoreUtils:
     def get_pipelines_json(self):
         """Retrieves remote workflows from `nf-co.re <https://nf-co.re>`_.
 
-        Remote workflows are stored in :attr:`self.remote_workflows` list.
+        The catalog is revalidated through the catalog cache when it is
+        older than its TTL, and the stored copy is returned when the
+        server cannot be reached.
         """
-        # List all repositories at nf-core
-        retry = self.max_retry
-        response = {}
-        while retry > 0:
-            try: 
-                nfcore_url = "https://nf-co.re/pipelines.json"
-                response = requests.get(nfcore_url, timeout=20)
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Error retrieving nf-core pipelines: HTTP {response.status_code}")
-                    logger.info(f"Retrying for fetching data {retry}")
-                    retry -= 1
-                return response
-            except requests.RequestException as e:
-                logger.error(f"Error retrieving nf-core pipelines: {e}")
-                retry -= 1
-        return response
-
+        cache = CatalogCache.get_cache()
+        cache.refresh(retries=self.max_retry)
+        return cache.load() or {}
 
     def get_pipelines(self):
         """Retrieves remote workflows from `nf-co.re <https://nf-co.re>`_.
 
-        Remote workflows are stored in :attr:`self.remote_workflows` list.
+        Remote workflows are stored in :attr:`self.wf_list` and returned
+        as an indexed PipelineCatalog. The catalog is always revalidated,
+        which only downloads it if it changed on the server.
         """
-        # List all repositories at nf-core
-        retry = self.max_retry
-        response = {}
-        while retry > 0:
-            try: 
-                nfcore_url = "https://nf-co.re/pipelines.json"
-                response = requests.get(nfcore_url, timeout=100)
-                if response.status_code == 200:
-                    repos = response.json()["remote_workflows"]
-                    for repo in repos:
-                        self.wf_list.append(RemoteWorkflowList(repo))
-                    return self.wf_list
-                retry -= 1
-                return self.wf_list
-            except requests.RequestException as e:
-                logger.error(f"Error retrieving nf-core pipelines: {e}")
-                retry -= 1
-        return response
\ No newline at end of file
+        cache = CatalogCache.get_cache()
+        cache.refresh(force=True, timeout=100, retries=self.max_retry)
+        for repo in (cache.load() or {}).get("remote_workflows", []):
+            self.wf_list.append(RemoteWorkflowList(repo))
+        return PipelineCatalog(self.wf_list)
@@ -0,0 +1,202 @@
+import os
+import shlex
+import subprocess
+import time
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+PID_FILE = ".omixforge.pid"
+EXIT_CODE_FILE = ".omixforge.exitcode"
+_READ_SIZE = 64 * 1024
+# Pause before reopening a stream that ended without data
+_RETRY_DELAY = 5
+# ssh exits with 255 when it, rather than the remote command, failed
+SSH_TRANSPORT_ERROR = 255
+# Attempts to reach the server before a job is reported unreachable
+PROBE_RETRIES = 4
+
+
+class JobUnreachable(ConnectionError):
+    """The server could not be reached to check on a job; the job may still be running."""
+
+
+class RemoteJob:
+    """
+    A detached command running in a directory on a server.
+
+    The command runs under nohup, so it survives the SSH connection (and the
+    app) going away. Its PID is kept in the directory and its exit code is
+    written there when it ends, which lets a later session find it again.
+    Output goes to a log file that follow() streams back as it is written.
+    """
+
+    def __init__(self, session, workdir: str, log_name: str = "run.log", pid: int = None, offset: int = 0):
+        """Describe a job.
+
+        Parameters
+        ----------
+        session : SSHSession
+            Connection to the server.
+        workdir : str
+            Remote directory the command runs in.
+        log_name : str
+            Log file of the command, relative to workdir.
+        pid : int, optional
+            PID of an already running job to attach to.
+        offset : int
+            Bytes of the log already fetched.
+        """
+        self.session = session
+        self.workdir = workdir
+        self.log_path = f"{workdir}/{log_name}"
+        self.pid = pid
+        self.offset = offset
+        self._tail = None
+        self._detached = False
+        self._reconnect = None
+
+    def start(self, command: str) -> int:
+        """Start command detached and return its PID."""
+        wrapped = f"({command}) > {shlex.quote(self.log_path)} 2>&1; echo $? > {EXIT_CODE_FILE}"
+        proc = self.session.run(
+            f"cd {shlex.quote(self.workdir)} || exit 1; rm -f {EXIT_CODE_FILE}; "
+            f"nohup sh -c {shlex.quote(wrapped)} > /dev/null 2>&1 < /dev/null & "
+            f"echo $! > {PID_FILE}; echo $!"
+        )
+        pid = proc.stdout.strip()
+        if proc.returncode != 0 or not pid.isdigit():
+            raise RuntimeError(f"Failed to start remote job: {proc.stderr}")
+        self.pid = int(pid)
+        return self.pid
+
+    def is_running(self) -> bool:
+        """Return True while the job's process exists.
+
+        Raises
+        ------
+        JobUnreachable
+            If the server cannot be asked.
+        """
+        # The exit code file guards against the PID having been reused since
+        proc = self._probe(f"test ! -f {shlex.quote(self.workdir)}/{EXIT_CODE_FILE} && kill -0 {self.pid}")
+        return proc.returncode == 0
+
+    def exit_code(self):
+        """Return the job's exit code, or None if it has not written one.
+
+        Raises
+        ------
+        JobUnreachable
+            If the server cannot be asked.
+        """
+        proc = self._probe(f"cat {shlex.quote(self.workdir)}/{EXIT_CODE_FILE}")
+        code = proc.stdout.strip()
+        return int(code) if proc.returncode == 0 and code.lstrip("-").isdigit() else None
+
+    def _probe(self, command: str, retries: int = PROBE_RETRIES) -> subprocess.CompletedProcess:
+        """Run a short check on the server, retrying while the connection is down.
+
+        A timeout or ssh's own exit code says nothing about the job, so it
+        is retried with backoff (reconnecting in between when follow() was
+        given a way to) rather than taken as an answer.
+        """
+        delay = _RETRY_DELAY
+        for attempt in range(1, retries + 1):
+            try:
+                proc = self.session.run(command, timeout=10)
+                if proc.returncode != SSH_TRANSPORT_ERROR:
+                    return proc
+                reason = proc.stderr.strip() or f"ssh exited with {SSH_TRANSPORT_ERROR}"
+            except subprocess.TimeoutExpired:
+                reason = "timed out"
+            logger.warning(f"Cannot reach {self.session.host} to check job {self.pid}: {reason} "
+                           f"(attempt {attempt}/{retries})")
+            if attempt == retries or self._detached:
+                break
+            time.sleep(delay)
+            delay *= 2
+            if self._reconnect is not None:
+                try:
+                    self._reconnect()
+                except ConnectionError:
+                    continue
+        raise JobUnreachable(f"Cannot reach {self.session.host} to check job {self.pid}")
+
+    def detach(self) -> None:
+        """Stop following the log; the job itself keeps running."""
+        self._detached = True
+        tail = self._tail
+        if tail is not None and tail.poll() is None:
+            tail.terminate()
+
+    def follow(self, on_data, reconnect=None) -> bool:
+        """Stream the log from self.offset until the job has ended.
+
+        Parameters
+        ----------
+        on_data : callable
+            Called with each block of new log bytes as it arrives.
+        reconnect : callable, optional
+            Called to restore the connection before a dropped stream is
+            reopened; it may raise to give up.
+
+        Returns
+        -------
+        bool
+            True once the job has ended, False if detach() was called first.
+
+        Raises
+        ------
+        JobUnreachable
+            If the server stays unreachable; the job is left running.
+        """
+        self._reconnect = reconnect
+        reopened = False
+        while not self._detached:
+            if reopened and reconnect is not None:
+                try:
+                    reconnect()
+                except ConnectionError as e:
+                    raise JobUnreachable(f"Lost connection to {self.session.host}: {e}") from e
+            if not self.is_running():
+                break
+            if reopened:
+                logger.warning(f"Log stream from {self.session.host} dropped, reopening at byte {self.offset}")
+            reopened = True
+
+            # -F keeps following across log rotation; --pid ends tail with the job
+            proc = self._tail = self.session.popen(
+                f"tail -c +{self.offset + 1} -F --pid={self.pid} {shlex.quote(self.log_path)} 2>/dev/null",
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+            if self._detached:
+                proc.terminate()
+            received = False
+            try:
+                fd = proc.stdout.fileno()
+                while True:
+                    data = os.read(fd, _READ_SIZE)
+                    if not data:
+                        break
+                    received = True
+                    self.offset += len(data)
+                    on_data(data)
+            finally:
+                proc.stdout.close()
+                proc.wait()
+                self._tail = None
+
+            if not received and not self._detached:
+                time.sleep(_RETRY_DELAY)
+
+        if self._detached:
+            return False
+
+        # Whatever the job wrote between the last read and its exit
+        proc = self.session.run(f"tail -c +{self.offset + 1} {shlex.quote(self.log_path)} 2>/dev/null", text=False)
+        if proc.returncode == 0 and proc.stdout:
+            self.offset += len(proc.stdout)
+            on_data(proc.stdout)
+        return True
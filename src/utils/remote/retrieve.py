@@ -0,0 +1,145 @@
+import hashlib
+import os
+import shlex
+import subprocess
+import tarfile
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+from src.utils.remote.transfer import format_size
+
+logger = OmixForgeLogger.get_logger()
+
+# Paths relative to the remote run directory. Nextflow's work/ is never
+# fetched: it is usually many times the size of the published results.
+DEFAULT_INCLUDE = ("results",)
+DEFAULT_EXCLUDE = ("results/pipeline_info",)
+
+FETCH_LIST_FILE = ".omixforge.fetch"
+_BLOCK_SIZE = 1024 * 1024
+
+
+class RetrievalError(RuntimeError):
+    """Results could not be fetched or did not match their checksums."""
+
+
+def _remote_manifest(session, remote_base: str, include, exclude) -> dict:
+    """Return {relative path: sha256} of the files to fetch."""
+    pruned = " -o ".join(f"-path {shlex.quote(path)}" for path in exclude)
+    prune = f"\\( {pruned} \\) -prune -o " if exclude else ""
+    # -L follows publishDir symlinks, so linked results are fetched as files
+    command = (
+        f"cd {shlex.quote(remote_base)} && "
+        f"find -L {' '.join(shlex.quote(path) for path in include)} {prune}-type f -print0 2>/dev/null "
+        f"| xargs -0 -r sha256sum"
+    )
+    proc = session.run(command)
+    if proc.returncode != 0:
+        raise RetrievalError(f"Failed to list remote results: {proc.stderr}")
+
+    manifest = {}
+    for line in proc.stdout.splitlines():
+        digest, _, path = line.partition("  ")
+        if path:
+            manifest[os.path.normpath(path)] = digest
+    return manifest
+
+
+def fetch_results(session, remote_base: str, local_dir: str, include=DEFAULT_INCLUDE,
+                  exclude=DEFAULT_EXCLUDE, progress=None) -> int:
+    """Fetch selected files of a remote run as one compressed tar stream.
+
+    The server lists the files matching include but not exclude together
+    with their sha256, then streams exactly those files through tar and
+    gzip. Each file is hashed while it is extracted, so nothing is read
+    twice, and the fetch fails unless every file arrived and matched.
+
+    Parameters
+    ----------
+    session : SSHSession
+        Connection to the server.
+    remote_base : str
+        Remote run directory.
+    local_dir : str
+        Local run directory the files are extracted into.
+    include : iterable of str
+        Paths, relative to remote_base, to fetch.
+    exclude : iterable of str
+        Paths below the included ones to leave on the server.
+    progress : callable, optional
+        Called with status messages.
+
+    Returns
+    -------
+    int
+        Number of files fetched.
+
+    Raises
+    ------
+    RetrievalError
+        If listing, streaming or verification fails.
+    """
+    progress = progress or (lambda message: None)
+    local_dir = os.path.abspath(str(local_dir))
+
+    progress("Listing remote results...")
+    manifest = _remote_manifest(session, remote_base, list(include), list(exclude))
+    if not manifest:
+        logger.warning(f"No results to fetch in {session.host}:{remote_base}")
+        return 0
+
+    proc = session.run(f"cat > {shlex.quote(remote_base)}/{FETCH_LIST_FILE}", input="\n".join(manifest) + "\n")
+    if proc.returncode != 0:
+        raise RetrievalError(f"Failed to prepare result transfer: {proc.stderr}")
+
+    proc = session.popen(
+        f"cd {shlex.quote(remote_base)} && tar -chf - -T {FETCH_LIST_FILE} | gzip -1; rm -f {FETCH_LIST_FILE}",
+        stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    received = set()
+    received_bytes = 0
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode="r|gz") as tar:
+            for member in tar:
+                name = os.path.normpath(member.name)
+                if not member.isfile():
+                    continue
+                if name not in manifest:
+                    raise RetrievalError(f"Unexpected file in result stream: {member.name}")
+
+                target = os.path.join(local_dir, name)
+                if os.path.commonpath([local_dir, os.path.abspath(target)]) != local_dir:
+                    raise RetrievalError(f"Unsafe path in result stream: {member.name}")
+
+                if _extract_verified(tar, member, target) != manifest[name]:
+                    raise RetrievalError(f"Checksum mismatch for {name}")
+
+                received.add(name)
+                received_bytes += member.size
+                progress(f"Fetched {len(received)}/{len(manifest)} result files ({format_size(received_bytes)})")
+    except (tarfile.TarError, EOFError, OSError) as e:
+        raise RetrievalError(f"Result stream from {session.host} broke off: {e}") from e
+    finally:
+        # Closing stdout first stops a sender that is still writing
+        proc.stdout.close()
+        stderr = proc.stderr.read().decode("utf-8", errors="ignore")
+        proc.stderr.close()
+        proc.wait()
+
+    missing = set(manifest) - received
+    if missing:
+        raise RetrievalError(f"{len(missing)} result file(s) missing from the transfer: {stderr}")
+    return len(received)
+
+
+def _extract_verified(tar, member, target: str) -> str:
+    """Write a tar member to target and return the sha256 of what was written."""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    digest = hashlib.sha256()
+    source = tar.extractfile(member)
+    with open(target, "wb") as out:
+        for block in iter(lambda: source.read(_BLOCK_SIZE), b""):
+            digest.update(block)
+            out.write(block)
+    os.chmod(target, member.mode & 0o777 | 0o600)
+    os.utime(target, (member.mtime, member.mtime))
+    return digest.hexdigest()
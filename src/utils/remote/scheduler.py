@@ -0,0 +1,286 @@
+import os
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QThread, QTimer, Qt, pyqtSignal
+
+from src.utils.constants import REMOTE_JOBS_JSON
+from src.utils.fileops.file_handle import append_to_file, ensure_directory, json_read, json_write
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+from src.utils.remote.session_manager import server_key
+from src.utils.run_index import RunIndex, RUN_QUEUED
+
+logger = OmixForgeLogger.get_logger()
+
+DEFAULT_MAX_RUNS = 2
+
+JOB_QUEUED = "queued"
+JOB_SUBMITTING = "submitting"
+JOB_RUNNING = "running"
+
+# Wait before re-attaching to a run whose server could not be reached
+REATTACH_DELAY_MS = 60_000
+
+# Log offsets arrive with every chunk of remote output; persist them at most this often
+_SAVE_INTERVAL = 2.0
+
+
+def max_runs(server: dict) -> int:
+    """Return the number of concurrent runs allowed on a server entry."""
+    try:
+        return max(1, int(server.get("max_runs") or DEFAULT_MAX_RUNS))
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_RUNS
+
+
+class RemoteJobScheduler(QObject):
+    """
+    Queue of remote pipeline runs with a concurrency limit per server.
+
+    Submissions beyond a server's max_runs wait in the queue and start as
+    earlier runs finish. The queue, together with the PID and log offset of
+    every started run, is kept in CONFIG_DIR, so after a restart queued runs
+    are still pending and running ones are re-attached to instead of
+    submitted again.
+
+    Each active run is driven by a worker created by worker_factory from its
+    job record, on its own QThread. Workers provide the signals progress(str),
+    finished(bool, str), error(str), unreachable(str), job_started(int) and
+    log_offset(int), and the methods run() and stop(). A run whose server
+    became unreachable keeps its record and slot and is re-attached after
+    REATTACH_DELAY_MS.
+    """
+
+    progress = pyqtSignal(str, str)  # run_name, message
+    finished = pyqtSignal(str, bool, str)  # run_name, success, message
+    error = pyqtSignal(str, str)  # run_name, message
+    jobs_changed = pyqtSignal()
+
+    _scheduler = None
+
+    @staticmethod
+    def get_scheduler():
+        """
+        Returns the shared remote job scheduler.
+        Creates it on first use.
+        """
+        if RemoteJobScheduler._scheduler is None:
+            # The Qt worker lives with the dashboard that submits the runs
+            from src.core.dashboard.pipeline_dash_tab.remote_pipeline import RemotePipelineWorker
+            RemoteJobScheduler._scheduler = RemoteJobScheduler(RemotePipelineWorker.from_job)
+        return RemoteJobScheduler._scheduler
+
+    def __init__(self, worker_factory, jobs_path: str = REMOTE_JOBS_JSON, parent=None,
+                 reattach_delay_ms: int = REATTACH_DELAY_MS):
+        """Load the persisted queue; nothing starts until resume().
+
+        Parameters
+        ----------
+        worker_factory : callable
+            Returns a worker for a job record.
+        jobs_path : str
+            JSON file the queue is kept in.
+        parent : QObject, optional
+            Parent object for this scheduler.
+        reattach_delay_ms : int
+            Wait before re-attaching to a run whose server was unreachable.
+        """
+        super().__init__(parent)
+        self.worker_factory = worker_factory
+        self.reattach_delay_ms = reattach_delay_ms
+        self._waiting = set()  # runs waiting to re-attach to an unreachable server
+        self.jobs_path = str(jobs_path)
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+        self._active = {}  # run_name -> (worker, thread)
+        self._resumed = False
+
+        try:
+            self._jobs = json_read(self.jobs_path)
+        except (OSError, ValueError):
+            self._jobs = {}
+
+    def submit(self, job: dict) -> bool:
+        """Queue a run and start it if its server has a free slot.
+
+        Parameters
+        ----------
+        job : dict
+            Worker arguments: run_name, pipeline, run_dir, config, ssh_server,
+            pipelines_runs_dir and run_dir_base, optionally max_transfers and
+            fetch_pipeline_info.
+
+        Returns
+        -------
+        bool
+            True if the run started straight away, False if it is queued.
+        """
+        run_name = job["run_name"]
+        with self._lock:
+            self._jobs[run_name] = {**job, "state": JOB_QUEUED, "queued_at": time.time()}
+        self._save()
+
+        RunIndex.get_index().record(run_name, RUN_QUEUED)
+        server = job["ssh_server"]
+        append_to_file(os.path.join(str(job["pipelines_runs_dir"]), run_name),
+                       f"Queued for {server.get('name') or server.get('host')}\n")
+
+        self._dispatch()
+        return run_name in self._active
+
+    def resume(self) -> None:
+        """Re-attach to runs started before the last exit and start queued ones."""
+        if self._resumed:
+            return
+        self._resumed = True
+
+        for run_name, job in self.jobs().items():
+            if job.get("state") == JOB_RUNNING and job.get("pid"):
+                logger.info(f"Re-attaching to remote run {run_name} (PID {job['pid']})")
+                self._start(run_name)
+            elif job.get("state") == JOB_SUBMITTING:
+                # Interrupted while staging; inputs already on the server are reused
+                self._update(run_name, state=JOB_QUEUED)
+        self._dispatch()
+
+    def jobs(self) -> dict:
+        """Return a copy of all queued and active job records."""
+        with self._lock:
+            return {name: dict(job) for name, job in self._jobs.items()}
+
+    def queued(self) -> list:
+        """Return the names of queued runs, oldest first."""
+        jobs = self.jobs()
+        return sorted((n for n, j in jobs.items() if j["state"] == JOB_QUEUED), key=lambda n: jobs[n]["queued_at"])
+
+    def active(self) -> list:
+        """Return the names of runs currently being submitted or followed."""
+        return list(self._active)
+
+    def shutdown(self, timeout_ms: int = 3000) -> None:
+        """Stop following active runs; they keep running on their servers.
+
+        Runs still staging their inputs are cancelled and stay recorded as
+        submitting, so resume() queues them again. Waits at most timeout_ms
+        in total: a worker still busy after that (fetching results, hashing
+        a large input) is left to finish on its own, since its record is
+        already saved and resume() picks the run up on the next start.
+        """
+        self._save(force=True)
+        for worker, _thread in self._active.values():
+            worker.stop()
+        deadline = time.monotonic() + timeout_ms / 1000
+        for run_name, (_worker, thread) in list(self._active.items()):
+            thread.quit()
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            if not thread.wait(remaining_ms):
+                logger.warning(f"Remote worker for {run_name} didn't stop in time; it is resumed on the next start")
+        self._save(force=True)
+
+    @staticmethod
+    def shutdown_scheduler(timeout_ms: int = 3000) -> None:
+        """Shut down the shared scheduler, if it was ever created."""
+        if RemoteJobScheduler._scheduler is not None:
+            RemoteJobScheduler._scheduler.shutdown(timeout_ms)
+
+    def _dispatch(self) -> None:
+        """Start queued runs while their servers have free slots."""
+        jobs = self.jobs()
+        busy = {}
+        for run_name in [*self._active, *self._waiting]:
+            key = server_key(jobs[run_name]["ssh_server"])
+            busy[key] = busy.get(key, 0) + 1
+
+        for run_name in self.queued():
+            server = jobs[run_name]["ssh_server"]
+            key = server_key(server)
+            if busy.get(key, 0) < max_runs(server):
+                busy[key] = busy.get(key, 0) + 1
+                self._update(run_name, state=JOB_SUBMITTING)
+                self._start(run_name)
+        self.jobs_changed.emit()
+
+    def _start(self, run_name: str) -> None:
+        worker = self.worker_factory(self.jobs()[run_name])
+        thread = QThread()
+        worker.moveToThread(thread)
+        self._active[run_name] = (worker, thread)
+
+        # Bookkeeping runs in the worker thread, so it is saved even during shutdown
+        worker.job_started.connect(lambda pid: self._update(run_name, state=JOB_RUNNING, pid=pid),
+                                   Qt.ConnectionType.DirectConnection)
+        worker.log_offset.connect(lambda offset: self._update(run_name, offset=offset, force=False),
+                                  Qt.ConnectionType.DirectConnection)
+
+        worker.progress.connect(lambda message: self.progress.emit(run_name, message))
+        worker.finished.connect(lambda success, message: self._on_done(run_name, success, message))
+        worker.error.connect(lambda message: self._on_done(run_name, False, message, error=True))
+        worker.unreachable.connect(lambda message: self._on_unreachable(run_name, message))
+        thread.started.connect(worker.run)
+        thread.start()
+
+    def _on_done(self, run_name: str, success: bool, message: str, error: bool = False) -> None:
+        self._end_worker(run_name)
+
+        with self._lock:
+            self._jobs.pop(run_name, None)
+        self._save(force=True)
+
+        if error:
+            self.error.emit(run_name, message)
+        else:
+            self.finished.emit(run_name, success, message)
+        self._dispatch()
+
+    def _on_unreachable(self, run_name: str, message: str) -> None:
+        # The job may still be running on the server: keep its record and slot, and try again later
+        self._end_worker(run_name)
+        self._waiting.add(run_name)
+        logger.warning(f"Remote run {run_name} unreachable, re-attaching in {self.reattach_delay_ms // 1000}s: {message}")
+        self.progress.emit(run_name, f"Server unreachable, will re-attach: {message}")
+        QTimer.singleShot(self.reattach_delay_ms, lambda: self._reattach(run_name))
+
+    def _reattach(self, run_name: str) -> None:
+        self._waiting.discard(run_name)
+        job = self.jobs().get(run_name)
+        if job is None or run_name in self._active:
+            return
+        if job.get("pid"):
+            self._start(run_name)
+        else:
+            # Lost before the job was started; submit it again
+            self._update(run_name, state=JOB_QUEUED)
+            self._dispatch()
+
+    def _end_worker(self, run_name: str) -> None:
+        entry = self._active.pop(run_name, None)
+        if entry is not None:
+            worker, thread = entry
+            thread.quit()
+            thread.wait()
+            worker.deleteLater()
+            thread.deleteLater()
+
+    def _update(self, run_name: str, force: bool = True, **fields) -> None:
+        with self._lock:
+            job = self._jobs.get(run_name)
+            if job is None:
+                return
+            job.update(fields)
+        self._save(force)
+
+    def _save(self, force: bool = True) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_save < _SAVE_INTERVAL:
+                return
+            self._last_save = now
+            jobs = {name: dict(job) for name, job in self._jobs.items()}
+
+            try:
+                ensure_directory(os.path.dirname(self.jobs_path))
+                tmp_path = f"{self.jobs_path}.tmp"
+                json_write(tmp_path, jobs)
+                os.replace(tmp_path, self.jobs_path)
+            except OSError as e:
+                logger.error(f"Failed to save remote job queue: {e}")
@@ -0,0 +1,116 @@
+import threading
+import time
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+from src.utils.remote.ssh import SSHSession
+
+logger = OmixForgeLogger.get_logger()
+
+
+def server_key(server: dict) -> tuple:
+    """Return the identity of a server entry from the server settings."""
+    port = server.get("port")
+    return (
+        server.get("host"),
+        None if port in (None, "") else str(port),
+        server.get("username"),
+        server.get("key_path"),
+    )
+
+
+class SSHSessionManager:
+    """
+    Keeps one multiplexed connection per configured server.
+
+    Sessions are keyed by host, port, user and key, so every remote
+    operation on the same server (submission steps, log polling, result
+    retrieval) runs as a channel of a single authenticated connection.
+    connection() checks that the connection is alive and reopens it, with
+    backoff, when the network or the server dropped it.
+    """
+
+    _manager = None
+
+    @staticmethod
+    def get_manager():
+        """
+        Returns the shared session manager.
+        Creates it on first use.
+        """
+        if SSHSessionManager._manager is None:
+            SSHSessionManager._manager = SSHSessionManager()
+        return SSHSessionManager._manager
+
+    def __init__(self, retries: int = 3, backoff: float = 2.0):
+        """Initialize the manager.
+
+        Parameters
+        ----------
+        retries : int
+            Connection attempts before giving up.
+        backoff : float
+            Seconds to wait after the first failed attempt; doubled each time.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._connect_locks = {}
+
+    def session(self, server: dict) -> SSHSession:
+        """Return the session of server without connecting it."""
+        key = server_key(server)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = SSHSession.from_server(server)
+                self._sessions[key] = session
+            return session
+
+    def connection(self, server: dict) -> SSHSession:
+        """Return the session of server with its connection up.
+
+        Raises
+        ------
+        ConnectionError
+            If the server cannot be reached after all retries.
+        """
+        session = self.session(server)
+        # One connect attempt per server at a time; others wait and reuse it.
+        # Looked up under the manager lock, as close() and close_all() drop them
+        with self._lock:
+            connect_lock = self._connect_locks.setdefault(server_key(server), threading.Lock())
+        with connect_lock:
+            if session.is_alive():
+                return session
+
+            delay = self.backoff
+            for attempt in range(1, self.retries + 1):
+                if session.connect():
+                    if attempt > 1:
+                        logger.info(f"Reconnected to {session.host} after {attempt} attempts")
+                    return session
+                logger.warning(f"SSH connection to {session.host} failed (attempt {attempt}/{self.retries})")
+                if attempt < self.retries:
+                    time.sleep(delay)
+                    delay *= 2
+
+        raise ConnectionError(f"Could not connect to {session.host} as {session.user}")
+
+    def close(self, server: dict) -> None:
+        """Close and forget the connection of server."""
+        key = server_key(server)
+        with self._lock:
+            session = self._sessions.pop(key, None)
+            self._connect_locks.pop(key, None)
+        if session is not None:
+            session.close()
+
+    def close_all(self) -> None:
+        """Close every connection, e.g. when the application exits."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._connect_locks.clear()
+        for session in sessions:
+            session.close()
@@ -0,0 +1,206 @@
+import hashlib
+import os
+import stat
+import subprocess
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+
+
+def default_control_dir() -> str:
+    """Return the directory for ControlMaster sockets.
+
+    Unix socket paths are limited to ~104 bytes, so the sockets live in a
+    short per-user directory rather than under CONFIG_DIR, named by a hash
+    of the connection: $XDG_RUNTIME_DIR, or ~/.ssh where there is none.
+    Neither can be pre-created by another user, unlike a path in /tmp.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    base = runtime_dir if runtime_dir and os.path.isdir(runtime_dir) else os.path.join(os.path.expanduser("~"), ".ssh")
+    return os.path.join(base, "omixforge-cm")
+
+
+def ensure_private_dir(path: str) -> None:
+    """Create path as a directory only its owner can use, or check that it is one.
+
+    Raises
+    ------
+    PermissionError
+        If path exists but is a symlink, not a directory, owned by another
+        user or open to others; its sockets could be planted or hijacked.
+    """
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    except FileExistsError:
+        pass  # e.g. a dangling symlink; rejected below
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) != 0o700:
+        raise PermissionError(f"Refusing to use SSH control directory {path}: "
+                              f"it must be a directory owned by uid {os.getuid()} with mode 0700")
+
+
+CONTROL_DIR = default_control_dir()
+CONTROL_PERSIST = "30m"
+# Probe the server every 15 s and drop the connection after 3 missed replies
+SERVER_ALIVE_INTERVAL = 15
+SERVER_ALIVE_COUNT_MAX = 3
+
+
+class SSHSession:
+    """
+    One multiplexed SSH connection to a configured server.
+
+    Every ssh and scp command of the session goes through an OpenSSH
+    ControlMaster socket: the master connection is opened in the background
+    before the first command and the commands attach to it, so there is a
+    single TCP connection and key exchange no matter how many commands or
+    transfers run, also in parallel. If the master is gone, commands fall
+    back to connecting on their own.
+    """
+
+    def __init__(self, host: str, user: str, key_path: str, port=None, control_dir: str = CONTROL_DIR):
+        """Describe the connection; nothing is opened until the first command.
+
+        Parameters
+        ----------
+        host : str
+            Server host name or address.
+        user : str
+            Remote user name.
+        key_path : str
+            Private key used for authentication.
+        port : int or str, optional
+            SSH port; the ssh default when omitted or empty.
+        control_dir : str
+            Directory for the ControlMaster socket.
+        """
+        if not all([host, user, key_path]):
+            raise ValueError("Incomplete SSH server configuration")
+
+        self.host = host
+        self.user = user
+        self.key_path = key_path
+        self.port = None if port in (None, "") else str(port)
+        self.control_dir = control_dir
+        self._master = False
+
+    @classmethod
+    def from_server(cls, server: dict):
+        """Build a session from an entry of the SSH server settings."""
+        return cls(server.get("host"), server.get("username"), server.get("key_path"), server.get("port"))
+
+    @property
+    def target(self) -> str:
+        return f"{self.user}@{self.host}"
+
+    @property
+    def control_path(self) -> str:
+        digest = hashlib.sha1(f"{self.target}:{self.port}:{self.key_path}".encode()).hexdigest()[:20]
+        return os.path.join(self.control_dir, digest)
+
+    def _options(self, master: str = "no") -> list:
+        return [
+            "-i", self.key_path,
+            "-o", "BatchMode=yes",
+            "-o", f"ControlMaster={master}",
+            "-o", f"ControlPath={self.control_path}",
+            "-o", f"ControlPersist={CONTROL_PERSIST}",
+            "-o", f"ServerAliveInterval={SERVER_ALIVE_INTERVAL}",
+            "-o", f"ServerAliveCountMax={SERVER_ALIVE_COUNT_MAX}",
+        ]
+
+    def ssh_args(self, command: str = None, *extra, master: str = "no") -> list:
+        """Return the ssh argv that runs command over the shared connection."""
+        args = ["ssh", *self._options(master)]
+        if self.port is not None:
+            args += ["-p", self.port]
+        args += [*extra, self.target]
+        if command is not None:
+            args.append(command)
+        return args
+
+    def scp_args(self, sources: list, destination: str, recursive: bool = False) -> list:
+        """Return the scp argv for sources -> destination.
+
+        Remote paths are passed as "remote:<path>" and expanded to
+        user@host:<path>.
+        """
+        args = ["scp", *self._options()]
+        if self.port is not None:
+            args += ["-P", self.port]
+        if recursive:
+            args.append("-r")
+        return args + [self._expand(p) for p in [*sources, destination]]
+
+    def _expand(self, path: str) -> str:
+        path = str(path)
+        return f"{self.target}:{path[len('remote:'):]}" if path.startswith("remote:") else path
+
+    def _ensure_master(self) -> None:
+        if not self._master:
+            self._master = self.connect()
+
+    def run(self, command: str, input=None, text: bool = True, timeout: float = None) -> subprocess.CompletedProcess:
+        """Run command on the server and capture its output."""
+        self._ensure_master()
+        return subprocess.run(self.ssh_args(command), input=input, capture_output=True, text=text, timeout=timeout)
+
+    def popen(self, command: str, **kwargs) -> subprocess.Popen:
+        """Start command on the server without waiting for it."""
+        self._ensure_master()
+        return subprocess.Popen(self.ssh_args(command), **kwargs)
+
+    def upload(self, local_path: str, remote_path: str, recursive: bool = False) -> subprocess.CompletedProcess:
+        """Copy a local file (or directory, with recursive) to the server."""
+        self._ensure_master()
+        return subprocess.run(self.scp_args([local_path], f"remote:{remote_path}", recursive),
+                              capture_output=True, text=True)
+
+    def download(self, remote_path: str, local_path: str, recursive: bool = False) -> subprocess.CompletedProcess:
+        """Copy a remote file (or directory, with recursive) to local_path."""
+        self._ensure_master()
+        return subprocess.run(self.scp_args([f"remote:{remote_path}"], str(local_path), recursive),
+                              capture_output=True, text=True)
+
+    def connect(self, timeout: float = 30) -> bool:
+        """Open the master connection in the background; returns True when it is usable."""
+        if self.is_alive():
+            self._master = True
+            return True
+
+        ensure_private_dir(self.control_dir)
+        # A master that was killed leaves its socket behind, which would stop a new one from binding
+        if os.path.exists(self.control_path):
+            os.remove(self.control_path)
+        try:
+            # The master must not inherit our pipes, or reading them would
+            # block until it exits; -f returns once authentication is done
+            proc = subprocess.run(self.ssh_args(None, "-N", "-f", master="yes"), stdin=subprocess.DEVNULL,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        self._master = proc.returncode == 0
+        return self._master
+
+    def is_alive(self) -> bool:
+        """Return True if the master connection is up."""
+        try:
+            return subprocess.run(self.ssh_args(None, "-O", "check"), capture_output=True, timeout=10).returncode == 0
+        except subprocess.TimeoutExpired:
+            return False
+
+    def close(self) -> None:
+        """Shut the master connection down."""
+        try:
+            self._master = False
+            subprocess.run(self.ssh_args(None, "-O", "exit"), capture_output=True, text=True, timeout=10)
+        except Exception as e:
+            logger.warning(f"Failed to close SSH connection to {self.host}: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
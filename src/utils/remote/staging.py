@@ -0,0 +1,243 @@
+import os
+import shutil
+import subprocess
+import threading
+
+from src.utils.constants import STAGING_HASHES_JSON
+from src.utils.fileops.file_handle import ensure_directory, file_sha256, json_read, json_write
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+from src.utils.remote.transfer import DEFAULT_TRANSFERS, TransferCancelled, TransferPool
+
+logger = OmixForgeLogger.get_logger()
+
+_BLOCK_SIZE = 1024 * 1024
+
+# Prints the size of every listed cache object (and partial upload) that exists
+_SIZES_SCRIPT = (
+    'mkdir -p "{dir}" && cd "{dir}" && '
+    'while read -r f; do [ -f "$f" ] && printf "%s %s\\n" "$f" "$(wc -c < "$f")"; done; true'
+)
+# Checks a finished upload against its hash before it becomes visible in the cache
+_VERIFY_SCRIPT = (
+    'cd "{dir}" && sum=$( (sha256sum "{part}" 2>/dev/null || shasum -a 256 "{part}") | cut -d" " -f1 ) && '
+    'if [ "$sum" = "{digest}" ]; then mv -f "{part}" "{digest}"; '
+    'else rm -f "{part}"; echo "checksum mismatch for {digest}" >&2; exit 1; fi'
+)
+_LINK_SCRIPT = 'tab=$(printf "\\t"); while IFS="$tab" read -r target link; do ln -sfn "$target" "$link" || exit 1; done'
+
+
+class HashCache:
+    """
+    Persistent sha256 cache for local data files.
+
+    Entries are keyed by absolute path and hold the size and mtime the hash
+    was computed for, so unchanged files are never read twice.
+    """
+
+    def __init__(self, cache_path: str = STAGING_HASHES_JSON):
+        """Load the cache.
+
+        Parameters
+        ----------
+        cache_path : str
+            JSON file the hashes are kept in.
+        """
+        self.cache_path = str(cache_path)
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            self._entries = json_read(self.cache_path)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def digest(self, file_path: str) -> str:
+        """Return the sha256 of file_path, hashing it only if it changed."""
+        path = os.path.abspath(str(file_path))
+        stat = os.stat(path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        sha256 = file_sha256(path)
+        with self._lock:
+            self._entries[path] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha256": sha256}
+            self._dirty = True
+        return sha256
+
+    def save(self) -> None:
+        """Write the cache back, dropping entries of files that are gone."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {path: entry for path, entry in self._entries.items() if os.path.exists(path)}
+            self._entries = entries
+            self._dirty = False
+
+        try:
+            ensure_directory(os.path.dirname(self.cache_path))
+            tmp_path = f"{self.cache_path}.tmp"
+            json_write(tmp_path, entries)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.error(f"Failed to save staging hash cache: {e}")
+
+
+class RemoteStager:
+    """
+    Content-addressed staging of data files on a remote server.
+
+    Each file is uploaded once per server into a cache directory, named by
+    its sha256; runs get symlinks to the cached copy. Uploads go to
+    <hash>.part and resume from its current size, and a file only enters the
+    cache after the server-side checksum matches. cancel() stops hashing
+    and ends the uploads in flight, leaving their .part files to resume from.
+    """
+
+    def __init__(self, session, max_transfers: int = DEFAULT_TRANSFERS, hash_cache: HashCache = None,
+                 staging_dir: str = None):
+        """Create a stager.
+
+        Parameters
+        ----------
+        session : SSHSession
+            Connection to the server.
+        max_transfers : int
+            Number of files uploaded concurrently.
+        hash_cache : HashCache, optional
+            Local hash cache; the shared one under CONFIG_DIR by default.
+        staging_dir : str, optional
+            Remote cache directory; ~/.omixforge/staging of the remote user by default.
+        """
+        self.session = session
+        self.max_transfers = max_transfers
+        self.hash_cache = hash_cache or HashCache()
+        self.staging_dir = staging_dir or f"/home/{session.user}/.omixforge/staging"
+        self._cancelled = threading.Event()
+        self._uploads = set()  # upload processes in flight
+        self._uploads_lock = threading.Lock()
+
+    def cancel(self) -> None:
+        """Stop staging from another thread; stage() then raises TransferCancelled."""
+        self._cancelled.set()
+        with self._uploads_lock:
+            for proc in self._uploads:
+                proc.terminate()
+
+    def stage(self, files: list, progress=None) -> list:
+        """Make every remote path a symlink to a verified copy of its local file.
+
+        Parameters
+        ----------
+        files : list
+            (local_path, remote_path) tuples.
+        progress : callable, optional
+            Called with status messages.
+
+        Returns
+        -------
+        list
+            Local paths that were already on the server and not sent again.
+
+        Raises
+        ------
+        TransferError
+            If an upload or its verification fails.
+        TransferCancelled
+            If cancel() was called.
+        RuntimeError
+            If the remote cache cannot be queried or linked.
+        """
+        if not files:
+            return []
+        progress = progress or (lambda message: None)
+
+        digests = {}
+        for i, (local, _) in enumerate(files, 1):
+            self._check_cancelled()
+            progress(f"Hashing data files ({i}/{len(files)})...")
+            digests[local] = self.hash_cache.digest(local)
+        self.hash_cache.save()
+
+        remote_sizes = self._remote_sizes(set(digests.values()))
+
+        pending, queued = [], set()
+        for local, remote in files:
+            digest = digests[local]
+            if digest not in remote_sizes and digest not in queued:
+                queued.add(digest)
+                pending.append((local, remote))
+
+        reused = [local for local, _ in files if digests[local] in remote_sizes]
+        if reused:
+            progress(f"Reusing {len(reused)} data file(s) already staged on {self.session.host}")
+
+        def send(local, _remote):
+            digest = digests[local]
+            return self._send(local, digest, remote_sizes.get(f"{digest}.part", 0))
+
+        TransferPool(self.session, self.max_transfers).upload(pending, progress=progress, transfer=send)
+        self._check_cancelled()
+        self._link([(f"{self.staging_dir}/{digests[local]}", remote) for local, remote in files])
+        return reused
+
+    def _check_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise TransferCancelled("Staging was cancelled")
+
+    def _remote_sizes(self, digests: set) -> dict:
+        """Return {name: size} of the cache objects and partial uploads present."""
+        names = [name for digest in sorted(digests) for name in (digest, f"{digest}.part")]
+        proc = self.session.run(_SIZES_SCRIPT.format(dir=self.staging_dir), input="\n".join(names) + "\n")
+        if proc.returncode != 0:
+            raise RuntimeError(f"Failed to query remote staging cache: {proc.stderr}")
+
+        sizes = {}
+        for line in proc.stdout.splitlines():
+            name, _, size = line.strip().partition(" ")
+            if size.isdigit():
+                sizes[name] = int(size)
+        return sizes
+
+    def _send(self, local: str, digest: str, offset: int = 0) -> subprocess.CompletedProcess:
+        """Upload local into the cache from offset on, then verify it."""
+        part = f"{digest}.part"
+        if offset > os.path.getsize(local):
+            offset = 0
+
+        if offset:
+            logger.info(f"Resuming upload of {local} at byte {offset}")
+        with self._uploads_lock:
+            self._check_cancelled()
+            proc = self.session.popen(
+                f'cat {">>" if offset else ">"} "{self.staging_dir}/{part}"',
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            )
+            self._uploads.add(proc)
+        try:
+            with open(local, "rb") as f:
+                f.seek(offset)
+                shutil.copyfileobj(f, proc.stdin, _BLOCK_SIZE)
+        except BrokenPipeError:
+            pass
+        finally:
+            _, stderr = proc.communicate()
+            with self._uploads_lock:
+                self._uploads.discard(proc)
+        self._check_cancelled()
+        if proc.returncode != 0:
+            return subprocess.CompletedProcess(proc.args, proc.returncode, "", stderr.decode("utf-8", errors="ignore"))
+
+        verify = self.session.run(_VERIFY_SCRIPT.format(dir=self.staging_dir, part=part, digest=digest))
+        if verify.returncode != 0 and offset:
+            # The partial upload may be stale or corrupt; start over once
+            logger.warning(f"Resumed upload of {local} failed verification, sending it again")
+            return self._send(local, digest, 0)
+        return verify
+
+    def _link(self, links: list) -> None:
+        """Create (target, link) symlinks on the server in one command."""
+        proc = self.session.run(_LINK_SCRIPT, input="".join(f"{target}\t{link}\n" for target, link in links))
+        if proc.returncode != 0:
+            raise RuntimeError(f"Failed to link staged data files: {proc.stderr}")
@@ -0,0 +1,108 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_TRANSFERS = 4
+
+
+def format_size(size: int) -> str:
+    """Return size in bytes as a short human readable string."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class TransferError(RuntimeError):
+    """A file could not be transferred; the message carries scp's stderr."""
+
+
+class TransferCancelled(TransferError):
+    """Transfers were cancelled before they finished."""
+
+
+class TransferPool:
+    """
+    Copies many files to a server over one SSHSession, several at a time.
+
+    Transfers share the session's multiplexed connection, so raising the
+    concurrency adds channels, not connections. Aggregate progress (files and
+    bytes done out of the total) is reported after every finished file.
+    """
+
+    def __init__(self, session, max_transfers: int = DEFAULT_TRANSFERS):
+        """Create a transfer pool.
+
+        Parameters
+        ----------
+        session : SSHSession
+            Connection the transfers go through.
+        max_transfers : int
+            Number of files copied concurrently.
+        """
+        self.session = session
+        self.max_transfers = max(1, int(max_transfers or DEFAULT_TRANSFERS))
+
+    def upload(self, files: list, progress=None, transfer=None) -> list:
+        """Copy (local_path, remote_path) pairs to the server.
+
+        Parameters
+        ----------
+        files : list
+            (local_path, remote_path) tuples.
+        progress : callable, optional
+            Called with a status message after each finished file.
+        transfer : callable, optional
+            Copies one pair and returns a CompletedProcess; defaults to
+            session.upload.
+
+        Returns
+        -------
+        list
+            The pairs, once all of them have been copied.
+
+        Raises
+        ------
+        TransferError
+            If any copy fails; transfers not yet started are cancelled.
+        """
+        if not files:
+            return []
+
+        sizes = [self._size(local) for local, _ in files]
+        total_bytes = sum(sizes)
+        done_files = 0
+        done_bytes = 0
+
+        transfer = transfer or self.session.upload
+
+        with ThreadPoolExecutor(max_workers=self.max_transfers, thread_name_prefix="transfer") as executor:
+            futures = {
+                executor.submit(transfer, local, remote): (local, size)
+                for (local, remote), size in zip(files, sizes)
+            }
+            try:
+                for future in as_completed(futures):
+                    local, size = futures[future]
+                    proc = future.result()
+                    if proc.returncode != 0:
+                        raise TransferError(f"Failed to copy data file {local}: {proc.stderr}")
+
+                    done_files += 1
+                    done_bytes += size
+                    if progress is not None:
+                        progress(
+                            f"Copied {done_files}/{len(files)} data files "
+                            f"({format_size(done_bytes)} of {format_size(total_bytes)})"
+                        )
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+        return list(files)
+
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+import time
+
+from src.utils.constants import RUN_INDEX_JSONL
+from src.utils.fileops.file_handle import ensure_directory, list_files_in_directory, file_exists
+from src.utils.fileops.log_tail import LogTailer, RUN_RUNNING, RUN_COMPLETED, RUN_FAILED, RUN_CANCELLED, RUN_QUEUED
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+
+class RunIndex:
+    """
+    Append-only JSON-lines journal of run states.
+
+    Every state change is appended as one line, e.g.
+    ``{"run": "demo_..._run.txt", "state": "completed", "exit_code": 0, "ts": ...}``.
+    The journal is replayed once on load, after which lookups are served
+    from memory.
+    """
+
+    _index = None
+
+    @staticmethod
+    def get_index():
+        """
+        Returns the shared run index.
+        Creates it on first use.
+        """
+        if RunIndex._index is None:
+            RunIndex._index = RunIndex()
+        return RunIndex._index
+
+    def __init__(self, index_path: str = RUN_INDEX_JSONL):
+        """Load the run index from its journal.
+
+        Parameters
+        ----------
+        index_path : str
+            Path to the JSON-lines journal.
+        """
+        self.index_path = str(index_path)
+        self._lock = threading.Lock()
+        self._runs = {}
+        self._migrated = False
+        self._lines = 0
+        self._load()
+
+        # Superseded entries pile up over time; keep the journal close to one line per run
+        if self._lines > 2 * len(self._runs) + 64:
+            self.compact()
+
+    def record(self, run_name: str, state: str, exit_code: int = None) -> None:
+        """Record a state change for a run.
+
+        Parameters
+        ----------
+        run_name : str
+            Name of the run log in PIPELINES_RUNS.
+        state : str
+            One of RUN_QUEUED, RUN_RUNNING, RUN_COMPLETED, RUN_FAILED or RUN_CANCELLED.
+        exit_code : int, optional
+            Exit code of the pipeline process, when known.
+        """
+        entry = {"run": run_name, "state": state, "ts": time.time()}
+        if exit_code is not None:
+            entry["exit_code"] = exit_code
+
+        with self._lock:
+            self._runs[run_name] = entry
+            self._append(entry)
+
+    def record_exit(self, run_name: str, exit_code: int) -> None:
+        """Record the end of a run from its exit code."""
+        self.record(run_name, RUN_COMPLETED if exit_code == 0 else RUN_FAILED, exit_code)
+
+    def forget(self, run_name: str) -> None:
+        """Remove a run from the index, e.g. after its log was deleted."""
+        with self._lock:
+            if self._runs.pop(run_name, None) is not None:
+                self._append({"run": run_name, "deleted": True, "ts": time.time()})
+
+    def get(self, run_name: str) -> dict | None:
+        """Return the latest entry of a run, or None if it is not indexed."""
+        return self._runs.get(run_name)
+
+    def state(self, run_name: str, default: str = None) -> str | None:
+        """Return the latest state of a run."""
+        entry = self._runs.get(run_name)
+        return entry["state"] if entry else default
+
+    def runs(self) -> dict:
+        """Return a copy of all indexed runs keyed by run name."""
+        return dict(self._runs)
+
+    def backfill(self, pipelines_runs_dir: str) -> int:
+        """
+        Index runs that only exist as text logs.
+        Runs once; later calls return immediately.
+
+        Returns
+        -------
+        int
+            Number of runs added to the index.
+        """
+        if self._migrated:
+            return 0
+
+        tailer = LogTailer()
+        added = 0
+        for name in list_files_in_directory(pipelines_runs_dir):
+            if name in self._runs:
+                continue
+            state = tailer.status(os.path.join(str(pipelines_runs_dir), name))
+            exit_code = {RUN_COMPLETED: 0, RUN_FAILED: 1}.get(state)
+            self.record(name, state, exit_code)
+            added += 1
+
+        with self._lock:
+            self._migrated = True
+            self._append({"migrated": True, "ts": time.time()})
+
+        logger.info(f"Run index backfilled with {added} runs from {pipelines_runs_dir}")
+        self.compact()
+        return added
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the latest entry of every run."""
+        with self._lock:
+            entries = list(self._runs.values())
+            if self._migrated:
+                entries.append({"migrated": True, "ts": time.time()})
+
+            tmp_path = f"{self.index_path}.tmp"
+            try:
+                ensure_directory(os.path.dirname(self.index_path))
+                with open(tmp_path, "w") as f:
+                    for entry in entries:
+                        f.write(json.dumps(entry) + "\n")
+                os.replace(tmp_path, self.index_path)
+                self._lines = len(entries)
+            except OSError as e:
+                logger.error(f"Error compacting run index '{self.index_path}': {e}")
+
+    def _load(self) -> None:
+        """Replay the journal into memory."""
+        if not file_exists(self.index_path):
+            return
+
+        with open(self.index_path, "r") as f:
+            for line in f:
+                self._lines += 1
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from an interrupted write
+                    continue
+
+                if entry.get("migrated"):
+                    self._migrated = True
+                elif entry.get("deleted"):
+                    self._runs.pop(entry.get("run"), None)
+                elif entry.get("run"):
+                    self._runs[entry["run"]] = entry
+
+    def _append(self, entry: dict) -> None:
+        """Append one entry to the journal. Caller must hold the lock."""
+        try:
+            ensure_directory(os.path.dirname(self.index_path))
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._lines += 1
+        except OSError as e:
+            logger.error(f"Error writing run index '{self.index_path}': {e}")
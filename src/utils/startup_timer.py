@@ -0,0 +1,91 @@
+import time
+
+# Taken before Qt is imported; __main__ imports this module first
+IMPORTED_AT = time.perf_counter()
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+FIRST_PAINT = "first_paint"
+INTERACTIVE = "interactive"
+MAIN_UI_FIRST_PAINT = "main_ui_first_paint"
+MAIN_UI_INTERACTIVE = "main_ui_interactive"
+
+
+class StartupTimer(QObject):
+    """
+    Milestones of application startup, in seconds since the timer began.
+
+    first paint is the first Paint event of the watched window; a stage is
+    interactive once the event loop is idle after it, i.e. input is handled
+    without waiting on startup work.
+    """
+
+    _timer = None
+
+    @staticmethod
+    def get_timer():
+        """
+        Returns the shared startup timer.
+        Creates it on first use; it counts from the import of this module.
+        """
+        if StartupTimer._timer is None:
+            StartupTimer._timer = StartupTimer(started=IMPORTED_AT)
+        return StartupTimer._timer
+
+    def __init__(self, clock=time.perf_counter, started: float = None, parent=None):
+        """Start timing.
+
+        Parameters
+        ----------
+        clock : callable
+            Monotonic clock returning seconds.
+        started : float, optional
+            Clock reading startup counts from; now if omitted.
+        parent : QObject, optional
+            Parent object for this timer.
+        """
+        super().__init__(parent)
+        self.clock = clock
+        self.started = clock() if started is None else started
+        self.marks = {}
+        self._paint_marks = {}  # watched widget -> mark for its next Paint event
+        self._listeners = []
+
+    def mark(self, name: str) -> float:
+        """Record a milestone once and return its time."""
+        if name not in self.marks:
+            self.marks[name] = self.clock() - self.started
+            logger.info(f"Startup: {name} after {self.marks[name] * 1000:.0f} ms")
+            for listener in list(self._listeners):
+                listener(name, self.marks[name])
+        return self.marks[name]
+
+    def mark_when_idle(self, name: str) -> None:
+        """Record a milestone once the event loop has handled everything queued before it."""
+        QTimer.singleShot(0, lambda: self.mark(name))
+
+    def mark_on_paint(self, widget, name: str, then: str = None) -> None:
+        """Record name at the next Paint event of widget, and then once idle after it."""
+        self._paint_marks[widget] = (name, then)
+        widget.installEventFilter(self)
+
+    def on_mark(self, listener) -> None:
+        """Call listener(name, seconds) for every milestone recorded from now on."""
+        self._listeners.append(listener)
+
+    def report(self) -> dict:
+        """Return the milestones in milliseconds."""
+        return {name: round(seconds * 1000, 1) for name, seconds in self.marks.items()}
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and obj in self._paint_marks:
+            name, then = self._paint_marks.pop(obj)
+            obj.removeEventFilter(self)
+            self.mark(name)
+            if then:
+                self.mark_when_idle(then)
+        return False
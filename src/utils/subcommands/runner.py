@@ -0,0 +1,221 @@
+import os
+import shlex
+import signal
+import subprocess
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+# Nextflow CLI calls each start a JVM; a few may overlap, the rest wait for a slot
+DEFAULT_MAX_COMMANDS = 4
+
+
+class CommandSignals(QObject):
+    output = pyqtSignal(str)  # one line of stdout
+    finished = pyqtSignal(object)  # subprocess.CompletedProcess, exit code 0
+    error = pyqtSignal(str)  # failed to start, non-zero exit or timeout
+    done = pyqtSignal()  # always last, also after cancel()
+
+
+class CommandTask(QRunnable):
+    """
+    One external command run by a CommandRunner.
+
+    The command runs without a shell. Its stdout is emitted line by line as
+    it is produced and collected for the finished signal. A cancelled task
+    is killed and emits nothing more.
+    """
+
+    def __init__(self, command, timeout: float = None):
+        """Describe the command; it starts when the runner's pool gets to it.
+
+        Parameters
+        ----------
+        command : str or list of str
+            Command line; a string is split like a shell would.
+        timeout : float, optional
+            Seconds after which the command is killed and reported as failed.
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.args = shlex.split(command) if isinstance(command, str) else list(command)
+        self.timeout = timeout
+        self.signals = CommandSignals()
+        self._lock = threading.Lock()
+        self._process = None
+        self._cancelled = False
+        self._timed_out = False
+
+    @property
+    def command(self) -> str:
+        return shlex.join(self.args)
+
+    def cancel(self) -> None:
+        """Kill the command, or keep it from starting if it is still queued."""
+        with self._lock:
+            self._cancelled = True
+            process = self._process
+        self._kill(process)
+
+    @staticmethod
+    def _kill(process) -> None:
+        # The nextflow launcher runs java as a child; the whole group has to go
+        if process is not None and process.poll() is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                process.kill()
+
+    def _on_timeout(self) -> None:
+        with self._lock:
+            self._timed_out = True
+            process = self._process
+        logger.warning(f"Command timed out after {self.timeout}s: {self.command}")
+        self._kill(process)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            self._run()
+        finally:
+            self.signals.done.emit()
+
+    def _run(self):
+        with self._lock:
+            if self._cancelled:
+                return
+            logger.info(f"Executing command: {self.command}")
+            try:
+                self._process = subprocess.Popen(self.args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                                 stderr=subprocess.PIPE, text=True, bufsize=1,
+                                                 start_new_session=True)
+            except OSError as e:
+                logger.error(f"Error executing command '{self.command}': {e}")
+                self.signals.error.emit(str(e))
+                return
+            process = self._process
+
+        timer = threading.Timer(self.timeout, self._on_timeout) if self.timeout else None
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+
+        # stderr is drained alongside, so a chatty command cannot fill its pipe and stall
+        stderr = []
+        drain = threading.Thread(target=lambda: stderr.append(process.stderr.read()), daemon=True)
+        drain.start()
+
+        stdout = []
+        try:
+            for line in process.stdout:
+                stdout.append(line)
+                if not self._cancelled:
+                    self.signals.output.emit(line.rstrip("\n"))
+            process.wait()
+            drain.join()
+        finally:
+            if timer is not None:
+                timer.cancel()
+            process.stdout.close()
+            process.stderr.close()
+
+        if self._cancelled:
+            return
+        result = subprocess.CompletedProcess(self.args, process.returncode, "".join(stdout), "".join(stderr))
+        if self._timed_out:
+            self.signals.error.emit(f"'{self.command}' timed out after {self.timeout}s")
+        elif result.returncode != 0:
+            logger.error(f"Error executing command '{self.command}': {result.stderr}")
+            self.signals.error.emit(result.stderr.strip() or f"'{self.command}' exited with code {result.returncode}")
+        else:
+            self.signals.finished.emit(result)
+
+
+class CommandRunner:
+    """
+    Runs external commands on a bounded thread pool, off the Qt event loop.
+
+    Results arrive through the task's signals, which are delivered in the
+    thread that connected them, so GUI code can update widgets directly in
+    its callbacks.
+    """
+
+    _runner = None
+
+    @staticmethod
+    def get_runner():
+        """
+        Returns the shared command runner.
+        Creates it on first use.
+        """
+        if CommandRunner._runner is None:
+            CommandRunner._runner = CommandRunner()
+        return CommandRunner._runner
+
+    def __init__(self, max_commands: int = DEFAULT_MAX_COMMANDS):
+        """Create the pool.
+
+        Parameters
+        ----------
+        max_commands : int
+            Commands that may run at the same time.
+        """
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_commands)
+        self._tasks = set()
+        self._lock = threading.Lock()
+
+    def submit(self, command, on_finished=None, on_error=None, on_output=None, timeout: float = None) -> CommandTask:
+        """Queue a command and return its task.
+
+        Parameters
+        ----------
+        command : str or list of str
+            Command line to run.
+        on_finished : callable, optional
+            Called with the CompletedProcess when the command exits with 0.
+        on_error : callable, optional
+            Called with a message when it cannot start, fails or times out.
+        on_output : callable, optional
+            Called with each line of stdout as it is written.
+        timeout : float, optional
+            Seconds before the command is killed.
+
+        Returns
+        -------
+        CommandTask
+            The task, e.g. to cancel() it.
+        """
+        task = CommandTask(command, timeout)
+        if on_finished is not None:
+            task.signals.finished.connect(on_finished)
+        if on_error is not None:
+            task.signals.error.connect(on_error)
+        if on_output is not None:
+            task.signals.output.connect(on_output)
+
+        # Keep the task (and its signals) alive until it has run
+        with self._lock:
+            self._tasks.add(task)
+        task.signals.done.connect(lambda: self._forget(task))
+        self.pool.start(task)
+        return task
+
+    def _forget(self, task) -> None:
+        with self._lock:
+            self._tasks.discard(task)
+
+    def cancel_all(self) -> None:
+        """Cancel every queued and running command."""
+        with self._lock:
+            tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+
+    def wait(self, timeout_ms: int = -1) -> bool:
+        """Block until all commands are done; for shutdown and tests."""
+        return self.pool.waitForDone(timeout_ms)
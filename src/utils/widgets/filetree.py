@@ -1,5 +1,6 @@
 
 import os
+import tempfile
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem
 )
@@ -13,9 +14,12 @@ class FilesTreeWidget(QWidget):
     """
     Embedded widget that shows a directory tree.
     Double-clicking a file opens it in a FileViewerWindow.
+
+    Given an IndexedArchiveReader, the tree lists the archive members below
+    root_dir instead, and files are decrypted one at a time when opened.
     """
 
-    def __init__(self, root_dir: str, allowed_exts: list[str], parent=None, exclude_dirs: list[str] = None):
+    def __init__(self, root_dir: str, allowed_exts: list[str], parent=None, exclude_dirs: list[str] = None, archive=None):
         """Initialize the file tree widget with a root directory.
         
         Parameters
@@ -26,10 +30,16 @@ class FilesTreeWidget(QWidget):
             List of file extensions to include (e.g., ['.txt', '.csv']).
         parent : QWidget, optional
             Parent widget for this widget.
+        exclude_dirs : list[str], optional
+            Directory names to leave out of the tree.
+        archive : IndexedArchiveReader, optional
+            Browse this archive; root_dir is then the member name of the run folder.
         """
         super().__init__(parent)
 
-        self.root_dir = os.path.abspath(root_dir)
+        self.archive = archive
+        self.root_dir = root_dir if archive else os.path.abspath(root_dir)
+        self._temp_dir = None  # holds members opened in external apps
         self.allowed_exts = allowed_exts
         self._viewer_windows = []  # prevent GC
         self.exclude_dirs = exclude_dirs if exclude_dirs else []
@@ -53,9 +63,45 @@ class FilesTreeWidget(QWidget):
         root_item.setData(0, Qt.ItemDataRole.UserRole, self.root_dir)
         self.tree.addTopLevelItem(root_item)
 
-        self._add_children(root_item, self.root_dir)
+        if self.archive:
+            self._add_archive_members(root_item)
+        else:
+            self._add_children(root_item, self.root_dir)
         root_item.setExpanded(True)
 
+    def _add_archive_members(self, root_item):
+        """Add archive members below root_dir from the archive index.
+        
+        Parameters
+        ----------
+        root_item : QTreeWidgetItem
+            Tree item of the run folder.
+        """
+        items = {self.root_dir: root_item}
+        prefix = f"{self.root_dir}/"
+
+        # Members are stored parents first, so every parent item exists before its children
+        for member in self.archive.members():
+            name = member["name"]
+            if not name.startswith(prefix):
+                continue
+
+            parent_path, base = name.rsplit("/", 1)
+            parent_item = items.get(parent_path)
+            if parent_item is None or any(skip in name.split("/") for skip in self.exclude_dirs):
+                continue
+
+            if member["type"] == "dir":
+                item = QTreeWidgetItem([base])
+                item.setData(0, Qt.ItemDataRole.UserRole, name)
+                parent_item.addChild(item)
+                items[name] = item
+
+            elif member["type"] == "file" and os.path.splitext(base)[1].lower() in self.allowed_exts:
+                item = QTreeWidgetItem([base])
+                item.setData(0, Qt.ItemDataRole.UserRole, name)
+                parent_item.addChild(item)
+
     # ------------------------------------------------------------------
 
     def _add_children(self, parent_item, path):
@@ -103,6 +149,10 @@ class FilesTreeWidget(QWidget):
         """
         path = item.data(0, Qt.ItemDataRole.UserRole)
 
+        if self.archive:
+            self._open_archive_member(path)
+            return
+
         if not os.path.isfile(path):
             return
 
@@ -117,3 +167,32 @@ class FilesTreeWidget(QWidget):
             viewer = FileViewerWindow(path, parent=self)
             viewer.show()
             self._viewer_windows.append(viewer)
+
+    def _open_archive_member(self, name):
+        """Open one archive member, decrypting only that member.
+        
+        Parameters
+        ----------
+        name : str
+            Member name inside the archive.
+        """
+        try:
+            member = self.archive.get_member(name)
+        except KeyError:
+            return
+        if member["type"] != "file":
+            return
+
+        ext = os.path.splitext(name)[1].lower()
+
+        # External apps need a real file; extract just this member to a private temp dir
+        if ext in (".html", ".pdf"):
+            if self._temp_dir is None:
+                self._temp_dir = tempfile.TemporaryDirectory(prefix="omixforge-")
+            path = self.archive.extract(name, self._temp_dir.name)
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+            return
+
+        viewer = FileViewerWindow(name, parent=self, archive=self.archive)
+        viewer.show()
+        self._viewer_windows.append(viewer)
@@ -1,27 +1,32 @@
 
 import os
+import tempfile
 from PyQt6.QtWidgets import (
     QMainWindow, QTextEdit, QScrollArea, QVBoxLayout, QWidget, QToolBar, QPushButton
 )
 from PyQt6.QtGui import QFont, QAction
 from PyQt6.QtSvgWidgets import QSvgWidget
 from PyQt6.QtGui import QDesktopServices
-from PyQt6.QtCore import QUrl
+from PyQt6.QtCore import QUrl, QByteArray
 
 class FileViewerWindow(QMainWindow):
-    def __init__(self, file_path: str, parent=None):
+    def __init__(self, file_path: str, parent=None, archive=None):
         """Initialize the file viewer window.
         
         Parameters
         ----------
         file_path : str
-            Path to the file to display.
+            Path to the file to display, or the member name when archive is given.
         parent : QWidget, optional
             Parent widget for this window.
+        archive : IndexedArchiveReader, optional
+            Encrypted archive to read the member from; the view is read-only.
         """
         super().__init__(parent)
 
         self.file_path = file_path
+        self.archive = archive
+        self._temp_dir = None
         self.setWindowTitle(os.path.basename(file_path))
         self.resize(900, 600)
 
@@ -62,13 +67,19 @@ class FileViewerWindow(QMainWindow):
         self.editor.setFont(QFont("Courier New", 10))
 
         try:
-            with open(self.file_path, "r", encoding="utf-8", errors="ignore") as f:
-                self.editor.setText(f.read())
+            if self.archive:
+                # Only this member is decrypted; archive contents cannot be saved back
+                self.editor.setText(self.archive.read(self.file_path).decode("utf-8", errors="ignore"))
+                self.editor.setReadOnly(True)
+            else:
+                with open(self.file_path, "r", encoding="utf-8", errors="ignore") as f:
+                    self.editor.setText(f.read())
         except Exception as e:
             self.editor.setText(f"Error loading file: {str(e)}")
 
         # Layout setup
-        layout.addWidget(toolbar)
+        if not self.archive:
+            layout.addWidget(toolbar)
         layout.addWidget(self.editor)
         layout.setContentsMargins(0, 0, 0, 0)
         central_widget.setLayout(layout)
@@ -91,13 +102,22 @@ class FileViewerWindow(QMainWindow):
 
     def _load_web(self):
         """Load and display HTML/web content in a browser view."""
-        QDesktopServices.openUrl(QUrl.fromLocalFile(self.file_path))
+        path = self.file_path
+        if self.archive:
+            # The browser needs a real file; extract just this member to a private temp dir
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="omixforge-")
+            path = self.archive.extract(self.file_path, self._temp_dir.name)
+        QDesktopServices.openUrl(QUrl.fromLocalFile(path))
         return
 
 
     def _load_svg(self):
         """Load and display SVG content."""
-        svg = QSvgWidget(self.file_path)
+        if self.archive:
+            svg = QSvgWidget()
+            svg.load(QByteArray(self.archive.read(self.file_path)))
+        else:
+            svg = QSvgWidget(self.file_path)
         scroll = QScrollArea()
         scroll.setWidget(svg)
         scroll.setWidgetResizable(True)
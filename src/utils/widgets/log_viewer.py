@@ -0,0 +1,206 @@
+import os
+from collections import deque
+
+from PyQt6.QtWidgets import QPlainTextEdit
+from PyQt6.QtGui import QFont, QTextCursor
+
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+
+class LogTailViewer(QPlainTextEdit):
+    """
+    Read-only viewer that follows the end of a growing log file.
+
+    Only the last tail_bytes are loaded at first. Later refreshes append the
+    bytes written since the previous read, and scrolling to the top loads
+    earlier chunks from their file offsets, up to max_history_blocks lines.
+    Scrolling back to the bottom trims the view to max_blocks again.
+    """
+
+    def __init__(self, file_path: str, tail_bytes: int = 64 * 1024, chunk_bytes: int = 64 * 1024,
+                 max_blocks: int = 5000, max_history_blocks: int = 50_000, parent=None):
+        """Initialize the viewer and load the end of the log.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the log file.
+        tail_bytes : int
+            Number of bytes shown from the end of the log on first load.
+        chunk_bytes : int
+            Number of bytes loaded each time the user scrolls past the top.
+        max_blocks : int
+            Maximum number of lines kept while following the log.
+        max_history_blocks : int
+            Maximum number of lines kept while scrolled back through earlier chunks.
+        parent : QWidget, optional
+            Parent widget for this viewer.
+        """
+        super().__init__(parent)
+        self.file_path = str(file_path)
+        self.tail_bytes = tail_bytes
+        self.chunk_bytes = chunk_bytes
+        self.max_blocks = max_blocks
+        self.max_history_blocks = max(max_blocks, max_history_blocks)
+
+        self.setReadOnly(True)
+        self.setFont(QFont("Courier New", 10))
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+
+        self._line_offsets = deque()  # file offset of every line in the document
+        self._end = 0                 # offset up to which the file has been read
+        self._pending = b""           # trailing bytes of a line not yet terminated
+
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.reload()
+
+    @property
+    def head_offset(self) -> int:
+        """File offset of the first line shown."""
+        return self._line_offsets[0] if self._line_offsets else self._end - len(self._pending)
+
+    def reload(self) -> None:
+        """Discard the document and show the end of the log again."""
+        self.clear()
+        self.setMaximumBlockCount(self.max_blocks)
+        self._line_offsets = deque(maxlen=self.max_blocks)
+        self._pending = b""
+
+        size = self._file_size()
+        start = max(0, size - self.tail_bytes)
+        data = self._read(start, size)
+
+        # Drop the partial first line when starting mid-file
+        if start > 0:
+            newline = data.find(b"\n")
+            if newline == -1:
+                data, start = b"", size
+            else:
+                data, start = data[newline + 1:], start + newline + 1
+
+        self._end = start
+        self._append_bytes(data)
+        self.moveCursor(QTextCursor.MoveOperation.End)
+
+    def refresh(self) -> None:
+        """Append whatever was written to the log since the last read."""
+        size = self._file_size()
+        if size < self._end:
+            # Truncated or replaced
+            self.reload()
+            return
+        if size == self._end:
+            return
+
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+
+        if at_bottom:
+            self._resume_following()
+        self._append_bytes(self._read(self._end, size))
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def load_earlier(self) -> int:
+        """Prepend the chunk of the log before the first line shown.
+
+        Returns
+        -------
+        int
+            Number of lines added; 0 at the start of the file or once
+            max_history_blocks lines are shown.
+        """
+        head = self.head_offset
+        room = self.max_history_blocks - len(self._line_offsets)
+        if head <= 0 or room <= 0:
+            return 0
+
+        start = max(0, head - self.chunk_bytes)
+        data = self._read(start, head)
+        if start > 0:
+            newline = data.find(b"\n")
+            if newline == -1:
+                # A single line longer than a chunk; take it whole
+                start = 0
+                data = self._read(0, head)
+            else:
+                data, start = data[newline + 1:], start + newline + 1
+
+        offsets = self._offsets(data, start)
+        if not offsets:
+            return 0
+        if len(offsets) > room:
+            offsets = offsets[-room:]
+            data, start = data[offsets[0] - start:], offsets[0]
+
+        # Make room for the older lines so they are not trimmed straight away
+        limit = len(self._line_offsets) + len(offsets)
+        self.setMaximumBlockCount(limit)
+        self._line_offsets = deque(offsets + list(self._line_offsets), maxlen=limit)
+
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.Start)
+        cursor.insertText(data.decode("utf-8", errors="replace"))
+
+        self.verticalScrollBar().setValue(len(offsets))
+        return len(offsets)
+
+    def _resume_following(self) -> None:
+        """Drop the earlier lines loaded while scrolled back, keeping the last max_blocks."""
+        if self.maximumBlockCount() <= self.max_blocks:
+            return
+        # Lowering the limit trims the oldest blocks right away
+        self.setMaximumBlockCount(self.max_blocks)
+        self._line_offsets = deque(self._line_offsets, maxlen=self.max_blocks)
+
+    def _append_bytes(self, data: bytes) -> None:
+        """Append complete lines and keep any unterminated remainder."""
+        base = self._end - len(self._pending)
+        data = self._pending + data
+        self._end = base + len(data)
+
+        last_newline = data.rfind(b"\n")
+        if last_newline == -1:
+            self._pending = data
+            return
+
+        complete, self._pending = data[:last_newline], data[last_newline + 1:]
+        self._line_offsets.extend(self._offsets(complete + b"\n", base))
+        self.appendPlainText(complete.decode("utf-8", errors="replace"))
+
+    @staticmethod
+    def _offsets(data: bytes, base: int) -> list:
+        """Return the file offset of every newline-terminated line in data."""
+        offsets = []
+        position = 0
+        while True:
+            newline = data.find(b"\n", position)
+            if newline == -1:
+                return offsets
+            offsets.append(base + position)
+            position = newline + 1
+
+    def _file_size(self) -> int:
+        try:
+            return os.path.getsize(self.file_path)
+        except OSError:
+            return 0
+
+    def _read(self, start: int, end: int) -> bytes:
+        try:
+            with open(self.file_path, "rb") as f:
+                f.seek(start)
+                return f.read(end - start)
+        except OSError as e:
+            logger.error(f"Error reading log '{self.file_path}': {e}")
+            return b""
+
+    def _on_scrolled(self, value: int) -> None:
+        scrollbar = self.verticalScrollBar()
+        if value == scrollbar.minimum() and self.head_offset > 0 and self.isVisible():
+            self.load_earlier()
+        elif value == scrollbar.maximum() and value > scrollbar.minimum():
+            self._resume_following()
@@ -0,0 +1,206 @@
+import hashlib
+import itertools
+import os
+import threading
+import time
+from collections import namedtuple
+
+from src.utils.constants import WORK_CACHE_DIR, WORK_CACHE_JSON
+from src.utils.fileops.file_handle import delete_directory, ensure_directory, file_sha256, json_read, json_write
+from src.utils.logger_module.omix_logger import OmixForgeLogger
+
+logger = OmixForgeLogger.get_logger()
+
+DEFAULT_WORK_CACHE_GB = 200
+
+# Evicted directories are renamed to this prefix before they are deleted
+_TOMBSTONE_PREFIX = ".evicted-"
+
+# work_dir is passed as -w, cache_dir as NXF_CACHE_DIR (session history and task cache);
+# token tells this lease apart from later leases of the same directory
+WorkDirLease = namedtuple("WorkDirLease", ["fingerprint", "work_dir", "cache_dir", "resume", "token"])
+
+
+def dir_size(path: str) -> int:
+    """Return the bytes used by the files below path, not following symlinks."""
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def run_fingerprint(pipeline: str, samplesheet: str) -> str:
+    """Return the key of the work directory shared by runs of pipeline on samplesheet.
+
+    Parameters are deliberately left out: Nextflow decides per task what a
+    parameter change invalidates, so a tweaked re-run still reuses the rest.
+    """
+    digest = hashlib.sha256(pipeline.encode())
+    digest.update(b"\0")
+    try:
+        digest.update(file_sha256(samplesheet).encode())
+    except OSError:
+        digest.update(str(samplesheet).encode())
+    return digest.hexdigest()[:16]
+
+
+class WorkDirCache:
+    """
+    Persistent Nextflow work directories shared by re-runs.
+
+    Runs of the same pipeline on the same sample sheet get the same work and
+    cache directory, so a re-run after a failure or a parameter change can
+    pass -resume and skip every task that already completed. A directory is
+    leased to one run at a time. When a run ends, least recently used
+    directories are deleted until the total fits max_gb.
+    """
+
+    def __init__(self, root: str = WORK_CACHE_DIR, index_path: str = WORK_CACHE_JSON,
+                 max_gb: float = DEFAULT_WORK_CACHE_GB):
+        """Load the cache index.
+
+        Parameters
+        ----------
+        root : str
+            Directory holding one subdirectory per fingerprint.
+        index_path : str
+            JSON file with the last use and size of each directory.
+        max_gb : float
+            Disk budget of all directories together.
+        """
+        self.root = str(root)
+        self.index_path = str(index_path)
+        self.max_bytes = int(float(max_gb) * 1024 ** 3)
+        self._lock = threading.Lock()
+        self._leased = {}  # fingerprint -> token of the lease holding it
+        self._tokens = itertools.count(1)
+        try:
+            self._entries = json_read(self.index_path)
+        except (OSError, ValueError):
+            self._entries = {}
+
+        # Left behind by an eviction interrupted before it finished deleting
+        if os.path.isdir(self.root):
+            self._delete([os.path.join(self.root, name) for name in os.listdir(self.root)
+                          if name.startswith(_TOMBSTONE_PREFIX)])
+
+    def acquire(self, pipeline: str, samplesheet: str):
+        """Lease the work directory of a run.
+
+        Returns
+        -------
+        WorkDirLease or None
+            None if another run is using the directory; that run keeps it
+            and this one should use a work directory of its own.
+        """
+        fingerprint = run_fingerprint(pipeline, samplesheet)
+        base = os.path.join(self.root, fingerprint)
+        work_dir = os.path.join(base, "work")
+        cache_dir = os.path.join(base, "cache")
+
+        with self._lock:
+            if fingerprint in self._leased:
+                return None
+            token = self._leased[fingerprint] = next(self._tokens)
+            self._entries[fingerprint] = {
+                **self._entries.get(fingerprint, {}),
+                "pipeline": pipeline,
+                "samplesheet": str(samplesheet),
+                "last_used": time.time(),
+            }
+        self._save()
+
+        ensure_directory([work_dir, cache_dir])
+        # Nextflow records every session in the history; without one there is nothing to resume
+        history = os.path.join(cache_dir, "history")
+        resume = os.path.exists(history) and os.path.getsize(history) > 0
+        return WorkDirLease(fingerprint, work_dir, cache_dir, resume, token)
+
+    def release(self, lease: WorkDirLease) -> None:
+        """End the lease of a run, record its size and evict over budget.
+
+        Releasing a lease that already ended does nothing, even when the
+        directory has been leased to another run since.
+        """
+        fingerprint = lease.fingerprint
+        with self._lock:
+            if self._leased.get(fingerprint) != lease.token:
+                return
+        size = dir_size(os.path.join(self.root, fingerprint))
+        with self._lock:
+            if self._leased.get(fingerprint) != lease.token:
+                return
+            del self._leased[fingerprint]
+            if fingerprint in self._entries:
+                self._entries[fingerprint].update(size=size, last_used=time.time())
+        self._save()
+        self.evict()
+
+    def total_size(self) -> int:
+        """Return the recorded size of all directories."""
+        with self._lock:
+            return sum(entry.get("size", 0) for entry in self._entries.values())
+
+    def evict(self) -> list:
+        """Delete least recently used directories until the total fits the budget.
+
+        Returns
+        -------
+        list of str
+            Fingerprints of the deleted directories.
+        """
+        evicted, tombstones = [], []
+        with self._lock:
+            # Entries whose directory was removed by hand no longer count
+            for fingerprint in [f for f in self._entries if not os.path.isdir(os.path.join(self.root, f))]:
+                if fingerprint not in self._leased:
+                    del self._entries[fingerprint]
+
+            total = sum(entry.get("size", 0) for entry in self._entries.values())
+            by_age = sorted(self._entries, key=lambda f: self._entries[f].get("last_used", 0))
+            for fingerprint in by_age:
+                if total <= self.max_bytes:
+                    break
+                if fingerprint in self._leased:
+                    continue
+                # Moved aside while locked, so a run acquiring the fingerprint next gets a fresh directory
+                base = os.path.join(self.root, fingerprint)
+                tombstone = os.path.join(self.root, f"{_TOMBSTONE_PREFIX}{fingerprint}-{next(self._tokens)}")
+                try:
+                    if os.path.isdir(base):
+                        os.rename(base, tombstone)
+                        tombstones.append(tombstone)
+                except OSError as e:
+                    logger.error(f"Failed to evict work cache {fingerprint}: {e}")
+                    continue
+                total -= self._entries.pop(fingerprint).get("size", 0)
+                evicted.append(fingerprint)
+
+        for fingerprint in evicted:
+            logger.info(f"Evicting Nextflow work cache {fingerprint}")
+        self._delete(tombstones)
+        if evicted:
+            self._save()
+        return evicted
+
+    def _delete(self, tombstones: list) -> None:
+        for tombstone in tombstones:
+            try:
+                delete_directory(tombstone)
+            except OSError as e:
+                logger.error(f"Failed to delete evicted work cache {tombstone}: {e}")
+
+    def _save(self) -> None:
+        with self._lock:
+            entries = {fingerprint: dict(entry) for fingerprint, entry in self._entries.items()}
+            try:
+                ensure_directory(os.path.dirname(self.index_path))
+                tmp_path = f"{self.index_path}.tmp"
+                json_write(tmp_path, entries)
+                os.replace(tmp_path, self.index_path)
+            except OSError as e:
+                logger.error(f"Failed to save work cache index: {e}")
@@ -38,6 +38,8 @@ def test_check_pipline_card(window, qtbot):
     assert window.stack.currentWidget() is window.pipeline_dashboard.widget, "Not in on the dashboard winfdow"
 
     dashboard = window.pipeline_dashboard.widget   # your dashboard QWidget
+    # the installed pipelines are listed in the background
+    qtbot.waitUntil(lambda: len(dashboard.findChildren(PipelineCard)) == len(pipelines_list), timeout=30000)
     cards = dashboard.findChildren(PipelineCard)
 
     # verify that the cards present exaclty matches the cli output
@@ -0,0 +1,58 @@
+from PyQt6.QtCore import Qt
+
+from src.core.status_page.status.run_model import RunStatusModel
+from src.utils.fileops.log_tail import RUN_COMPLETED, RUN_FAILED, RUN_QUEUED, RUN_RUNNING
+
+
+def names(model):
+    return [model.index(row).data() for row in range(model.rowCount())]
+
+
+def test_run_model_is_consistent(qtmodeltester):
+    model = RunStatusModel()
+    model.update_runs(["a", "b"], {"a": RUN_RUNNING, "b": RUN_QUEUED})
+    qtmodeltester.check(model, force_py=True)
+
+
+def test_update_runs_signals_only_what_changed(qtbot):
+    model = RunStatusModel()
+    model.update_runs(["a", "b", "c"], {"a": RUN_RUNNING, "b": RUN_QUEUED, "c": RUN_COMPLETED})
+
+    removed, inserted, changed = [], [], []
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.dataChanged.connect(lambda top, bottom, roles: changed.append(top.data()))
+
+    # An unchanged listing signals nothing
+    model.update_runs(["a", "b", "c"], {"a": RUN_RUNNING, "b": RUN_QUEUED, "c": RUN_COMPLETED})
+    assert (removed, inserted, changed) == ([], [], [])
+
+    # b is gone, a changed state, d and e are new; c is left alone
+    model.update_runs(["a", "c", "d", "e"], {"a": RUN_FAILED, "c": RUN_COMPLETED, "d": RUN_QUEUED, "e": RUN_RUNNING})
+    assert removed == [(1, 1)]
+    assert changed == ["a"]
+    assert inserted == [(2, 3)]
+    assert names(model) == ["a", "c", "d", "e"]
+    assert model.index(0).data(RunStatusModel.StateRole) == RUN_FAILED
+    assert model.index(3).data(RunStatusModel.StateRole) == RUN_RUNNING
+    assert model.index(2).data(Qt.ItemDataRole.ToolTipRole) == f"d ({RUN_QUEUED})"
+
+
+def test_new_runs_are_inserted_in_display_order(qtbot):
+    model = RunStatusModel()
+    model.update_runs(["b", "d"], {"b": RUN_RUNNING, "d": RUN_RUNNING})
+
+    inserted, resets = [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.modelReset.connect(lambda: resets.append(True))
+
+    model.update_runs(["a", "b", "c", "d", "e"], dict.fromkeys("abcde", RUN_QUEUED))
+    assert inserted == [(0, 0), (2, 2), (4, 4)]
+    assert names(model) == ["a", "b", "c", "d", "e"]
+    assert resets == []
+
+    # A changed order is applied with a reset
+    model.update_runs(["e", "d", "c", "b", "a"], dict.fromkeys("abcde", RUN_QUEUED))
+    assert resets == [True]
+    assert names(model) == ["e", "d", "c", "b", "a"]
+    assert model.index(0).data(RunStatusModel.StateRole) == RUN_QUEUED
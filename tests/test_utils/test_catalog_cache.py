@@ -0,0 +1,55 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from src.utils.catalog_cache import CatalogCache
+from src.utils.fileops.file_handle import delete_directory, ensure_directory
+
+CATALOG = {"remote_workflows": [{"name": "rnaseq"}]}
+
+
+class CatalogHandler(BaseHTTPRequestHandler):
+    bodies_sent = 0
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(CATALOG).encode()
+        CatalogHandler.bodies_sent += 1
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_catalog_is_revalidated_and_served_offline(tmp_path):
+    delete_directory(tmp_path)
+    ensure_directory(tmp_path)
+    server = HTTPServer(("127.0.0.1", 0), CatalogHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/pipelines.json"
+    paths = (tmp_path / "catalog.json", tmp_path / "catalog.meta.json")
+
+    cache = CatalogCache(*paths, url=url, ttl=3600)
+    assert cache.load() is None and not cache.is_fresh()
+    cache.refresh_in_background().join(5)
+    assert cache.load() == CATALOG and cache.is_fresh()
+
+    # Within the TTL nothing is requested; a forced refresh costs a 304
+    assert cache.refresh() and cache.refresh(force=True)
+    assert CatalogHandler.bodies_sent == 1
+
+    # A new session reads the stored copy and keeps it when the server is gone
+    server.shutdown()
+    server.server_close()
+    offline = CatalogCache(*paths, url=url, ttl=0)
+    assert offline.load() == CATALOG and not offline.is_fresh()
+    assert not offline.refresh(timeout=1, retries=1)
+    assert offline.load() == CATALOG
+    delete_directory(tmp_path)
@@ -0,0 +1,54 @@
+from src.utils.fileops.file_handle import ensure_directory, delete_directory, write_to_file
+from src.utils.fileops.dir_watcher import *
+
+
+def test_events_are_debounced(qtbot, tmp_path):
+    ensure_directory(tmp_path)
+    calls = []
+
+    watcher = DirectoryWatcher(debounce_ms=50)
+    watcher.subscribe([tmp_path], lambda: calls.append(1))
+    for i in range(5):
+        write_to_file(str(tmp_path / f"run_{i}.txt"), "x")
+
+    qtbot.waitUntil(lambda: len(calls) == 1, timeout=3000)
+    qtbot.wait(200)
+    assert len(calls) == 1
+    delete_directory(tmp_path)
+
+
+def test_paused_subscription_catches_up_on_resume(qtbot, tmp_path):
+    ensure_directory(tmp_path)
+    calls = []
+
+    watcher = DirectoryWatcher(debounce_ms=50)
+    sub_id = watcher.subscribe([tmp_path], lambda: calls.append(1), active=False)
+    write_to_file(str(tmp_path / "run.txt"), "x")
+    qtbot.wait(300)
+    assert calls == []
+
+    watcher.resume(sub_id)
+    assert calls == [1]
+
+    watcher.unsubscribe(sub_id)
+    write_to_file(str(tmp_path / "other.txt"), "x")
+    qtbot.wait(300)
+    assert calls == [1]
+    delete_directory(tmp_path)
+
+
+def test_missing_path_falls_back_to_polling(qtbot, tmp_path):
+    ensure_directory(tmp_path)
+    missing = tmp_path / "later"
+    calls = []
+
+    watcher = DirectoryWatcher(debounce_ms=10, poll_interval_ms=50)
+    watcher.subscribe([missing], lambda: calls.append(1))
+    ensure_directory(missing)
+
+    qtbot.waitUntil(lambda: len(calls) == 1, timeout=3000)
+
+    # Now watched natively
+    write_to_file(str(missing / "run.txt"), "x")
+    qtbot.waitUntil(lambda: len(calls) == 2, timeout=3000)
+    delete_directory(tmp_path)
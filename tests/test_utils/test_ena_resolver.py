@@ -0,0 +1,73 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from src.utils.ena_resolver import ENAResolver
+
+PROJECT_RUNS = {"PRJNA1": ["SRR101", "SRR102"]}
+
+
+class ENAHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+    throttle = 1  # requests answered with 429 before serving
+
+    def _send(self, status, records=None, headers=()):
+        body = json.dumps(records).encode() if records is not None else b""
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode())
+        runs = re.findall(r'run_accession="(\w+)"', form["query"][0])
+        ENAHandler.requests_seen.append(("search", runs))
+        if ENAHandler.throttle:
+            ENAHandler.throttle -= 1
+            return self._send(429, headers=[("Retry-After", "0")])
+        self._send(200, [{"run_accession": run, "fastq_ftp": f"ftp.sra.ebi.ac.uk/{run}.fastq.gz"}
+                         for run in runs if run != "SRR404"])
+
+    def do_GET(self):
+        accession = parse_qs(urlparse(self.path).query)["accession"][0]
+        ENAHandler.requests_seen.append(("filereport", accession))
+        if accession not in PROJECT_RUNS:
+            return self._send(200)
+        self._send(200, [{"run_accession": run, "study_accession": accession} for run in PROJECT_RUNS[accession]])
+
+    def log_message(self, *args):
+        pass
+
+
+def test_runs_are_batched_and_projects_expanded():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ENAHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    resolver = ENAResolver(filereport_url=f"{base}/filereport", search_url=f"{base}/search",
+                           batch_size=3, backoff=0.01)
+
+    progress = []
+    accessions = ["SRR1", "PRJNA1", "SRR2", "SRR3", "SRR404", "SRR1", "PRJNA404"]
+    records, failed = resolver.resolve(accessions, lambda done, total: progress.append((done, total)))
+    resolver.close()
+    server.shutdown()
+    server.server_close()
+
+    assert [(acc, record["run_accession"]) for acc, record in records] == [
+        ("SRR1", "SRR1"), ("PRJNA1", "SRR101"), ("PRJNA1", "SRR102"), ("SRR2", "SRR2"), ("SRR3", "SRR3")]
+    assert [acc for acc, _message in failed] == ["SRR404", "PRJNA404"]
+
+    # Two search batches for four runs, one of them retried after a 429, one filereport per project
+    searches = [runs for kind, runs in ENAHandler.requests_seen if kind == "search"]
+    assert len(searches) == 3
+    assert {tuple(runs) for runs in searches} == {("SRR1", "SRR2", "SRR3"), ("SRR404",)}
+    assert sorted(acc for kind, acc in ENAHandler.requests_seen if kind == "filereport") == ["PRJNA1", "PRJNA404"]
+
+    # Progress counts resolved accessions and ends at the total
+    assert [total for _done, total in progress] == [6] * 4
+    assert [done for done, _total in progress] == sorted(done for done, _total in progress)
+    assert progress[-1] == (6, 6)
@@ -1,3 +1,4 @@
+import os
 from src.utils.encryption.handle import *
 from src.utils.fileops.file_handle import file_exists, delete_file
 import pytest
@@ -23,27 +24,6 @@ def test_generate_encrypted_file(get_test_files, get_lock_key):
 
 
 
-def test_encrypt_file(get_test_files, get_lock_key):
-
-    # tests file encryption
-    encrypt_file(get_test_files['file_path'], get_lock_key['lock'])
-    assert file_exists(get_test_files['file_path']+'.enc')
-
-    data = decrypt_file(f"{get_test_files['file_path']}.enc", get_lock_key['lock'], True)
-    assert data == 'key'
-
-    # test invalid path
-    with pytest.raises(FileNotFoundError):
-        encrypt_file(get_test_files['file_path']+"none", get_lock_key['lock'])
-
-    # test invalid key
-    with pytest.raises(ValueError):
-        encrypt_file(get_test_files['file_path'], "none")
-
-    if file_exists(get_test_files['file_path']+'.enc'):
-        delete_file(get_test_files['file_path']+'.enc')
-    
-
 def test_decrypt_file(get_test_files, get_lock_key):
 
     # test valid decryption
@@ -87,3 +67,96 @@ def test_generate_key(get_lock_key):
 
 
 
+
+
+def test_decrypt_legacy_folder_archives(tmp_path, get_lock_key):
+    from cryptography.fernet import Fernet
+    from src.utils.fileops.file_handle import ensure_directory, delete_directory, write_to_file, read_from_file, tar_folder
+    ensure_directory(tmp_path)
+    folder = tmp_path / "run"
+    ensure_directory(folder / "results")
+    write_to_file(str(folder / "results" / "report.txt"), "report")
+
+    # Runs locked before indexed archives: a .tar.gz encrypted as a single Fernet token
+    tar_folder(str(folder), str(tmp_path / "legacy.tar.gz"))
+    with open(tmp_path / "legacy.tar.gz", "rb") as f:
+        token = Fernet(get_lock_key['lock']).encrypt(f.read())
+    with open(tmp_path / "legacy.tar.gz.enc", "wb") as f:
+        f.write(token)
+    delete_file(str(tmp_path / "legacy.tar.gz"))
+
+    decrypt_folder(str(tmp_path / "legacy.tar.gz.enc"), str(tmp_path / "legacy"), get_lock_key['lock'])
+    assert read_from_file(str(tmp_path / "legacy" / "run" / "results" / "report.txt")) == "report"
+    assert not file_exists(str(tmp_path / "legacy.tar.gz"))
+    delete_directory(tmp_path)
+
+
+def test_indexed_archive_random_access(tmp_path, get_lock_key):
+    from cryptography.fernet import InvalidToken
+    from src.utils.encryption.archive import IndexedArchiveReader, archive_folder, is_indexed_archive
+    from src.utils.fileops.file_handle import ensure_directory, delete_directory, write_to_file, read_from_file
+    ensure_directory(tmp_path)
+    folder = tmp_path / "run"
+    ensure_directory(folder / "results" / "multiqc")
+    write_to_file(str(folder / "results" / "multiqc" / "report.html"), "<html>report</html>" * 1000)
+    with open(folder / "results" / "reads.bam", "wb") as f:
+        f.write(os.urandom(300_000))
+    write_to_file(str(folder / "empty.txt"), "")
+
+    archive_path = str(tmp_path / "run.omxa.enc")
+    archive_folder(str(folder), archive_path, get_lock_key['lock'])
+    assert is_indexed_archive(archive_path)
+    assert not file_exists(archive_path + ".part")
+
+    reader = IndexedArchiveReader(archive_path, get_lock_key['lock'])
+    assert "run/results/multiqc/report.html" in reader.names()
+    assert reader.read("run/results/multiqc/report.html") == b"<html>report</html>" * 1000
+    assert reader.read("run/empty.txt") == b""
+    with pytest.raises(KeyError):
+        reader.read("run/missing.txt")
+
+    # Full unlock extracts every member
+    decrypt_folder(archive_path, str(tmp_path / "out"), get_lock_key['lock'])
+    with open(tmp_path / "out" / "run" / "results" / "reads.bam", "rb") as f, open(folder / "results" / "reads.bam", "rb") as g:
+        assert f.read() == g.read()
+    assert read_from_file(str(tmp_path / "out" / "run" / "empty.txt")) == ""
+
+    # Wrong key fails on the index
+    with pytest.raises(InvalidToken):
+        IndexedArchiveReader(archive_path, generate_key("other"))
+
+    # A modified member fails when that member is read
+    offset = reader.get_member("run/results/multiqc/report.html")["offset"]
+    with open(archive_path, "r+b") as f:
+        f.seek(offset + 10)
+        byte = f.read(1)
+        f.seek(offset + 10)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    with pytest.raises(InvalidToken):
+        IndexedArchiveReader(archive_path, get_lock_key['lock']).read("run/results/multiqc/report.html")
+    delete_directory(tmp_path)
+
+
+def test_files_tree_lists_archive_members(qtbot, tmp_path, get_lock_key):
+    from src.utils.encryption.archive import IndexedArchiveReader, archive_folder
+    from src.utils.fileops.file_handle import ensure_directory, delete_directory, write_to_file
+    from src.utils.widgets.filetree import FilesTreeWidget
+    ensure_directory(tmp_path)
+    folder = tmp_path / "run"
+    ensure_directory(folder / "results")
+    ensure_directory(folder / "work")
+    write_to_file(str(folder / "results" / "summary.txt"), "ok")
+    write_to_file(str(folder / "results" / "reads.bam"), "skip")
+    write_to_file(str(folder / "work" / "cache.txt"), "skip")
+
+    archive_folder(str(folder), str(tmp_path / "run.omxa.enc"), get_lock_key['lock'])
+    reader = IndexedArchiveReader(str(tmp_path / "run.omxa.enc"), get_lock_key['lock'])
+
+    tree = FilesTreeWidget("run", [".txt"], exclude_dirs=["work"], archive=reader)
+    qtbot.addWidget(tree)
+    root = tree.tree.topLevelItem(0)
+    assert [root.child(i).text(0) for i in range(root.childCount())] == ["results"]
+    results = root.child(0)
+    assert results.childCount() == 1
+    assert results.child(0).text(0) == "summary.txt"
+    delete_directory(tmp_path)
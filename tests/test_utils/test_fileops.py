@@ -202,4 +202,14 @@ def test_items_collector_no_matches(tmp_path):
     (tmp_path / "a.md").touch()
     result = items_collector(str(tmp_path), [".txt"], set())
     assert result == []
-    delete_directory(tmp_path)
\ No newline at end of file
+    delete_directory(tmp_path)
+
+def test_archive_suffixes():
+    from src.utils.fileops.archive_codec import is_encrypted_archive, strip_archive_suffix
+
+    assert is_encrypted_archive("demo_run.omxa.enc")
+    assert is_encrypted_archive("demo_run.tar.gz.enc")
+    assert not is_encrypted_archive("demo_run")
+    assert strip_archive_suffix("demo_run.omxa.enc") == "demo_run"
+    assert strip_archive_suffix("demo_run.tar.gz.enc") == "demo_run"
+    assert strip_archive_suffix("demo_run") == "demo_run"
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Budget for a cold import of the application package, in milliseconds. Wall-clock time
+# depends on the machine, so the check only runs when OMIXFORGE_IMPORT_BUDGET_MS is set
+IMPORT_BUDGET_ENV = "OMIXFORGE_IMPORT_BUDGET_MS"
+# Loaded on first use of the page or feature that needs them, never at startup
+LAZY_MODULES = ["pandas", "matplotlib", "numpy", "bs4", "requests", "cryptography"]
+
+
+def import_times(module: str) -> dict:
+    """Import module in a fresh interpreter and return {module: cumulative µs} from -X importtime."""
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    env = {**os.environ, "PYTHONPATH": root, "QT_QPA_PLATFORM": "offscreen"}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=root, env=env, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.skipif(not os.environ.get(IMPORT_BUDGET_ENV), reason=f"set {IMPORT_BUDGET_ENV} to check import time")
+def test_application_import_fits_budget():
+    budget_ms = float(os.environ[IMPORT_BUDGET_ENV])
+    # The first run may compile bytecode; the best of three is the startup a user sees
+    runs = [import_times("src.__main__") for _ in range(3)]
+    import_ms = min(times["src.__main__"] for times in runs) / 1000
+    assert import_ms <= budget_ms, f"importing src.__main__ took {import_ms:.0f} ms, budget {budget_ms:.0f} ms"
+
+
+def test_heavy_modules_are_not_imported_at_startup():
+    times = import_times("src.__main__")
+    assert [name for name in LAZY_MODULES if name in times] == []
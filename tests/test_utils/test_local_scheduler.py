@@ -0,0 +1,25 @@
+from src.utils.local_scheduler import LocalRunScheduler, resource_config
+
+
+def test_runs_are_admitted_within_the_budget_in_order():
+    scheduler = LocalRunScheduler(cpus=32, memory_gb=64, run_cpus=12, run_memory_gb=24)
+    for run_name in ("a", "b", "c"):
+        scheduler.submit(run_name)
+
+    assert scheduler.admit() == [("a", 12, 24), ("b", 12, 24)]
+    assert scheduler.queued() == ["c"] and scheduler.admit() == []
+
+    assert scheduler.cancel("c") and not scheduler.cancel("c")
+    scheduler.submit("d")
+    scheduler.release("a")
+    assert scheduler.admit() == [("d", 12, 24)]
+    assert scheduler.running() == ["b", "d"]
+
+
+def test_oversized_share_is_capped_to_the_budget():
+    scheduler = LocalRunScheduler(cpus=4, memory_gb=8, run_cpus=16, run_memory_gb=0)
+    assert (scheduler.run_cpus, scheduler.run_memory_gb) == (4, 4)
+
+    config = resource_config(4, 8)
+    assert "cpus = 4" in config and "memory = '8 GB'" in config
+    assert "resourceLimits = [cpus: 4, memory: '8 GB']" in config
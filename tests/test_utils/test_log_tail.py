@@ -0,0 +1,81 @@
+import os
+
+from src.utils.fileops.file_handle import ensure_directory, delete_directory, write_to_file, append_to_file
+from src.utils.fileops.log_tail import *
+
+
+def test_status_running_and_completed(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    write_to_file(str(log), "Running pipeline: demo\n")
+
+    tailer = LogTailer()
+    assert tailer.status(str(log)) == RUN_RUNNING
+
+    append_to_file(str(log), "Pipeline run completed <<exit-code:0>>.\n")
+    assert tailer.status(str(log)) == RUN_COMPLETED
+    delete_directory(tmp_path)
+
+
+def test_status_reads_only_appended_bytes(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    write_to_file(str(log), "x" * 100)
+
+    tailer = LogTailer()
+    tailer.status(str(log))
+    assert tailer._states[str(log)].offset == 100
+
+    append_to_file(str(log), "y" * 10)
+    tailer.status(str(log))
+    assert tailer._states[str(log)].offset == 110
+    delete_directory(tmp_path)
+
+
+def test_status_marker_split_across_chunks(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    write_to_file(str(log), "a" * 10 + "<<exit-code:1>>" + "b" * 10)
+
+    tailer = LogTailer(chunk_size=16)
+    assert tailer.status(str(log)) == RUN_FAILED
+    delete_directory(tmp_path)
+
+
+def test_status_precedence(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    write_to_file(str(log), "Pipeline run Cancelled by user.\nPipeline run completed <<exit-code:0>>.\n")
+
+    assert LogTailer().status(str(log)) == RUN_CANCELLED
+
+    append_to_file(str(log), "<<exit-code:1>>\n")
+    assert LogTailer().status(str(log)) == RUN_FAILED
+    delete_directory(tmp_path)
+
+
+def test_status_truncated_log_is_rescanned(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    write_to_file(str(log), "Pipeline run completed <<exit-code:0>>.\n")
+
+    tailer = LogTailer()
+    assert tailer.status(str(log)) == RUN_COMPLETED
+
+    write_to_file(str(log), "new\n")
+    assert tailer.status(str(log)) == RUN_RUNNING
+    delete_directory(tmp_path)
+
+
+def test_status_missing_file_and_prune(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    write_to_file(str(log), "x")
+
+    tailer = LogTailer()
+    tailer.status(str(log))
+    tailer.prune([])
+    assert tailer._states == {}
+
+    assert tailer.status(str(tmp_path / "missing.txt")) == RUN_RUNNING
+    delete_directory(tmp_path)
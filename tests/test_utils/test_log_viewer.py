@@ -0,0 +1,98 @@
+from src.utils.fileops.file_handle import ensure_directory, delete_directory, write_to_file
+from src.utils.widgets.log_viewer import *
+
+
+def _write_lines(path, start, end):
+    with open(path, "a") as f:
+        for i in range(start, end):
+            f.write(f"line {i}\n")
+
+
+def test_shows_only_the_tail(qtbot, tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    _write_lines(log, 0, 1000)
+
+    viewer = LogTailViewer(str(log), tail_bytes=100)
+    qtbot.addWidget(viewer)
+    lines = viewer.toPlainText().splitlines()
+    assert lines[-1] == "line 999"
+    assert "line 0" not in lines
+    assert len("\n".join(lines)) <= 100
+    delete_directory(tmp_path)
+
+
+def test_refresh_appends_only_complete_new_lines(qtbot, tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    write_to_file(str(log), "first\n")
+
+    viewer = LogTailViewer(str(log))
+    qtbot.addWidget(viewer)
+    with open(log, "a") as f:
+        f.write("second\nthi")
+    viewer.refresh()
+    assert viewer.toPlainText() == "first\nsecond"
+
+    with open(log, "a") as f:
+        f.write("rd\n")
+    viewer.refresh()
+    assert viewer.toPlainText() == "first\nsecond\nthird"
+    delete_directory(tmp_path)
+
+
+def test_max_blocks_and_load_earlier(qtbot, tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    _write_lines(log, 0, 100)
+
+    viewer = LogTailViewer(str(log), tail_bytes=10_000, chunk_bytes=40, max_blocks=10)
+    qtbot.addWidget(viewer)
+    assert viewer.toPlainText().splitlines() == [f"line {i}" for i in range(90, 100)]
+
+    added = viewer.load_earlier()
+    lines = viewer.toPlainText().splitlines()
+    assert added > 0
+    assert lines == [f"line {i}" for i in range(90 - added, 100)]
+
+    while viewer.load_earlier():
+        pass
+    assert viewer.toPlainText().splitlines()[0] == "line 0"
+    assert viewer.head_offset == 0
+    delete_directory(tmp_path)
+
+
+def test_history_is_capped_and_dropped_when_following(qtbot, tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    _write_lines(log, 0, 100)
+
+    viewer = LogTailViewer(str(log), chunk_bytes=40, max_blocks=10, max_history_blocks=25)
+    qtbot.addWidget(viewer)
+    while viewer.load_earlier():
+        pass
+    assert viewer.toPlainText().splitlines() == [f"line {i}" for i in range(75, 100)]
+    assert viewer.maximumBlockCount() == 25
+
+    # Back at the bottom, new lines are followed with the tail limit again
+    scrollbar = viewer.verticalScrollBar()
+    scrollbar.setValue(scrollbar.maximum())
+    _write_lines(log, 100, 102)
+    viewer.refresh()
+    assert viewer.toPlainText().splitlines() == [f"line {i}" for i in range(92, 102)]
+    assert viewer.maximumBlockCount() == 10
+    assert viewer.head_offset == len("".join(f"line {i}\n" for i in range(92)))
+    delete_directory(tmp_path)
+
+
+def test_truncated_log_is_reloaded(qtbot, tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+    _write_lines(log, 0, 10)
+
+    viewer = LogTailViewer(str(log))
+    qtbot.addWidget(viewer)
+    write_to_file(str(log), "fresh\n")
+    viewer.refresh()
+    assert viewer.toPlainText() == "fresh"
+    delete_directory(tmp_path)
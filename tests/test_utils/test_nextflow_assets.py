@@ -0,0 +1,85 @@
+import os
+import time
+
+from src.utils.fileops.file_handle import delete_directory, ensure_directory, write_to_file
+from src.utils.nextflow_assets import NextflowAssets, parse_manifest
+
+NEXTFLOW_CONFIG = '''
+params { outdir = null }
+manifest {
+    name            = 'nf-core/rnaseq'
+    contributors    = [[name: 'Someone', affiliation: 'Somewhere']]
+    homePage        = 'https://github.com/nf-core/rnaseq'
+    description     = """RNA sequencing analysis pipeline
+    for gene/isoform quantification"""
+    mainScript      = 'main.nf'
+    version         = '3.14.0'
+}
+'''
+
+
+def make_pipeline(assets, name, head="ref: refs/heads/master"):
+    git = assets / name / ".git"
+    ensure_directory([str(git / "refs" / "heads"), str(git / "refs" / "tags")])
+    write_to_file(str(assets / name / "nextflow.config"), NEXTFLOW_CONFIG)
+    write_to_file(str(git / "HEAD"), head + "\n")
+    write_to_file(str(git / "refs" / "heads" / "master"), "a" * 40 + "\n")
+    write_to_file(str(git / "packed-refs"), "# pack-refs\n" + "b" * 40 + " refs/tags/3.14.0\n")
+    write_to_file(str(git / "config"), '[remote "origin"]\n\turl = https://github.com/nf-core/rnaseq.git\n')
+
+
+def test_manifest_fields_are_parsed():
+    manifest = parse_manifest(NEXTFLOW_CONFIG + "manifest.defaultBranch = 'dev'\n")
+    assert manifest["name"] == "nf-core/rnaseq" and manifest["version"] == "3.14.0"
+    assert manifest["defaultBranch"] == "dev" and "name" in manifest and "affiliation" not in manifest
+    assert manifest["description"].startswith("RNA sequencing")
+
+
+def test_pipelines_are_listed_and_described_from_disk(tmp_path):
+    delete_directory(tmp_path)
+    assets = tmp_path / "assets"
+    make_pipeline(assets, "nf-core/rnaseq")
+    ensure_directory(str(assets / "nf-core" / "half-cloned"))
+    reader = NextflowAssets(assets)
+
+    assert reader.list_pipelines() == ["nf-core/rnaseq"]
+    info = reader.pipeline_info("nf-core/rnaseq")
+    assert info["local path"] == str(assets / "nf-core" / "rnaseq")
+    assert info["repository"] == "https://github.com/nf-core/rnaseq.git"
+    assert info["revision"] == "master (aaaaaaaaaa)" and info["revisions"] == "master, 3.14.0"
+    assert info["description"] == "RNA sequencing analysis pipeline for gene/isoform quantification"
+    assert reader.pipeline_info("nf-core/sarek") is None
+
+    # Cached until the files it was read from change
+    config = assets / "nf-core" / "rnaseq" / "nextflow.config"
+    write_to_file(str(config), NEXTFLOW_CONFIG.replace("3.14.0", "3.15.0"))
+    stamp = os.stat(config).st_mtime_ns
+    os.utime(config, ns=(stamp, stamp + 1_000_000_000))
+    assert reader.pipeline_info("nf-core/rnaseq")["version"] == "3.15.0"
+
+    time.sleep(0.01)
+    make_pipeline(assets, "nf-core/sarek")
+    assert reader.list_pipelines() == ["nf-core/rnaseq", "nf-core/sarek"]
+    delete_directory(tmp_path)
+
+
+def test_pipeline_schema_is_read_and_cached(tmp_path):
+    delete_directory(tmp_path)
+    assets = tmp_path / "assets"
+    make_pipeline(assets, "nf-core/rnaseq")
+    reader = NextflowAssets(assets)
+    assert reader.pipeline_schema("nf-core/rnaseq") is None
+
+    schema_path = assets / "nf-core" / "rnaseq" / "nextflow_schema.json"
+    write_to_file(str(schema_path), '{"$defs": {"input_output_options": {"properties": {"input": {}}}}}')
+    schema = reader.pipeline_schema("nf-core/rnaseq")
+    assert list(schema["$defs"]) == ["input_output_options"]
+
+    # Callers get a copy; the cache is kept until the file changes
+    schema["$defs"].clear()
+    assert reader.pipeline_schema("nf-core/rnaseq")["$defs"]
+    write_to_file(str(schema_path), '{"definitions": {}}')
+    stamp = os.stat(schema_path).st_mtime_ns
+    os.utime(schema_path, ns=(stamp, stamp + 1_000_000_000))
+    assert reader.pipeline_schema("nf-core/rnaseq") == {"definitions": {}}
+    delete_directory(tmp_path)
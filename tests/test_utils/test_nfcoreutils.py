@@ -16,3 +16,40 @@ def test_get_pipelines():
     for i in pipeline_list:
         assert i.name
 
+
+
+def _workflow(name, topics=(), description="", releases=()):
+    return RemoteWorkflowList({"name": name, "full_name": f"nf-core/{name}", "description": description,
+                               "topics": list(topics), "releases": list(releases)})
+
+
+def test_pipeline_catalog_search():
+    catalog = PipelineCatalog([
+        _workflow("rnaseq", ["rna", "rna-seq"], "RNA sequencing analysis pipeline"),
+        _workflow("rnafusion", ["rna", "fusion"], "RNA-seq analysis for gene-fusion detection"),
+        _workflow("chipseq", ["chip-seq"], "ChIP-seq peak-calling and QC"),
+        _workflow("sarek", ["variant-calling", "germline"], "Analysis pipeline to detect germline variants"),
+    ])
+
+    assert len(catalog) == 4 and catalog.get("sarek").full_name == "nf-core/sarek"
+    assert catalog.with_topic("rna") == ["rnaseq", "rnafusion"]
+    assert catalog.search("") == ["rnaseq", "rnafusion", "chipseq", "sarek"]
+    # Name prefix first, then matches in other fields
+    assert catalog.search("rna") == ["rnaseq", "rnafusion"]
+    assert catalog.search("seq") == ["rnaseq", "chipseq", "rnafusion"]
+    assert catalog.search("germ") == ["sarek"]
+    assert catalog.search("fusion detection") == ["rnafusion"]
+    # Typos are matched when nothing else is
+    assert catalog.search("sarak") == ["sarek"]
+    assert catalog.search("zzz") == []
+
+
+def test_releases_are_parsed_on_first_access():
+    workflow = _workflow("demo", releases=[
+        {"tag_name": "1.0.0", "published_at": "2024-01-02T03:04:05Z"},
+        {"tag_name": "dev", "published_at": None},
+    ])
+    assert workflow._releases_parsed is False
+    assert [r["tag_name"] for r in workflow.releases] == ["1.0.0"]
+    assert workflow.releases[0]["published_at_timestamp"] == 1704164645
+    assert not hasattr(workflow, "__dict__")
@@ -0,0 +1,473 @@
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.utils.fileops.file_handle import ensure_directory, delete_directory, file_sha256, json_read, write_to_file
+from src.utils.run_index import RunIndex, RUN_QUEUED
+from src.utils.remote.ssh import SSHSession, ensure_private_dir
+from src.utils.remote import job as remote_job
+from src.utils.remote.job import PID_FILE, JobUnreachable, RemoteJob
+from src.core.dashboard.pipeline_dash_tab.remote_pipeline import samplesheet_update_script
+from src.utils.remote import retrieve
+from src.utils.remote.retrieve import RetrievalError, fetch_results
+from src.utils.remote.scheduler import JOB_RUNNING, JOB_SUBMITTING, RemoteJobScheduler
+from src.utils.remote.session_manager import SSHSessionManager
+from src.utils.remote.staging import HashCache, RemoteStager
+from src.utils.remote.transfer import TransferCancelled, TransferPool, TransferError
+
+
+class LocalCopySession(SSHSession):
+    """Session whose uploads are local copies, recording peak concurrency."""
+
+    def __init__(self, fail=None):
+        super().__init__("example.org", "omix", "/keys/id_ed25519")
+        self.fail = fail
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def upload(self, local_path, remote_path, recursive=False):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+
+        if local_path == self.fail:
+            return subprocess.CompletedProcess([], 1, "", "permission denied")
+        shutil.copy(local_path, remote_path)
+        return subprocess.CompletedProcess([], 0, "", "")
+
+
+def test_commands_share_one_control_master():
+    session = SSHSession("example.org", "omix", "/keys/id_ed25519", port=2222, control_dir="/tmp/cm")
+
+    ssh = session.ssh_args("mkdir -p /data")
+    assert ssh[0] == "ssh" and ssh[-2:] == ["omix@example.org", "mkdir -p /data"]
+    assert "ControlMaster=no" in ssh and "ControlPath=" + session.control_path in ssh
+    assert session.control_path.startswith("/tmp/cm/")
+    assert "ControlMaster=yes" in session.ssh_args(None, "-N", "-f", master="yes")
+    assert ssh[ssh.index("-p") + 1] == "2222"
+
+    scp = session.scp_args(["reads.fq.gz"], "remote:/data/reads.fq.gz")
+    assert scp[0] == "scp" and "ControlPath=" + session.control_path in scp
+    assert scp[scp.index("-P") + 1] == "2222"
+    assert scp[-2:] == ["reads.fq.gz", "omix@example.org:/data/reads.fq.gz"]
+
+    assert "-p" not in SSHSession("example.org", "omix", "/keys/id", port="").ssh_args("true")
+    with pytest.raises(ValueError):
+        SSHSession.from_server({"host": "example.org"})
+
+
+def test_control_dir_must_be_private(tmp_path):
+    delete_directory(tmp_path)
+    ensure_directory(tmp_path)
+    private = tmp_path / "cm"
+    ensure_private_dir(str(private))
+    ensure_private_dir(str(private))
+
+    shared = tmp_path / "shared"
+    ensure_directory(shared)
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        ensure_private_dir(str(shared))
+
+    link = tmp_path / "link"
+    link.symlink_to(private.resolve())
+    with pytest.raises(PermissionError):
+        ensure_private_dir(str(link))
+    delete_directory(tmp_path)
+
+
+def test_transfer_pool_copies_concurrently_and_reports_progress(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    ensure_directory([src, dst])
+    files = []
+    for i in range(6):
+        write_to_file(str(src / f"s{i}.fq"), "A" * 1024)
+        files.append((str(src / f"s{i}.fq"), str(dst / f"s{i}.fq")))
+
+    session = LocalCopySession()
+    messages = []
+    TransferPool(session, max_transfers=3).upload(files, progress=messages.append)
+
+    assert all((dst / f"s{i}.fq").exists() for i in range(6))
+    assert 1 < session.peak <= 3
+    assert len(messages) == 6
+    assert messages[-1] == "Copied 6/6 data files (6.0 KB of 6.0 KB)"
+
+    with pytest.raises(TransferError, match="permission denied"):
+        TransferPool(LocalCopySession(fail=files[0][0]), 2).upload(files)
+    delete_directory(tmp_path)
+
+
+def test_manager_shares_sessions_and_reconnects(monkeypatch):
+    server = {"name": "hpc", "host": "example.org", "port": "", "username": "omix", "key_path": "/keys/id"}
+    manager = SSHSessionManager(retries=3, backoff=0)
+
+    session = manager.session(server)
+    assert manager.session(dict(server, name="renamed")) is session
+    assert manager.session(dict(server, port=2222)) is not session
+
+    attempts = []
+    monkeypatch.setattr(SSHSession, "is_alive", lambda self: False)
+    monkeypatch.setattr(SSHSession, "connect", lambda self, timeout=30: attempts.append(1) or len(attempts) == 2)
+    assert manager.connection(server) is session
+    assert len(attempts) == 2
+
+    monkeypatch.setattr(SSHSession, "connect", lambda self, timeout=30: False)
+    with pytest.raises(ConnectionError):
+        manager.connection(server)
+
+    monkeypatch.setattr(SSHSession, "close", lambda self: None)
+    manager.close_all()
+    assert manager.session(server) is not session
+
+    # close_all() from another thread right after the session was looked up
+    lookup = manager.session
+    monkeypatch.setattr(manager, "session", lambda server: (lookup(server), manager.close_all())[0])
+    monkeypatch.setattr(SSHSession, "connect", lambda self, timeout=30: True)
+    assert manager.connection(server) is not session
+
+
+class LocalShellSession(SSHSession):
+    """Session whose remote commands run in a local shell."""
+
+    def __init__(self):
+        super().__init__("example.org", "omix", "/keys/id_ed25519")
+        self.uploads = 0
+
+    def connect(self, timeout=30):
+        return True
+
+    def ssh_args(self, command=None, *extra, master="no"):
+        if command is not None and command.startswith("cat "):
+            self.uploads += 1
+        return ["sh", "-c", command]
+
+
+def test_stager_reuses_cached_files_and_resumes_partial_uploads(tmp_path):
+    data, cache, run = tmp_path / "data", tmp_path / "cache", tmp_path / "run"
+    ensure_directory([data, run])
+    write_to_file(str(data / "a.fq"), "ACGT" * 1000)
+    write_to_file(str(data / "b.fq"), "TTGA" * 1000)
+    files = [(str(data / "a.fq"), str(run / "a.fq")), (str(data / "b.fq"), str(run / "b.fq"))]
+
+    hashes = HashCache(tmp_path / "hashes.json")
+    session = LocalShellSession()
+    stager = RemoteStager(session, 2, hash_cache=hashes, staging_dir=str(cache.resolve()))
+
+    # An interrupted earlier upload left half of b.fq behind
+    ensure_directory(cache)
+    digest_b = file_sha256(str(data / "b.fq"))
+    write_to_file(str(cache / f"{digest_b}.part"), "TTGA" * 500)
+
+    assert stager.stage(files) == []
+    assert session.uploads == 2
+    assert (run / "b.fq").is_symlink()
+    assert (run / "b.fq").read_text() == "TTGA" * 1000
+    assert not (cache / f"{digest_b}.part").exists()
+    assert (tmp_path / "hashes.json").exists()
+
+    # A second run sends nothing
+    rerun = tmp_path / "rerun"
+    ensure_directory(rerun)
+    reused = stager.stage([(str(data / "a.fq"), str(rerun / "a.fq"))])
+    assert reused == [str(data / "a.fq")]
+    assert session.uploads == 2
+    assert (rerun / "a.fq").read_text() == "ACGT" * 1000
+
+    # A corrupt partial upload is discarded and sent again in full
+    write_to_file(str(data / "c.fq"), "GGCC" * 1000)
+    write_to_file(str(cache / f"{file_sha256(str(data / 'c.fq'))}.part"), "XXXX" * 500)
+    stager.stage([(str(data / "c.fq"), str(rerun / "c.fq"))])
+    assert (rerun / "c.fq").read_text() == "GGCC" * 1000
+    delete_directory(tmp_path)
+
+
+class StalledUploadSession(LocalShellSession):
+    """Session whose uploads hang until they are terminated."""
+
+    def ssh_args(self, command=None, *extra, master="no"):
+        if command is not None and command.startswith("cat "):
+            return ["sleep", "30"]
+        return super().ssh_args(command, *extra, master=master)
+
+
+def test_stager_cancel_ends_uploads_in_flight(tmp_path):
+    data, cache, run = tmp_path / "data", tmp_path / "cache", tmp_path / "run"
+    ensure_directory([data, run])
+    write_to_file(str(data / "a.fq"), "ACGT" * 1000)
+    stager = RemoteStager(StalledUploadSession(), hash_cache=HashCache(tmp_path / "hashes.json"),
+                          staging_dir=str(cache.resolve()))
+
+    threading.Timer(0.5, stager.cancel).start()
+    started = time.monotonic()
+    with pytest.raises(TransferCancelled):
+        stager.stage([(str(data / "a.fq"), str(run / "a.fq"))])
+    assert time.monotonic() - started < 10
+    assert not (run / "a.fq").exists()
+
+    # A cancelled stager starts nothing more
+    with pytest.raises(TransferCancelled):
+        stager.stage([(str(data / "a.fq"), str(run / "a.fq"))])
+    delete_directory(tmp_path)
+
+
+def test_remote_job_streams_log_until_exit(tmp_path):
+    ensure_directory(tmp_path)
+    workdir = str(tmp_path.resolve())
+    job = RemoteJob(LocalShellSession(), workdir)
+
+    pid = job.start("for i in 1 2 3; do echo line $i; sleep 0.2; done; exit 3")
+    assert (tmp_path / PID_FILE).read_text().strip() == str(pid)
+
+    chunks = []
+    job.follow(chunks.append)
+    assert b"".join(chunks) == b"line 1\nline 2\nline 3\n"
+    assert job.offset == len(b"".join(chunks))
+    assert not job.is_running()
+    assert job.exit_code() == 3
+
+    # Re-attaching at the recorded offset fetches nothing twice
+    resumed = RemoteJob(LocalShellSession(), workdir, pid=pid, offset=job.offset)
+    more = []
+    resumed.follow(more.append)
+    assert more == []
+    delete_directory(tmp_path)
+
+
+class FlakySession(LocalShellSession):
+    """Local shell session whose ssh transport fails while down is set."""
+
+    down = False
+
+    def run(self, command, input=None, text=True, timeout=None):
+        if self.down:
+            return subprocess.CompletedProcess(command, 255, "", "Connection refused")
+        return super().run(command, input=input, text=text, timeout=timeout)
+
+
+def test_remote_job_survives_transport_errors(tmp_path, monkeypatch):
+    ensure_directory(tmp_path)
+    monkeypatch.setattr(remote_job, "_RETRY_DELAY", 0.01)
+    session = FlakySession()
+    job = RemoteJob(session, str(tmp_path.resolve()))
+    job.start("sleep 5")
+
+    # ssh's own exit code is not taken to mean the job ended
+    session.down = True
+    with pytest.raises(JobUnreachable):
+        job.is_running()
+    with pytest.raises(JobUnreachable):
+        job.exit_code()
+
+    # A connection that comes back within the retries is used
+    reconnects = []
+
+    def reconnect():
+        reconnects.append(True)
+        session.down = False
+
+    job._reconnect = reconnect
+    session.down = True
+    assert job.is_running() and reconnects
+    subprocess.run(["kill", str(job.pid)])
+    delete_directory(tmp_path)
+
+
+def test_fetch_results_skips_work_and_verifies_files(tmp_path, monkeypatch):
+    remote, local = tmp_path / "remote", tmp_path / "local"
+    ensure_directory([remote / "results" / "multiqc", remote / "results" / "pipeline_info", remote / "work" / "ab", local])
+    write_to_file(str(remote / "results" / "multiqc" / "report.html"), "<html></html>")
+    write_to_file(str(remote / "results" / "pipeline_info" / "trace.txt"), "trace")
+    write_to_file(str(remote / "work" / "ab" / "reads.bam"), "B" * 4096)
+    # publishDir in symlink mode points into work/
+    (remote / "results" / "reads.bam").symlink_to((remote / "work" / "ab" / "reads.bam").resolve())
+
+    session = LocalShellSession()
+    assert fetch_results(session, str(remote.resolve()), local) == 2
+    assert (local / "results" / "multiqc" / "report.html").read_text() == "<html></html>"
+    assert (local / "results" / "reads.bam").read_text() == "B" * 4096
+    assert not (local / "results" / "reads.bam").is_symlink()
+    assert not (local / "results" / "pipeline_info").exists()
+    assert not (local / "work").exists()
+
+    assert fetch_results(session, str(remote.resolve()), local, exclude=()) == 3
+    assert (local / "results" / "pipeline_info" / "trace.txt").exists()
+
+    # A file that changed in transit fails the fetch
+    monkeypatch.setattr(retrieve, "_remote_manifest", lambda *args: {"results/multiqc/report.html": "0" * 64})
+    with pytest.raises(RetrievalError, match="Checksum mismatch"):
+        fetch_results(session, str(remote.resolve()), local)
+    delete_directory(tmp_path)
+
+
+class FakeRemoteWorker(QObject):
+    """Worker that reports a PID on start and finishes when told to."""
+
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(bool, str)
+    error = pyqtSignal(str)
+    unreachable = pyqtSignal(str)
+    job_started = pyqtSignal(int)
+    log_offset = pyqtSignal(int)
+
+    workers = {}
+
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+        FakeRemoteWorker.workers[job["run_name"]] = self
+
+    def run(self):
+        if not self.job.get("pid"):
+            self.job_started.emit(4242)
+        self.log_offset.emit(128)
+
+    def stop(self):
+        pass
+
+
+def test_scheduler_limits_runs_per_server_and_resumes(qtbot, tmp_path, monkeypatch):
+    delete_directory(tmp_path)
+    ensure_directory(tmp_path)
+    index = RunIndex(str(tmp_path / "runs.jsonl"))
+    monkeypatch.setattr(RunIndex, "get_index", staticmethod(lambda: index))
+    jobs_path = tmp_path / "remote_jobs.json"
+    FakeRemoteWorker.workers.clear()
+
+    scheduler = RemoteJobScheduler(FakeRemoteWorker, jobs_path)
+    server = {"host": "example.org", "username": "omix", "key_path": "/keys/id", "max_runs": 1}
+    job = {"ssh_server": server, "pipelines_runs_dir": str(tmp_path)}
+    assert scheduler.submit({**job, "run_name": "first"})
+    assert not scheduler.submit({**job, "run_name": "second"})
+    assert scheduler.queued() == ["second"] and RunIndex.get_index().get("second")["state"] == RUN_QUEUED
+
+    # The first run is persisted as running with its PID, then its end frees the slot
+    qtbot.waitUntil(lambda: json_read(str(jobs_path))["first"].get("pid") == 4242, timeout=3000)
+    finished = []
+    scheduler.finished.connect(lambda name, ok, message: finished.append(name))
+    FakeRemoteWorker.workers["first"].finished.emit(True, "done")
+    qtbot.waitUntil(lambda: finished == ["first"], timeout=3000)
+    assert scheduler.active() == ["second"] and "first" not in json_read(str(jobs_path))
+    qtbot.waitUntil(lambda: json_read(str(jobs_path))["second"]["state"] == JOB_RUNNING, timeout=3000)
+    scheduler.shutdown()
+
+    # A new session re-attaches to the running job instead of submitting it again
+    FakeRemoteWorker.workers.clear()
+    restarted = RemoteJobScheduler(FakeRemoteWorker, jobs_path)
+    restarted.resume()
+    assert restarted.active() == ["second"]
+    worker = FakeRemoteWorker.workers["second"]
+    assert worker.job["pid"] == 4242 and worker.job["offset"] == 128
+    worker.finished.emit(True, "done")
+    qtbot.waitUntil(lambda: not restarted.active(), timeout=3000)
+    assert restarted.jobs() == {}
+    delete_directory(tmp_path)
+
+
+def test_scheduler_keeps_unreachable_runs_and_reattaches(qtbot, tmp_path, monkeypatch):
+    delete_directory(tmp_path)
+    ensure_directory(tmp_path)
+    index = RunIndex(str(tmp_path / "runs.jsonl"))
+    monkeypatch.setattr(RunIndex, "get_index", staticmethod(lambda: index))
+    jobs_path = tmp_path / "remote_jobs.json"
+    FakeRemoteWorker.workers.clear()
+
+    scheduler = RemoteJobScheduler(FakeRemoteWorker, jobs_path, reattach_delay_ms=200)
+    server = {"host": "example.org", "username": "omix", "key_path": "/keys/id", "max_runs": 1}
+    job = {"ssh_server": server, "pipelines_runs_dir": str(tmp_path)}
+    scheduler.submit({**job, "run_name": "first"})
+    scheduler.submit({**job, "run_name": "second"})
+    qtbot.waitUntil(lambda: scheduler.jobs()["first"].get("pid") == 4242, timeout=3000)
+
+    # The record and the server slot are kept while the server is unreachable
+    worker = FakeRemoteWorker.workers.pop("first")
+    worker.unreachable.emit("Connection refused")
+    qtbot.waitUntil(lambda: not scheduler.active(), timeout=3000)
+    assert json_read(str(jobs_path))["first"]["state"] == JOB_RUNNING
+    assert scheduler.queued() == ["second"]
+
+    # Later the run is re-attached with its PID
+    qtbot.waitUntil(lambda: "first" in FakeRemoteWorker.workers, timeout=3000)
+    assert scheduler.active() == ["first"] and FakeRemoteWorker.workers["first"].job["pid"] == 4242
+    scheduler.shutdown()
+    delete_directory(tmp_path)
+
+
+class StagingRemoteWorker(FakeRemoteWorker):
+    """Worker that is still staging when stopped, and cancels only once released."""
+
+    release = threading.Event()
+
+    def __init__(self, job):
+        super().__init__(job)
+        self.stopped = threading.Event()
+        self.cancelled = False
+
+    def run(self):
+        if not self.job.get("pid"):
+            self.stopped.wait(10)
+            StagingRemoteWorker.release.wait(10)
+            self.cancelled = True
+
+    def stop(self):
+        self.stopped.set()
+
+
+def test_scheduler_shutdown_is_bounded_and_resubmits_staging_runs(qtbot, tmp_path, monkeypatch):
+    delete_directory(tmp_path)
+    ensure_directory(tmp_path)
+    index = RunIndex(str(tmp_path / "runs.jsonl"))
+    monkeypatch.setattr(RunIndex, "get_index", staticmethod(lambda: index))
+    jobs_path = tmp_path / "remote_jobs.json"
+    FakeRemoteWorker.workers.clear()
+    StagingRemoteWorker.release.clear()
+
+    # Closing the app without a remote run creates no scheduler
+    monkeypatch.setattr(RemoteJobScheduler, "_scheduler", None)
+    RemoteJobScheduler.shutdown_scheduler()
+    assert RemoteJobScheduler._scheduler is None
+
+    scheduler = RemoteJobScheduler(StagingRemoteWorker, jobs_path)
+    server = {"host": "example.org", "username": "omix", "key_path": "/keys/id"}
+    scheduler.submit({"ssh_server": server, "pipelines_runs_dir": str(tmp_path), "run_name": "first"})
+    worker = FakeRemoteWorker.workers["first"]
+
+    # Shutdown returns after its timeout; the slow worker finishes on its own
+    scheduler.shutdown(timeout_ms=50)
+    assert worker.stopped.is_set() and not worker.cancelled
+    assert json_read(str(jobs_path))["first"]["state"] == JOB_SUBMITTING
+    StagingRemoteWorker.release.set()
+    qtbot.waitUntil(lambda: worker.cancelled, timeout=3000)
+    assert json_read(str(jobs_path))["first"]["state"] == JOB_SUBMITTING
+
+    FakeRemoteWorker.workers.clear()
+    restarted = RemoteJobScheduler(FakeRemoteWorker, jobs_path)
+    restarted.resume()
+    assert restarted.active() == ["first"] and "pid" not in FakeRemoteWorker.workers["first"].job
+    qtbot.waitUntil(lambda: restarted.jobs()["first"].get("pid") == 4242, timeout=3000)
+    restarted.shutdown()
+    delete_directory(tmp_path)
+
+
+def test_samplesheet_update_script_rewrites_fastq_paths(tmp_path):
+    delete_directory(tmp_path)
+    ensure_directory(tmp_path)
+    sheet = tmp_path / "samplesheet.csv"
+    write_to_file(sheet, "sample,fastq_1,fastq_2\nS1,/data/a.fq.gz,/data/b.fq.gz\n")
+
+    script = samplesheet_update_script(str(sheet), str(tmp_path),
+                                       [("/data/a.fq.gz", "/remote/a.fq.gz"), ("/data/b.fq.gz", "/remote/b.fq.gz")])
+    compile(script, "update_samplesheet.py", "exec")
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert sheet.read_text().splitlines()[1] == "S1,/remote/a.fq.gz,/remote/b.fq.gz"
+    delete_directory(tmp_path)
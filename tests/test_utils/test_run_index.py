@@ -0,0 +1,69 @@
+from src.utils.fileops.file_handle import ensure_directory, delete_directory, write_to_file, read_from_file
+from src.utils.run_index import *
+
+
+def test_record_and_reload(tmp_path):
+    ensure_directory(tmp_path)
+    index_path = tmp_path / "run_index.jsonl"
+
+    index = RunIndex(index_path)
+    index.record("a_run.txt", RUN_RUNNING)
+    index.record_exit("a_run.txt", 0)
+    index.record_exit("b_run.txt", 2)
+    index.record("c_run.txt", RUN_CANCELLED)
+
+    reloaded = RunIndex(index_path)
+    assert reloaded.state("a_run.txt") == RUN_COMPLETED
+    assert reloaded.get("a_run.txt")["exit_code"] == 0
+    assert reloaded.state("b_run.txt") == RUN_FAILED
+    assert reloaded.state("c_run.txt") == RUN_CANCELLED
+    assert reloaded.state("missing.txt") is None
+    delete_directory(tmp_path)
+
+
+def test_forget(tmp_path):
+    ensure_directory(tmp_path)
+    index_path = tmp_path / "run_index.jsonl"
+
+    index = RunIndex(index_path)
+    index.record("a_run.txt", RUN_RUNNING)
+    index.forget("a_run.txt")
+    assert index.state("a_run.txt") is None
+    assert RunIndex(index_path).runs() == {}
+    delete_directory(tmp_path)
+
+
+def test_backfill_runs_once(tmp_path):
+    ensure_directory(tmp_path)
+    runs_dir = tmp_path / "runs"
+    ensure_directory(runs_dir)
+    write_to_file(str(runs_dir / "ok_run.txt"), "Pipeline run completed <<exit-code:0>>.\n")
+    write_to_file(str(runs_dir / "bad_run.txt"), "Pipeline run completed <<exit-code:1>>.\n")
+    write_to_file(str(runs_dir / "live_run.txt"), "Running pipeline\n")
+
+    index_path = tmp_path / "run_index.jsonl"
+    index = RunIndex(index_path)
+    assert index.backfill(str(runs_dir)) == 3
+    assert index.state("ok_run.txt") == RUN_COMPLETED
+    assert index.state("bad_run.txt") == RUN_FAILED
+    assert index.state("live_run.txt") == RUN_RUNNING
+
+    write_to_file(str(runs_dir / "new_run.txt"), "Running pipeline\n")
+    assert RunIndex(index_path).backfill(str(runs_dir)) == 0
+    delete_directory(tmp_path)
+
+
+def test_corrupt_line_is_skipped_and_journal_compacted(tmp_path):
+    ensure_directory(tmp_path)
+    index_path = tmp_path / "run_index.jsonl"
+
+    index = RunIndex(index_path)
+    for _ in range(100):
+        index.record("a_run.txt", RUN_RUNNING)
+    with open(index_path, "a") as f:
+        f.write('{"run": "torn')
+
+    reloaded = RunIndex(index_path)
+    assert reloaded.state("a_run.txt") == RUN_RUNNING
+    assert len(read_from_file(str(index_path)).splitlines()) == 1
+    delete_directory(tmp_path)
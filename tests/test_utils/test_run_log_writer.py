@@ -0,0 +1,81 @@
+import logging
+
+from src.utils.fileops.file_handle import ensure_directory, delete_directory, read_from_file
+from src.utils.fileops.run_log_writer import *
+
+
+def test_write_is_buffered_until_close(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+
+    writer = RunLogWriter(str(log), flush_bytes=1024, flush_interval=60)
+    writer.write("line 1\n")
+    writer.write("line 2\n")
+    assert read_from_file(str(log)) == ""
+
+    writer.close()
+    assert writer.closed
+    assert read_from_file(str(log)) == "line 1\nline 2\n"
+    delete_directory(tmp_path)
+
+
+def test_write_flushes_on_size_threshold(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+
+    writer = RunLogWriter(str(log), flush_bytes=10, flush_interval=60)
+    writer.write("0123456789\n")
+    assert read_from_file(str(log)) == "0123456789\n"
+    writer.close()
+    delete_directory(tmp_path)
+
+
+def test_flush_if_due(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+
+    writer = RunLogWriter(str(log), flush_bytes=1024, flush_interval=60)
+    writer.write("a\n")
+    writer.flush_if_due()
+    assert read_from_file(str(log)) == ""
+
+    writer.flush_interval = 0
+    writer.flush_if_due()
+    assert read_from_file(str(log)) == "a\n"
+    writer.close()
+    delete_directory(tmp_path)
+
+
+def test_write_after_close_is_ignored(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+
+    writer = RunLogWriter(str(log))
+    writer.close()
+    writer.write("late\n")
+    writer.close()
+    assert read_from_file(str(log)) == ""
+    delete_directory(tmp_path)
+
+
+def test_global_log_sampling(tmp_path):
+    ensure_directory(tmp_path)
+    log = tmp_path / "run.txt"
+
+    handler_records = []
+    handler = logging.Handler()
+    handler.emit = handler_records.append
+    run_logger.addHandler(handler)
+    try:
+        writer = RunLogWriter(str(log), flush_bytes=1024, flush_interval=60, log_every=2)
+        writer.write("l0\nl1\nl2\nl3\n")
+        writer.write("err\n", logging.ERROR)
+        writer.close()
+    finally:
+        run_logger.removeHandler(handler)
+
+    messages = {r.levelno: r.getMessage() for r in handler_records}
+    assert messages[logging.INFO] == "l0\nl2"
+    assert messages[logging.ERROR] == "err"
+    assert read_from_file(str(log)) == "l0\nl1\nl2\nl3\nerr\n"
+    delete_directory(tmp_path)
@@ -0,0 +1,22 @@
+from PyQt6.QtWidgets import QWidget
+
+from src.utils.startup_timer import StartupTimer
+
+
+def test_first_paint_and_interactive_are_marked_once(qtbot):
+    timer = StartupTimer()
+    seen = []
+    timer.on_mark(lambda name, seconds: seen.append(name))
+
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    timer.mark_on_paint(widget, "first_paint", then="interactive")
+    widget.show()
+    qtbot.waitUntil(lambda: "interactive" in timer.marks, timeout=3000)
+
+    widget.update()
+    qtbot.wait(50)
+    timer.mark("first_paint")
+    assert seen == ["first_paint", "interactive"]
+    report = timer.report()
+    assert 0 <= report["first_paint"] <= report["interactive"]
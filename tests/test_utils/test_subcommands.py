@@ -36,3 +36,35 @@ def test_run_shell_command_stream_error():
 
 
 
+
+
+def test_command_runner_streams_and_finishes(qtbot):
+    from src.utils.subcommands.runner import CommandRunner
+
+    runner = CommandRunner(max_commands=2)
+    lines, results = [], []
+    runner.submit(["sh", "-c", "echo one; echo two"], on_finished=results.append, on_output=lines.append)
+    qtbot.waitUntil(lambda: len(results) == 1, timeout=5000)
+
+    assert lines == ["one", "two"]
+    assert results[0].returncode == 0 and results[0].stdout == "one\ntwo\n"
+
+
+def test_command_runner_reports_failures_timeouts_and_cancels(qtbot):
+    import time
+    from src.utils.subcommands.runner import CommandRunner
+
+    runner = CommandRunner(max_commands=2)
+    errors, results = [], []
+    runner.submit("sh -c 'echo broken >&2; exit 3'", on_finished=results.append, on_error=errors.append)
+    runner.submit(["sleep", "30"], on_finished=results.append, on_error=errors.append, timeout=0.2)
+    qtbot.waitUntil(lambda: len(errors) == 2, timeout=5000)
+    assert "broken" in errors and any("timed out" in e for e in errors)
+
+    started = time.monotonic()
+    task = runner.submit(["sh", "-c", "sleep 30"], on_finished=results.append, on_error=errors.append)
+    qtbot.wait(200)
+    task.cancel()
+    assert runner.wait(5000) and time.monotonic() - started < 5
+    qtbot.wait(50)
+    assert results == [] and len(errors) == 2
@@ -0,0 +1,84 @@
+import os
+import time
+
+from src.utils.fileops.file_handle import delete_directory, ensure_directory, write_to_file
+from src.utils.work_cache import WorkDirCache, run_fingerprint
+
+
+def test_reruns_share_a_leased_work_dir_and_resume(tmp_path):
+    delete_directory(tmp_path)
+    ensure_directory(tmp_path)
+    sheet = str(tmp_path / "samplesheet.csv")
+    write_to_file(sheet, "sample,fastq_1\nS1,/data/S1.fq.gz\n")
+    cache = WorkDirCache(tmp_path / "work_cache", tmp_path / "work_cache.json")
+
+    lease = cache.acquire("nf-core/rnaseq", sheet)
+    assert not lease.resume and os.path.isdir(lease.work_dir)
+    # A concurrent run of the same inputs must not share the cache database
+    assert cache.acquire("nf-core/rnaseq", sheet) is None
+    assert run_fingerprint("nf-core/sarek", sheet) != lease.fingerprint
+
+    write_to_file(os.path.join(lease.cache_dir, "history"), "2026-01-01\tsession\n")
+    cache.release(lease)
+    rerun = cache.acquire("nf-core/rnaseq", sheet)
+    assert rerun.fingerprint == lease.fingerprint and rerun.resume
+    # Releasing the ended lease again leaves the re-run's lease in place
+    cache.release(lease)
+    assert cache.acquire("nf-core/rnaseq", sheet) is None
+    cache.release(rerun)
+    delete_directory(tmp_path)
+
+
+def test_least_recently_used_work_dirs_are_evicted(tmp_path):
+    delete_directory(tmp_path)
+    ensure_directory(tmp_path)
+    cache = WorkDirCache(tmp_path / "work_cache", tmp_path / "work_cache.json", max_gb=1500 / 1024 ** 3)
+
+    leases = []
+    for name in ("old", "new"):
+        sheet = str(tmp_path / f"{name}.csv")
+        write_to_file(sheet, name)
+        lease = cache.acquire("nf-core/rnaseq", sheet)
+        write_to_file(os.path.join(lease.work_dir, "task.out"), "x" * 1000)
+        leases.append(lease)
+
+    cache.release(leases[0])
+    time.sleep(0.01)
+    cache.release(leases[1])
+
+    assert not os.path.exists(os.path.dirname(leases[0].work_dir))
+    assert os.path.isdir(leases[1].work_dir)
+    assert cache.total_size() <= cache.max_bytes
+    # The index survives a restart
+    assert WorkDirCache(tmp_path / "work_cache", tmp_path / "work_cache.json").total_size() == 1000
+    delete_directory(tmp_path)
+
+
+def test_reacquired_work_dir_survives_its_eviction(tmp_path, monkeypatch):
+    from src.utils import work_cache
+    delete_directory(tmp_path)
+    ensure_directory(tmp_path)
+    cache = WorkDirCache(tmp_path / "work_cache", tmp_path / "work_cache.json", max_gb=500 / 1024 ** 3)
+    sheet = str(tmp_path / "sheet.csv")
+    write_to_file(sheet, "sheet")
+    lease = cache.acquire("nf-core/rnaseq", sheet)
+    write_to_file(os.path.join(lease.work_dir, "task.out"), "x" * 1000)
+
+    # A run leases the fingerprint while its old directory is being deleted
+    reacquired = []
+
+    def delete_while_acquired(path):
+        if not reacquired:
+            reacquired.append(cache.acquire("nf-core/rnaseq", sheet))
+        delete_directory(path)
+
+    monkeypatch.setattr(work_cache, "delete_directory", delete_while_acquired)
+    cache.release(lease)
+    assert reacquired[0] is not None and os.path.isdir(reacquired[0].work_dir)
+    assert not reacquired[0].resume
+
+    # A tombstone left by an interrupted eviction is removed on the next start
+    ensure_directory(tmp_path / "work_cache" / ".evicted-0123-1")
+    WorkDirCache(tmp_path / "work_cache", tmp_path / "work_cache.json")
+    assert sorted(os.listdir(tmp_path / "work_cache")) == [reacquired[0].fingerprint]
+    delete_directory(tmp_path)